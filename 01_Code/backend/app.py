@@ -1,23 +1,47 @@
-import json
 import random
 from datetime import date, datetime, timedelta, timezone
 from urllib.parse import urlparse
 
-from flask import Flask, abort, flash, redirect, render_template, request, session, url_for
+from flask import Flask, abort, flash, jsonify, redirect, render_template, request, session, url_for
 from sqlalchemy import event, text
 from sqlalchemy.engine import Engine
 
+from attachment_store import UploadRequest, migrate_attachment_keys, register_attachment_store_events
+from checklist_store import migrate_legacy_checklists
 from config import Config
-from models import Checklist, CourseConfig, Feedback, KnowledgeNotification, SemesterMismatchRequest, WebsiteFeedback, db
-from models import ExperienceReport, PendingFacultyFeedback, StudentExperience
+from intervention_targets import backfill_post_targets, configure_cohort_index, register_cohort_index_events
+from knowledge_store import (
+    POST_COUNTER_COLUMNS,
+    backfill_post_tags,
+    configure_tag_count_cache,
+    ensure_post_search_index,
+    migrate_legacy_notifications,
+    reconcile_post_counters,
+    register_tag_count_events,
+)
+from models import CourseConfig, WebsiteFeedback, db
+from notification_counters import (
+    configure_notification_counters,
+    notification_badge_counts,
+    register_notification_counter_events,
+)
 from routes.admin import admin_bp
+from routes.attachments import attachments_bp
 from routes.auth import auth_bp
 from routes.faculty import faculty_bp
 from routes.student import student_bp
+from sentiment import (
+    configure_sentiment_cache,
+    configure_sentiment_engine,
+    sentiment_engine_name,
+    sentiment_engine_ready,
+    start_sentiment_warmup,
+)
+from storage_backends import configure_attachment_storage
+from view_tracker import configure_view_tracker, view_tracker_stats
 
 
 IST_ZONE = timezone(timedelta(hours=5, minutes=30))
-CHECKLIST_META_PREFIX = "[[CLARIFAI_META]]"
 
 
 @event.listens_for(Engine, "connect")
@@ -99,22 +123,6 @@ def _utc_to_ist(value):
     return source.astimezone(IST_ZONE)
 
 
-def _extract_checklist_group_id(raw_description: str, fallback_id: int) -> str:
-    text = (raw_description or "").strip()
-    if not text.startswith(CHECKLIST_META_PREFIX):
-        return f"legacy-{fallback_id}"
-
-    first_line, _, _ = text.partition("\n")
-    meta_raw = first_line[len(CHECKLIST_META_PREFIX) :].strip()
-    try:
-        meta = json.loads(meta_raw)
-    except (TypeError, json.JSONDecodeError):
-        return f"legacy-{fallback_id}"
-
-    group_id = str(meta.get("group_id") or "").strip()
-    return group_id or f"legacy-{fallback_id}"
-
-
 def _seed_course_configs() -> None:
     seed_rows = [
         {"course_code": "MCA", "duration_years": 2, "total_semesters": 4, "semesters_per_year": 2},
@@ -268,6 +276,30 @@ def _ensure_schema_updates() -> None:
         row[1]
         for row in db.session.execute(text("PRAGMA table_info('website_feedback')")).fetchall()
     }
+    pending_feedback_columns = {
+        row[1]
+        for row in db.session.execute(text("PRAGMA table_info('pending_faculty_feedback')")).fetchall()
+    }
+    experience_columns = {
+        row[1]
+        for row in db.session.execute(text("PRAGMA table_info('student_experiences')")).fetchall()
+    }
+    checklist_columns = {
+        row[1]
+        for row in db.session.execute(text("PRAGMA table_info('checklists')")).fetchall()
+    }
+    checklist_indexes = {
+        row[1]
+        for row in db.session.execute(text("PRAGMA index_list('checklists')")).fetchall()
+    }
+    knowledge_attachment_columns = {
+        row[1]
+        for row in db.session.execute(text("PRAGMA table_info('knowledge_attachments')")).fetchall()
+    }
+    stored_blob_columns = {
+        row[1]
+        for row in db.session.execute(text("PRAGMA table_info('stored_blobs')")).fetchall()
+    }
 
     alter_statements = []
     if "phone" not in user_columns:
@@ -282,6 +314,14 @@ def _ensure_schema_updates() -> None:
         alter_statements.append(
             "ALTER TABLE users ADD COLUMN last_login_at DATETIME"
         )
+    if "knowledge_updates_seen_at" not in user_columns:
+        alter_statements.append(
+            "ALTER TABLE users ADD COLUMN knowledge_updates_seen_at DATETIME"
+        )
+    if "knowledge_updates_seen_revision_id" not in user_columns:
+        alter_statements.append(
+            "ALTER TABLE users ADD COLUMN knowledge_updates_seen_revision_id INTEGER"
+        )
     if "first_login_at" not in user_columns:
         alter_statements.append(
             "ALTER TABLE users ADD COLUMN first_login_at DATETIME"
@@ -311,6 +351,14 @@ def _ensure_schema_updates() -> None:
         alter_statements.append(
             "ALTER TABLE feedback ADD COLUMN class_session_at DATETIME"
         )
+    if "sentiment_confidence" not in feedback_columns:
+        alter_statements.append(
+            "ALTER TABLE feedback ADD COLUMN sentiment_confidence INTEGER NOT NULL DEFAULT 0"
+        )
+    if "sentiment_version" not in feedback_columns:
+        alter_statements.append(
+            "ALTER TABLE feedback ADD COLUMN sentiment_version INTEGER NOT NULL DEFAULT 0"
+        )
 
     if "problem_context" not in knowledge_post_columns:
         alter_statements.append(
@@ -360,6 +408,29 @@ def _ensure_schema_updates() -> None:
         alter_statements.append(
             "ALTER TABLE knowledge_posts ADD COLUMN revision_count INTEGER NOT NULL DEFAULT 0"
         )
+    post_counters_added = False
+    for counter_column in POST_COUNTER_COLUMNS:
+        if counter_column not in knowledge_post_columns:
+            alter_statements.append(
+                f"ALTER TABLE knowledge_posts ADD COLUMN {counter_column} INTEGER NOT NULL DEFAULT 0"
+            )
+            post_counters_added = True
+
+    if "blob_id" not in knowledge_attachment_columns:
+        alter_statements.append(
+            "ALTER TABLE knowledge_attachments ADD COLUMN blob_id INTEGER REFERENCES stored_blobs(id)"
+        )
+    # Keys were paths under static/ until these columns were renamed; the
+    # rows (and old checklist JSON) are rewritten once, right after.
+    attachment_keys_renamed = "file_path" in knowledge_attachment_columns or "path" in stored_blob_columns
+    if "file_path" in knowledge_attachment_columns:
+        alter_statements.append(
+            "ALTER TABLE knowledge_attachments RENAME COLUMN file_path TO storage_key"
+        )
+    if "path" in stored_blob_columns:
+        alter_statements.append(
+            "ALTER TABLE stored_blobs RENAME COLUMN path TO storage_key"
+        )
 
     if "is_read" not in website_feedback_columns:
         alter_statements.append(
@@ -370,12 +441,78 @@ def _ensure_schema_updates() -> None:
             "ALTER TABLE website_feedback ADD COLUMN read_at DATETIME"
         )
 
+    if "sentiment_version" not in pending_feedback_columns:
+        alter_statements.append(
+            "ALTER TABLE pending_faculty_feedback ADD COLUMN sentiment_version INTEGER NOT NULL DEFAULT 0"
+        )
+    if "sentiment_version" not in experience_columns:
+        alter_statements.append(
+            "ALTER TABLE student_experiences ADD COLUMN sentiment_version INTEGER NOT NULL DEFAULT 0"
+        )
+
+    if "group_id" not in checklist_columns:
+        alter_statements.append(
+            "ALTER TABLE checklists ADD COLUMN group_id INTEGER REFERENCES checklist_groups(id)"
+        )
+    if "completed_mask" not in checklist_columns:
+        alter_statements.append(
+            "ALTER TABLE checklists ADD COLUMN completed_mask INTEGER NOT NULL DEFAULT 0"
+        )
+    if "completion_locked" not in checklist_columns:
+        alter_statements.append(
+            "ALTER TABLE checklists ADD COLUMN completion_locked BOOLEAN NOT NULL DEFAULT 0"
+        )
+    if "version" not in checklist_columns:
+        alter_statements.append(
+            "ALTER TABLE checklists ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+        )
+
     for statement in alter_statements:
         db.session.execute(text(statement))
 
     if alter_statements:
         db.session.commit()
 
+    if "ix_checklists_group_progress" not in checklist_indexes:
+        # The progress index leads with group_id, so it replaces the plain
+        # group_id index older schemas created.
+        db.session.execute(text("DROP INDEX IF EXISTS ix_checklists_group_id"))
+        db.session.execute(
+            text(
+                "CREATE INDEX ix_checklists_group_progress "
+                "ON checklists (group_id, is_completed, completed_mask, completion_locked)"
+            )
+        )
+    db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_checklists_student_id ON checklists (student_id)"))
+    db.session.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_knowledge_posts_author_id ON knowledge_posts (author_id)")
+    )
+    db.session.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_knowledge_attachments_blob_id ON knowledge_attachments (blob_id)")
+    )
+    db.session.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_knowledge_posts_status_created "
+            "ON knowledge_posts (status, created_at, id)"
+        )
+    )
+    db.session.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_knowledge_posts_status_rank "
+            "ON knowledge_posts (status, (like_count * 2 + bookmark_count), created_at, id)"
+        )
+    )
+    db.session.commit()
+    if post_counters_added:
+        reconcile_post_counters()
+    migrated_checklists = migrate_legacy_checklists()
+    if attachment_keys_renamed or migrated_checklists:
+        migrate_attachment_keys()
+    backfill_post_targets()
+    backfill_post_tags()
+    ensure_post_search_index()
+    migrate_legacy_notifications()
+
     refreshed_user_columns = {
         row[1]
         for row in db.session.execute(text("PRAGMA table_info('users')")).fetchall()
@@ -393,13 +530,34 @@ def _ensure_schema_updates() -> None:
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.request_class = UploadRequest
     app.config.from_object(Config)
 
     db.init_app(app)
+    configure_attachment_storage(app.config)
+    register_attachment_store_events()
+    register_notification_counter_events()
+    configure_notification_counters(app.config.get("NOTIFICATION_BADGE_CACHE_TTL_SECONDS", 30))
+    register_tag_count_events()
+    configure_tag_count_cache(app.config.get("KNOWLEDGE_TAG_COUNT_CACHE_TTL_SECONDS", 60))
+    register_cohort_index_events()
+    configure_cohort_index(app.config.get("COHORT_COUNT_CACHE_TTL_SECONDS", 300))
+    configure_sentiment_engine(app.config.get("SENTIMENT_ENGINE", "textblob"))
+    configure_sentiment_cache(
+        app.config.get("SENTIMENT_CACHE_MAX_ENTRIES", 2048),
+        app.config.get("SENTIMENT_CACHE_TTL_SECONDS", 900),
+    )
+    configure_view_tracker(
+        app,
+        enabled=app.config.get("KNOWLEDGE_VIEW_BUFFER_ENABLED", True),
+        flush_seconds=app.config.get("KNOWLEDGE_VIEW_FLUSH_SECONDS", 2.0),
+        max_pending=app.config.get("KNOWLEDGE_VIEW_BUFFER_MAX_PENDING", 10000),
+    )
     app.register_blueprint(auth_bp)
     app.register_blueprint(student_bp)
     app.register_blueprint(faculty_bp)
     app.register_blueprint(admin_bp)
+    app.register_blueprint(attachments_bp)
 
     _validate_security_config(app)
 
@@ -412,63 +570,25 @@ def create_app() -> Flask:
 
     @app.context_processor
     def _inject_admin_notification_count():
-        unread_suggestions_count = 0
-        pending_semester_exceptions_count = 0
-        role_notification_badge_count = 0
-        pending_experience_moderation_count = 0
-        open_experience_reports_count = 0
-        pending_faculty_feedback_count = 0
-
         user_id = session.get("user_id")
-        role = session.get("role")
-        if user_id and role == "admin":
-            unread_suggestions_count = WebsiteFeedback.query.filter_by(is_read=False).count()
-            pending_semester_exceptions_count = SemesterMismatchRequest.query.filter_by(status="pending").count()
-            moderation_queue_count = Feedback.query.filter_by(status="under_review").count()
-            pending_experience_moderation_count = StudentExperience.query.filter_by(status="pending").count()
-            open_experience_reports_count = ExperienceReport.query.filter_by(status="open").count()
-            pending_faculty_feedback_count = PendingFacultyFeedback.query.filter(
-                PendingFacultyFeedback.status.in_(["holding", "under_review"])
-            ).count()
-            role_notification_badge_count = (
-                unread_suggestions_count
-                + pending_semester_exceptions_count
-                + moderation_queue_count
-                + pending_experience_moderation_count
-                + open_experience_reports_count
-                + pending_faculty_feedback_count
-            )
-        elif user_id and role == "student":
-            feedback_updates_count = Feedback.query.filter(
-                Feedback.student_id == user_id,
-                Feedback.status.in_(["approved", "request_edit", "rejected"]),
-            ).count()
-            pending_checklist_count = Checklist.query.filter_by(student_id=user_id, is_completed=False).count()
-            intervention_updates_count = KnowledgeNotification.query.filter_by(user_id=user_id, is_read=False).count()
-            role_notification_badge_count = feedback_updates_count + pending_checklist_count + intervention_updates_count
-        elif user_id and role == "faculty":
-            approved_feedback_count = Feedback.query.filter_by(faculty_id=user_id, status="approved").count()
-            checklist_rows = Checklist.query.filter_by(faculty_id=user_id).all()
-            grouped_completion = {}
-            for row in checklist_rows:
-                group_id = _extract_checklist_group_id(row.description, row.id)
-                if group_id not in grouped_completion:
-                    grouped_completion[group_id] = True
-                if not row.is_completed:
-                    grouped_completion[group_id] = False
-
-            active_checklists_count = len([done for done in grouped_completion.values() if not done])
-            role_notification_badge_count = approved_feedback_count + active_checklists_count
-
+        counts = notification_badge_counts(session.get("role"), user_id) if user_id else {}
         return {
-            "unread_suggestions_count": unread_suggestions_count,
-            "pending_semester_exceptions_count": pending_semester_exceptions_count,
-            "role_notification_badge_count": role_notification_badge_count,
-            "pending_experience_moderation_count": pending_experience_moderation_count,
-            "open_experience_reports_count": open_experience_reports_count,
-            "pending_faculty_feedback_count": pending_faculty_feedback_count,
+            "unread_suggestions_count": counts.get("unread_suggestions_count", 0),
+            "pending_semester_exceptions_count": counts.get("pending_semester_exceptions_count", 0),
+            "role_notification_badge_count": counts.get("role_notification_badge_count", 0),
+            "pending_experience_moderation_count": counts.get("pending_experience_moderation_count", 0),
+            "open_experience_reports_count": counts.get("open_experience_reports_count", 0),
+            "pending_faculty_feedback_count": counts.get("pending_faculty_feedback_count", 0),
         }
 
+    @app.before_request
+    def _hide_stored_uploads():
+        # The local attachment storage root defaults to static/uploads; its
+        # files are served by the attachments blueprint, which checks access.
+        if request.path.startswith("/static/uploads/"):
+            abort(404)
+        return None
+
     @app.before_request
     def _protect_authenticated_posts():
         if app.testing:
@@ -495,7 +615,7 @@ def create_app() -> Flask:
 
     @app.after_request
     def _apply_cache_control_headers(response):
-        if request.path.startswith("/static/"):
+        if request.path.startswith(("/static/", "/attachments/")):
             return response
 
         response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0, private"
@@ -535,6 +655,17 @@ def create_app() -> Flask:
 
         return render_template("home.html", dashboard_url=dashboard_url, user_role=role)
 
+    @app.route("/health")
+    def health():
+        return jsonify(
+            {
+                "status": "ok",
+                "sentiment_engine": sentiment_engine_name(),
+                "sentiment_ready": sentiment_engine_ready(),
+                "knowledge_views": view_tracker_stats(),
+            }
+        )
+
     @app.errorhandler(404)
     def page_not_found(error):
         return render_template("error_404.html"), 404
@@ -544,6 +675,21 @@ def create_app() -> Flask:
         db.session.rollback()
         return render_template("error_500.html"), 500
 
+    @app.errorhandler(413)
+    def request_too_large(error):
+        # Werkzeug stops reading the body at MAX_CONTENT_LENGTH, and
+        # UploadRequest at the first file past MAX_UPLOAD_FILE_BYTES, before
+        # any upload reaches the attachment store.
+        flash(
+            f"Upload is too large. Files are limited to {app.config['MAX_UPLOAD_FILE_BYTES'] // (1024 * 1024)}MB "
+            f"and requests to {app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)}MB.",
+            "danger",
+        )
+        referrer = request.referrer or ""
+        if referrer and _is_same_origin(referrer, request.host_url):
+            return redirect(referrer)
+        return redirect(url_for("home"))
+
     @app.errorhandler(403)
     def forbidden(error):
         return render_template("error_403.html"), 403
@@ -555,6 +701,9 @@ def create_app() -> Flask:
         _ensure_user_delete_guard(app)
         _bootstrap_admin(app)
 
+    if app.config.get("SENTIMENT_WARMUP_ENABLED"):
+        start_sentiment_warmup()
+
     return app
 
 
@@ -0,0 +1,350 @@
+import hashlib
+from pathlib import Path
+from uuid import uuid4
+
+from flask import Request, current_app
+from sqlalchemy import delete, event, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from checklist_store import dump_attachment, load_attachment
+from models import ChecklistGroup, KnowledgeAttachment, StoredBlob, db
+from storage_backends import StorageError, attachment_storage
+
+
+UPLOAD_CHUNK_BYTES = 64 * 1024
+BLOB_PREFIX = "blobs"
+# Attachments used to be addressed by their path under static/, which is
+# where the local storage root still defaults to.
+LEGACY_KEY_PREFIX = "uploads/"
+
+
+def blob_key(sha256: str, extension: str) -> str:
+    # Fanned out by the first two hex digits; the extension stays on the
+    # name so the download keeps a recognisable file type.
+    suffix = f".{extension}" if extension else ""
+    return f"{BLOB_PREFIX}/{sha256[:2]}/{sha256}{suffix}"
+
+
+def checklist_attachment_key(attachment) -> str:
+    if not attachment or attachment.get("kind") != "file":
+        return ""
+    return str(attachment.get("key") or "").strip()
+
+
+class _CappedFileStream:
+    # Werkzeug's spool for one uploaded file; refuses to grow past max_bytes.
+    def __init__(self, stream, max_bytes: int):
+        self._stream = stream
+        self._max_bytes = max_bytes
+        self._size = 0
+
+    def write(self, data) -> int:
+        self._size += len(data)
+        if self._size > self._max_bytes:
+            self._stream.close()
+            raise RequestEntityTooLarge()
+        return self._stream.write(data)
+
+    def __iter__(self):
+        return iter(self._stream)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class UploadRequest(Request):
+    # Werkzeug spools every file of a multipart body before the view runs, up
+    # to MAX_CONTENT_LENGTH for the whole request. Capping each file's spool
+    # at MAX_UPLOAD_FILE_BYTES stops an oversized file while it is received,
+    # not after; the per-form limits are checked again by save_upload.
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        max_bytes = current_app.config["MAX_UPLOAD_FILE_BYTES"]
+        if content_length is not None and content_length > max_bytes:
+            raise RequestEntityTooLarge()
+        stream = super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        return _CappedFileStream(stream, max_bytes)
+
+
+def _receive(chunks, max_bytes: int):
+    # Copies the upload in chunks, hashing and counting as it goes, and stops
+    # as soon as it passes max_bytes. Returns (sha256, size, temp path), or
+    # None when the upload was too large.
+    incoming = attachment_storage().incoming_dir()
+    incoming.mkdir(parents=True, exist_ok=True)
+    temp_path = incoming / uuid4().hex
+    digest = hashlib.sha256()
+    size = 0
+    too_large = False
+    try:
+        with open(temp_path, "wb") as handle:
+            for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    too_large = True
+                    break
+                digest.update(chunk)
+                handle.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    if too_large:
+        temp_path.unlink(missing_ok=True)
+        return None
+    return digest.hexdigest(), size, temp_path
+
+
+def _adopt_file(temp_path: Path, sha256: str, size: int, extension: str) -> StoredBlob:
+    # Takes one reference on the blob for this content, storing temp_path if
+    # the content is new (or its object went missing) and discarding it
+    # otherwise.
+    storage = attachment_storage()
+    blob = StoredBlob.query.filter_by(sha256=sha256).first()
+    if blob is not None and storage.stat(blob.storage_key) is not None:
+        temp_path.unlink(missing_ok=True)
+        blob.ref_count = StoredBlob.ref_count + 1
+        return blob
+
+    key = blob.storage_key if blob is not None else blob_key(sha256, extension)
+    try:
+        storage.put_file(key, temp_path, sha256)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    if blob is not None:
+        blob.ref_count = StoredBlob.ref_count + 1
+        return blob
+    # A concurrent upload of the same new content may insert its row first;
+    # the savepoint keeps the losing insert from aborting this request's
+    # transaction, and this request then shares the winner's blob.
+    try:
+        with db.session.begin_nested():
+            blob = StoredBlob(sha256=sha256, storage_key=key, size=size, ref_count=1)
+            db.session.add(blob)
+    except IntegrityError:
+        blob = StoredBlob.query.filter_by(sha256=sha256).one()
+        blob.ref_count = StoredBlob.ref_count + 1
+        # Same content under the same key is the winner's object already.
+        if blob.storage_key != key:
+            _delete_stored_objects([key])
+        return blob
+    db.session.info.setdefault("placed_blob_keys", {})[sha256] = key
+    return blob
+
+
+def save_upload(uploaded_file, extension: str, max_bytes: int) -> StoredBlob | None:
+    # None means the upload passed max_bytes; nothing is kept in that case.
+    stream = uploaded_file.stream
+    received = _receive(iter(lambda: stream.read(UPLOAD_CHUNK_BYTES), b""), max_bytes)
+    if received is None:
+        return None
+    sha256, size, temp_path = received
+    return _adopt_file(temp_path, sha256, size, extension)
+
+
+def release_blob(blob_id) -> None:
+    # Drops one reference. A blob left with none is deleted just before the
+    # commit, once the rows that used it are gone, and its object after it.
+    blob = db.session.get(StoredBlob, blob_id) if blob_id else None
+    if blob is None:
+        return
+    blob.ref_count = StoredBlob.ref_count - 1
+    db.session.flush()
+    if blob.ref_count <= 0:
+        db.session.info.setdefault("released_blob_ids", set()).add(blob.id)
+
+
+def release_attachment(attachment: KnowledgeAttachment) -> None:
+    if attachment.blob_id:
+        release_blob(attachment.blob_id)
+        return
+    # Uploaded before blobs existed: the object belongs to this row alone.
+    storage_key = (attachment.storage_key or "").strip()
+    if storage_key:
+        db.session.info.setdefault("orphaned_blob_keys", []).append(storage_key)
+
+
+def release_checklist_attachment(raw_value) -> None:
+    attachment = load_attachment(raw_value)
+    if attachment and attachment.get("kind") == "file":
+        release_blob(attachment.get("blob_id"))
+
+
+def _delete_released_blobs(session) -> None:
+    blob_ids = session.info.pop("released_blob_ids", None)
+    if not blob_ids:
+        return
+    session.flush()
+    # Re-check the count: an upload in the same transaction may have taken
+    # the blob again.
+    released = session.execute(
+        select(StoredBlob.id, StoredBlob.storage_key).where(StoredBlob.id.in_(blob_ids), StoredBlob.ref_count <= 0)
+    ).all()
+    if not released:
+        return
+    session.execute(delete(StoredBlob).where(StoredBlob.id.in_([blob_id for blob_id, _ in released])))
+    session.info.setdefault("orphaned_blob_keys", []).extend(storage_key for _, storage_key in released)
+
+
+def _delete_stored_objects(keys) -> None:
+    # The rows are already gone; an object that cannot be deleted now is only
+    # wasted space, so it is logged instead of failing the request.
+    keys = list(keys)
+    if not keys:
+        return
+    storage = attachment_storage()
+    for key in keys:
+        try:
+            storage.delete(key)
+        except (OSError, StorageError, ValueError):
+            current_app.logger.warning("Could not delete stored attachment %r.", key, exc_info=True)
+
+
+def _remove_orphaned_files(session) -> None:
+    _delete_stored_objects(session.info.pop("orphaned_blob_keys", []))
+    session.info.pop("placed_blob_keys", None)
+
+
+def _discard_uncommitted_files(session, transaction) -> None:
+    if transaction.parent is not None:
+        return
+    # Runs after a rollback (or a close without commit): objects released in
+    # it stay, and objects stored for blobs it created go unless another
+    # transaction committed a row for the same content meanwhile.
+    session.info.pop("released_blob_ids", None)
+    session.info.pop("orphaned_blob_keys", None)
+    placed = session.info.pop("placed_blob_keys", None)
+    if not placed:
+        return
+    with session.get_bind().connect() as connection:
+        kept = set(
+            connection.execute(select(StoredBlob.sha256).where(StoredBlob.sha256.in_(list(placed)))).scalars()
+        )
+    _delete_stored_objects(key for sha256, key in placed.items() if sha256 not in kept)
+
+
+def register_attachment_store_events() -> None:
+    if event.contains(Session, "after_commit", _remove_orphaned_files):
+        return
+    event.listen(Session, "before_commit", _delete_released_blobs)
+    event.listen(Session, "after_commit", _remove_orphaned_files)
+    event.listen(Session, "after_transaction_end", _discard_uncommitted_files)
+
+
+def migrate_attachment_keys() -> None:
+    # knowledge_attachments.file_path and stored_blobs.path were paths under
+    # static/ ("uploads/..."); storage keys are relative to the storage root.
+    # The columns themselves are renamed in _ensure_schema_updates.
+    prefix_length = len(LEGACY_KEY_PREFIX)
+    for table in ("knowledge_attachments", "stored_blobs"):
+        db.session.execute(
+            text(
+                f"UPDATE {table} SET storage_key = substr(storage_key, {prefix_length + 1}) "
+                "WHERE storage_key LIKE :prefix"
+            ),
+            {"prefix": f"{LEGACY_KEY_PREFIX}%"},
+        )
+    groups = ChecklistGroup.query.filter(ChecklistGroup.attachment.like('%"path"%')).all()
+    for group in groups:
+        attachment = load_attachment(group.attachment)
+        if not attachment or "path" not in attachment:
+            continue
+        path = str(attachment.pop("path") or "").strip()
+        if path.startswith(LEGACY_KEY_PREFIX):
+            path = path[prefix_length:]
+        attachment["key"] = path
+        group.attachment = dump_attachment(attachment)
+    db.session.commit()
+
+
+def _adopt_legacy_file(storage_key: str):
+    # Works on a copy and only removes the original once the row pointing at
+    # the blob has committed.
+    storage = attachment_storage()
+    if not storage_key or storage.stat(storage_key) is None:
+        return None
+    sha256, size, temp_path = _receive(storage.read(storage_key), float("inf"))
+    blob = _adopt_file(temp_path, sha256, size, Path(storage_key).suffix.lstrip(".").lower())
+    if blob.storage_key != storage_key:
+        db.session.info.setdefault("orphaned_blob_keys", []).append(storage_key)
+    return blob
+
+
+def legacy_attachment_counts() -> tuple[int, int]:
+    # (intervention attachments, checklist groups) whose files predate blobs.
+    knowledge = KnowledgeAttachment.query.filter(KnowledgeAttachment.blob_id.is_(None)).count()
+    checklists = 0
+    for (raw_value,) in db.session.query(ChecklistGroup.attachment).filter(ChecklistGroup.attachment.isnot(None)):
+        attachment = load_attachment(raw_value)
+        if attachment and attachment.get("kind") == "file" and not attachment.get("blob_id"):
+            checklists += 1
+    return knowledge, checklists
+
+
+def migrate_legacy_attachments() -> tuple[int, int]:
+    # Moves files saved under interventions/ and checklists/ into the blob
+    # store, one commit per file so an interrupted run keeps what it did.
+    # Rows whose object is missing are left as they are.
+    knowledge = 0
+    legacy_rows = (
+        KnowledgeAttachment.query.filter(KnowledgeAttachment.blob_id.is_(None))
+        .order_by(KnowledgeAttachment.id)
+        .all()
+    )
+    for row in legacy_rows:
+        blob = _adopt_legacy_file((row.storage_key or "").strip())
+        if blob is None:
+            continue
+        db.session.flush()
+        row.blob_id = blob.id
+        row.storage_key = blob.storage_key
+        db.session.commit()
+        knowledge += 1
+
+    checklists = 0
+    groups = ChecklistGroup.query.filter(ChecklistGroup.attachment.isnot(None)).order_by(ChecklistGroup.id).all()
+    for group in groups:
+        attachment = load_attachment(group.attachment)
+        if not attachment or attachment.get("kind") != "file" or attachment.get("blob_id"):
+            continue
+        blob = _adopt_legacy_file(checklist_attachment_key(attachment))
+        if blob is None:
+            continue
+        db.session.flush()
+        attachment["blob_id"] = blob.id
+        attachment["key"] = blob.storage_key
+        group.attachment = dump_attachment(attachment)
+        db.session.commit()
+        checklists += 1
+    return knowledge, checklists
+
+
+def referenced_storage_keys() -> list[str]:
+    # Every key a row still points at: blobs plus attachments that predate
+    # them.
+    keys = set(db.session.scalars(select(StoredBlob.storage_key)))
+    keys.update(
+        db.session.scalars(
+            select(KnowledgeAttachment.storage_key).where(KnowledgeAttachment.blob_id.is_(None))
+        )
+    )
+    for (raw_value,) in db.session.query(ChecklistGroup.attachment).filter(ChecklistGroup.attachment.isnot(None)):
+        key = checklist_attachment_key(load_attachment(raw_value))
+        if key:
+            keys.add(key)
+    return sorted(key for key in keys if key)
+
+
+def copy_stored_object(source, key: str) -> None:
+    # Copies one object from another storage backend into the configured one,
+    # through a temp file since put_file consumes its source.
+    incoming = attachment_storage().incoming_dir()
+    incoming.mkdir(parents=True, exist_ok=True)
+    temp_path = incoming / uuid4().hex
+    try:
+        with open(temp_path, "wb") as handle:
+            for chunk in source.read(key):
+                handle.write(chunk)
+        attachment_storage().put_file(key, temp_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
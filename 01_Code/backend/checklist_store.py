@@ -0,0 +1,501 @@
+import json
+import operator
+from datetime import datetime, timedelta
+from functools import reduce
+
+from sqlalchemy import and_, case, delete, func, insert, literal, or_, select, update
+from sqlalchemy.orm import selectinload
+
+from models import Checklist, ChecklistGroup, ChecklistTask, StudentAcademicProfile, User, db
+from notification_counters import SCOPES_DECLARED, mark_badges_stale
+
+
+CHECKLIST_META_PREFIX = "[[CLARIFAI_META]]"
+CHECKLIST_TASK_MAX_LENGTH = 255
+CHECKLIST_MAX_TASKS = 10
+MIGRATION_KEY_CHUNK = 500
+PUBLISH_CHUNK_SIZE = 500
+
+
+def full_task_mask(task_count: int) -> int:
+    return (1 << max(int(task_count or 0), 0)) - 1
+
+
+def mask_from_indexes(indexes, task_count: int) -> int:
+    mask = 0
+    for index in indexes or []:
+        try:
+            value = int(index)
+        except (TypeError, ValueError):
+            continue
+        if 0 <= value < task_count:
+            mask |= 1 << value
+    return mask
+
+
+def indexes_from_mask(mask: int, task_count: int) -> list[int]:
+    mask = int(mask or 0)
+    return [index for index in range(max(int(task_count or 0), 0)) if mask & (1 << index)]
+
+
+def progress_state(mask: int, task_count: int) -> str:
+    completed = int(mask or 0) & full_task_mask(task_count)
+    if task_count and completed == full_task_mask(task_count):
+        return "complete"
+    if completed:
+        return "partial"
+    return "null"
+
+
+def load_attachment(raw_value):
+    if not raw_value:
+        return None
+    try:
+        attachment = json.loads(raw_value)
+    except (TypeError, json.JSONDecodeError):
+        return None
+    return attachment if isinstance(attachment, dict) else None
+
+
+def dump_attachment(attachment) -> str | None:
+    if not isinstance(attachment, dict) or not attachment:
+        return None
+    return json.dumps(attachment, separators=(",", ":"))
+
+
+def group_task_texts(group: ChecklistGroup | None) -> list[str]:
+    if group is None:
+        return []
+    return [task.text for task in group.tasks]
+
+
+def checklist_progress(checklist: Checklist, tasks: list[str]) -> dict:
+    tasks = list(tasks) or [checklist.title or "Complete this checklist item"]
+    completed_indexes = indexes_from_mask(checklist.completed_mask, len(tasks))
+    return {
+        "tasks": tasks,
+        "completed_indexes": completed_indexes,
+        "total": len(tasks),
+        "completed": len(completed_indexes),
+        "state": progress_state(checklist.completed_mask, len(tasks)),
+    }
+
+
+def checklist_group_details(group: ChecklistGroup) -> dict:
+    return {
+        "group_id": group.group_key,
+        "subject": group.subject or "No specific subject",
+        "priority": group.priority or "medium",
+        "due_date": group.due_date,
+        "category": group.category or "General",
+        "target_course": group.target_course or "BOTH",
+        "target_semester": group.target_semester or "all",
+        "target_section": group.target_section or "all",
+        "tasks": group_task_texts(group),
+        "attachment": load_attachment(group.attachment),
+        "description": group.description or "",
+    }
+
+
+def replace_group_tasks(group: ChecklistGroup, task_lines: list[str]) -> None:
+    # Rewrite positions in place; swapping in new rows would insert before the
+    # old ones are deleted and trip the (group_id, position) unique constraint.
+    task_lines = list(task_lines)[:CHECKLIST_MAX_TASKS]
+    existing = list(group.tasks)
+    for position, text in enumerate(task_lines):
+        text = text[:CHECKLIST_TASK_MAX_LENGTH]
+        if position < len(existing):
+            existing[position].text = text
+        else:
+            group.tasks.append(ChecklistTask(position=position, text=text))
+    for task in existing[len(task_lines) :]:
+        group.tasks.remove(task)
+    group.task_count = len(task_lines)
+
+
+def checklist_audience_ids(target_course: str, target_semester: str, target_section: str) -> list[int]:
+    # Mirrors the per-student rules: profile course code wins over users.course,
+    # a blank section counts as "A", and semester targets need a profile.
+    course = func.upper(
+        func.trim(func.coalesce(func.nullif(StudentAcademicProfile.course_code, ""), User.course, ""))
+    )
+    section = func.coalesce(func.nullif(func.upper(func.trim(func.coalesce(User.section, ""))), ""), "A")
+    query = (
+        db.session.query(User.id)
+        .outerjoin(StudentAcademicProfile, StudentAcademicProfile.user_id == User.id)
+        .filter(User.role == "student", User.is_active.is_(True))
+    )
+    if target_course != "BOTH":
+        query = query.filter(course == target_course)
+    if target_section != "all":
+        query = query.filter(section == target_section)
+    if target_semester != "all":
+        query = query.filter(StudentAcademicProfile.current_semester == int(target_semester))
+    return [row[0] for row in query.order_by(User.id.asc()).all()]
+
+
+def publish_checklist_group(group: ChecklistGroup, student_ids: list[int], *, chunk_size: int = PUBLISH_CHUNK_SIZE) -> int:
+    # The group is committed first and assignments follow in short chunked
+    # transactions, so a large publish never holds SQLite's write lock for long.
+    chunk_size = max(int(chunk_size), 1)
+    db.session.add(group)
+    db.session.commit()
+    group_id, title, faculty_id, created_at = group.id, group.title, group.faculty_id, group.created_at
+
+    try:
+        for start in range(0, len(student_ids), chunk_size):
+            chunk_ids = student_ids[start : start + chunk_size]
+            db.session.execute(
+                insert(Checklist).execution_options(**{SCOPES_DECLARED: True}),
+                [
+                    {
+                        "title": title,
+                        "faculty_id": faculty_id,
+                        "student_id": student_id,
+                        "group_id": group_id,
+                        "completed_mask": 0,
+                        "completion_locked": False,
+                        "is_completed": False,
+                        "created_at": created_at,
+                    }
+                    for student_id in chunk_ids
+                ],
+            )
+            mark_badges_stale([("faculty", faculty_id)] + [("student", student_id) for student_id in chunk_ids])
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        Checklist.query.filter_by(group_id=group_id).delete(synchronize_session=False)
+        db.session.delete(db.session.get(ChecklistGroup, group_id))
+        db.session.commit()
+        raise
+    return len(student_ids)
+
+
+def _completed_task_count(mask_column):
+    # SQLite has no popcount; task lists are capped, so sum the bits directly.
+    return reduce(
+        operator.add,
+        [mask_column.op(">>")(bit).op("&")(1) for bit in range(CHECKLIST_MAX_TASKS)],
+    )
+
+
+def _group_progress_query(
+    faculty_id: int,
+    *,
+    course: str = "ALL",
+    category: str = "all",
+    semester: str = "all",
+    section: str = "all",
+    created_from=None,
+    created_to=None,
+    status: str = "all",
+):
+    students = func.count(Checklist.id)
+    complete_count = func.sum(case((Checklist.is_completed.is_(True), 1), else_=0))
+    partial_count = func.sum(
+        case((and_(Checklist.is_completed.is_(False), Checklist.completed_mask != 0), 1), else_=0)
+    )
+    null_count = func.sum(
+        case((and_(Checklist.is_completed.is_(False), Checklist.completed_mask == 0), 1), else_=0)
+    )
+    aggregate_state = case(
+        (complete_count == students, "complete"),
+        (or_(partial_count > 0, complete_count > 0), "partial"),
+        else_="null",
+    )
+    query = (
+        db.session.query(
+            ChecklistGroup,
+            students.label("students"),
+            complete_count.label("complete_count"),
+            partial_count.label("partial_count"),
+            null_count.label("null_count"),
+            func.sum(case((Checklist.completion_locked.is_(True), 1), else_=0)).label("locked_count"),
+            func.sum(_completed_task_count(Checklist.completed_mask)).label("completed_tasks"),
+            func.min(Checklist.id).label("first_id"),
+            aggregate_state.label("aggregate_state"),
+        )
+        .join(Checklist, Checklist.group_id == ChecklistGroup.id)
+        .filter(ChecklistGroup.faculty_id == faculty_id)
+    )
+    if course == "BOTH":
+        query = query.filter(ChecklistGroup.target_course == "BOTH")
+    elif course in {"MCA", "BCA"}:
+        query = query.filter(ChecklistGroup.target_course.in_([course, "BOTH"]))
+    if category != "all":
+        query = query.filter(ChecklistGroup.category == category)
+    if semester != "all":
+        query = query.filter(ChecklistGroup.target_semester.in_(["all", semester]))
+    if section != "all":
+        query = query.filter(ChecklistGroup.target_section.in_(["all", section]))
+    if created_from is not None:
+        query = query.filter(ChecklistGroup.created_at >= datetime.combine(created_from, datetime.min.time()))
+    if created_to is not None:
+        query = query.filter(
+            ChecklistGroup.created_at < datetime.combine(created_to + timedelta(days=1), datetime.min.time())
+        )
+    query = query.group_by(ChecklistGroup.id)
+    if status in {"complete", "partial", "null"}:
+        query = query.having(aggregate_state == status)
+    return query
+
+
+def checklist_group_progress(faculty_id: int, *, page: int = 1, per_page: int | None = None, **filters) -> list[dict]:
+    query = (
+        _group_progress_query(faculty_id, **filters)
+        .options(selectinload(ChecklistGroup.tasks))
+        .order_by(ChecklistGroup.created_at.desc(), ChecklistGroup.id.desc())
+    )
+    if per_page:
+        query = query.limit(per_page).offset((max(page, 1) - 1) * per_page)
+
+    items = []
+    for row in query.all():
+        item = checklist_group_details(row.ChecklistGroup)
+        item.update(
+            {
+                "id": row.first_id,
+                "title": row.ChecklistGroup.title,
+                "created_at": row.ChecklistGroup.created_at,
+                "total_tasks": max(row.ChecklistGroup.task_count, 1),
+                "students": row.students,
+                "complete_count": row.complete_count,
+                "partial_count": row.partial_count,
+                "null_count": row.null_count,
+                "completion_locked": row.locked_count == row.students,
+                "completed_tasks": row.completed_tasks,
+                "aggregate_state": row.aggregate_state,
+            }
+        )
+        items.append(item)
+    return items
+
+
+def checklist_group_totals(faculty_id: int, **filters) -> dict:
+    progress = _group_progress_query(faculty_id, **filters).subquery()
+    row = db.session.query(
+        func.count(),
+        func.sum(case((progress.c.aggregate_state == "complete", 1), else_=0)),
+        func.sum(case((progress.c.aggregate_state == "partial", 1), else_=0)),
+        func.sum(case((progress.c.aggregate_state == "null", 1), else_=0)),
+        func.sum(progress.c.students),
+    ).one()
+    return {
+        "total": row[0] or 0,
+        "complete": row[1] or 0,
+        "partial": row[2] or 0,
+        "null": row[3] or 0,
+        "students": row[4] or 0,
+    }
+
+
+def task_position_map(old_tasks: list[str], new_tasks: list[str]) -> dict[int, int]:
+    # Tasks keep their progress when their text survives the edit, wherever it
+    # moved to. If the list length is unchanged, leftover tasks are treated as
+    # renamed in place so fixing a typo does not reset students' progress.
+    def _key(text):
+        return (text or "").strip().casefold()
+
+    unmatched_new = {}
+    for position, text in enumerate(new_tasks):
+        unmatched_new.setdefault(_key(text), []).append(position)
+
+    position_map = {}
+    leftover_old = []
+    for position, text in enumerate(old_tasks):
+        candidates = unmatched_new.get(_key(text))
+        if candidates:
+            position_map[position] = candidates.pop(0)
+        else:
+            leftover_old.append(position)
+
+    if len(old_tasks) == len(new_tasks):
+        taken = set(position_map.values())
+        for position in leftover_old:
+            if position not in taken:
+                position_map[position] = position
+    return position_map
+
+
+def _remapped_mask(mask_column, position_map: dict[int, int]):
+    parts = [
+        mask_column.op(">>")(old).op("&")(1).op("<<")(new)
+        for old, new in sorted(position_map.items())
+    ]
+    if not parts:
+        return literal(0)
+    return reduce(lambda left, right: left.op("|")(right), parts)
+
+
+def update_group_assignments(group: ChecklistGroup, title: str, task_lines: list[str]) -> int:
+    # One UPDATE for the whole group: finished rows stay finished, the rest
+    # carry their done bits over to the tasks' new positions.
+    position_map = task_position_map(group_task_texts(group), task_lines)
+    replace_group_tasks(group, task_lines)
+    new_full_mask = full_task_mask(group.task_count)
+    new_mask = case(
+        (Checklist.is_completed.is_(True), new_full_mask),
+        else_=_remapped_mask(Checklist.completed_mask, position_map),
+    )
+    student_ids = db.session.execute(
+        update(Checklist)
+        .where(Checklist.group_id == group.id)
+        .values(
+            title=title,
+            completed_mask=new_mask,
+            is_completed=new_mask == new_full_mask,
+            version=Checklist.version + 1,
+        )
+        .returning(Checklist.student_id)
+        .execution_options(synchronize_session=False, **{SCOPES_DECLARED: True})
+    ).scalars().all()
+    mark_badges_stale([("faculty", group.faculty_id)] + [("student", student_id) for student_id in student_ids])
+    return len(student_ids)
+
+
+def delete_group_assignments(group: ChecklistGroup) -> int:
+    # One DELETE, so a student toggling a task meanwhile cannot make the
+    # faculty's delete fail on a stale version.
+    student_ids = db.session.execute(
+        delete(Checklist)
+        .where(Checklist.group_id == group.id)
+        .returning(Checklist.student_id)
+        .execution_options(**{SCOPES_DECLARED: True})
+    ).scalars().all()
+    mark_badges_stale([("faculty", group.faculty_id)] + [("student", student_id) for student_id in student_ids])
+    return len(student_ids)
+
+
+def set_checklist_task(checklist_id: int, student_id: int, task_index: int, done: bool):
+    # Flips one bit in a single UPDATE so toggles from two tabs on different
+    # tasks both land; the full mask is read from the group in the same statement.
+    task_count = (
+        select(ChecklistGroup.task_count)
+        .where(ChecklistGroup.id == Checklist.group_id)
+        .scalar_subquery()
+    )
+    bit = 1 << task_index
+    if done:
+        new_mask = Checklist.completed_mask.op("|")(bit)
+    else:
+        new_mask = Checklist.completed_mask.op("&")(~bit)
+    full_mask = literal(1).op("<<")(task_count) - 1
+    updated = db.session.execute(
+        update(Checklist)
+        .where(
+            Checklist.id == checklist_id,
+            Checklist.student_id == student_id,
+            Checklist.completion_locked.is_(False),
+            task_count > task_index,
+        )
+        .values(
+            completed_mask=new_mask,
+            is_completed=new_mask == full_mask,
+            version=Checklist.version + 1,
+        )
+        .returning(Checklist.completed_mask, Checklist.is_completed, Checklist.version, Checklist.faculty_id)
+        .execution_options(synchronize_session=False, **{SCOPES_DECLARED: True})
+    ).first()
+    if updated is not None:
+        mark_badges_stale([("student", student_id), ("faculty", updated.faculty_id)])
+    return updated
+
+
+def _parse_legacy_description(raw_description: str):
+    text = (raw_description or "").strip()
+    if not text.startswith(CHECKLIST_META_PREFIX):
+        return {}, text
+
+    first_line, _, remainder = text.partition("\n")
+    try:
+        meta = json.loads(first_line[len(CHECKLIST_META_PREFIX) :].strip())
+    except (TypeError, json.JSONDecodeError):
+        meta = {}
+    if not isinstance(meta, dict):
+        meta = {}
+    return meta, remainder.strip()
+
+
+def _legacy_date(raw_value):
+    try:
+        return datetime.strptime(str(raw_value or ""), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _legacy_text(meta: dict, key: str, default: str, *, upper: bool = False, lower: bool = False) -> str:
+    value = str(meta.get(key) or "").strip() or default
+    if upper:
+        return value.upper()
+    if lower:
+        return value.lower()
+    return value
+
+
+def _group_from_legacy(row: Checklist, group_key: str, meta: dict, body: str) -> ChecklistGroup:
+    tasks = [str(item).strip() for item in meta.get("tasks") or [] if str(item).strip()]
+    if not tasks:
+        tasks = [body or row.title or "Complete this checklist item"]
+    section = _legacy_text(meta, "target_section", "all")
+    group = ChecklistGroup(
+        group_key=group_key,
+        faculty_id=row.faculty_id,
+        title=row.title,
+        description=body or None,
+        subject=_legacy_text(meta, "subject", "No specific subject"),
+        category=_legacy_text(meta, "category", "General"),
+        priority=_legacy_text(meta, "priority", "medium", lower=True),
+        due_date=_legacy_date(meta.get("due_date")),
+        target_course=_legacy_text(meta, "target_course", "BOTH", upper=True),
+        target_semester=_legacy_text(meta, "target_semester", "all", lower=True),
+        target_section="all" if section.lower() == "all" else section.upper(),
+        attachment=dump_attachment(meta.get("attachment")),
+        created_at=row.created_at,
+        updated_at=row.created_at,
+    )
+    replace_group_tasks(group, tasks)
+    return group
+
+
+def migrate_legacy_checklists() -> int:
+    # Rows written before checklist groups existed keep everything in a
+    # `[[CLARIFAI_META]]` JSON line; fold those into groups once.
+    rows = Checklist.query.filter(Checklist.group_id.is_(None)).order_by(Checklist.id.asc()).all()
+    if not rows:
+        return 0
+
+    parsed = []
+    for row in rows:
+        meta, body = _parse_legacy_description(row.description)
+        group_key = str(meta.get("group_id") or "").strip() or f"legacy-{row.id}"
+        parsed.append((row, group_key, meta, body))
+
+    keys = sorted({group_key for _, group_key, _, _ in parsed})
+    groups = {}
+    for start in range(0, len(keys), MIGRATION_KEY_CHUNK):
+        chunk = keys[start : start + MIGRATION_KEY_CHUNK]
+        for group in ChecklistGroup.query.filter(ChecklistGroup.group_key.in_(chunk)).all():
+            groups[group.group_key] = group
+
+    for row, group_key, meta, body in parsed:
+        group = groups.get(group_key)
+        if group is None:
+            group = _group_from_legacy(row, group_key, meta, body)
+            groups[group_key] = group
+            db.session.add(group)
+        elif row.created_at and group.created_at and row.created_at < group.created_at:
+            group.created_at = row.created_at
+
+        completed = meta.get("completed_tasks") or []
+        mask = mask_from_indexes(completed if isinstance(completed, list) else [], group.task_count)
+        if row.is_completed and not mask:
+            mask = full_task_mask(group.task_count)
+        row.group = group
+        row.completed_mask = mask
+        row.is_completed = mask == full_task_mask(group.task_count)
+        row.completion_locked = bool(meta.get("completion_locked", False))
+        row.description = None
+
+    db.session.commit()
+    return len(rows)
@@ -72,9 +72,49 @@ class Config:
 		"What is your birth city ?",
 	)
 	ADMIN_SECURITY_ANSWER = os.getenv("CLARIFAI_ADMIN_SECURITY_ANSWER", "")
+	# Whole request body, checked by Werkzeug before the form is parsed: five
+	# 30MB intervention attachments plus the form fields.
+	MAX_CONTENT_LENGTH = int(os.getenv("CLARIFAI_MAX_REQUEST_MB", "160")) * 1024 * 1024
+	# Largest single uploaded file (intervention attachments), enforced while
+	# Werkzeug parses the body so a bigger file is never received in full.
+	MAX_UPLOAD_FILE_BYTES = int(os.getenv("CLARIFAI_MAX_UPLOAD_FILE_MB", "30")) * 1024 * 1024
+	# "local" keeps attachments under ATTACHMENT_STORAGE_LOCAL_ROOT (a shared
+	# mount when several app nodes serve the site); "s3" keeps them in an
+	# S3-compatible bucket.
+	ATTACHMENT_STORAGE = os.getenv("CLARIFAI_ATTACHMENT_STORAGE", "local").strip().lower()
+	ATTACHMENT_STORAGE_LOCAL_ROOT = os.getenv(
+		"CLARIFAI_ATTACHMENT_STORAGE_LOCAL_ROOT",
+		str(BASE_DIR / "static" / "uploads"),
+	)
+	S3_ENDPOINT_URL = os.getenv("CLARIFAI_S3_ENDPOINT_URL", "").strip()
+	S3_BUCKET = os.getenv("CLARIFAI_S3_BUCKET", "").strip()
+	S3_ACCESS_KEY = os.getenv("CLARIFAI_S3_ACCESS_KEY", "").strip()
+	S3_SECRET_KEY = os.getenv("CLARIFAI_S3_SECRET_KEY", "").strip()
+	S3_REGION = os.getenv("CLARIFAI_S3_REGION", "us-east-1").strip()
+	S3_PREFIX = os.getenv("CLARIFAI_S3_PREFIX", "").strip()
 	ALLOW_SELF_REGISTER = os.getenv("CLARIFAI_ALLOW_SELF_REGISTER", "false").lower() in {
 		"1",
 		"true",
 		"yes",
 		"y",
 	}
+	KNOWLEDGE_VIEW_BUFFER_ENABLED = os.getenv("CLARIFAI_KNOWLEDGE_VIEW_BUFFER_ENABLED", "true").lower() in {
+		"1",
+		"true",
+		"yes",
+		"y",
+	}
+	KNOWLEDGE_VIEW_FLUSH_SECONDS = float(os.getenv("CLARIFAI_KNOWLEDGE_VIEW_FLUSH_SECONDS", "2"))
+	KNOWLEDGE_VIEW_BUFFER_MAX_PENDING = int(os.getenv("CLARIFAI_KNOWLEDGE_VIEW_BUFFER_MAX_PENDING", "10000"))
+	NOTIFICATION_BADGE_CACHE_TTL_SECONDS = int(os.getenv("CLARIFAI_NOTIFICATION_BADGE_CACHE_TTL_SECONDS", "30"))
+	KNOWLEDGE_TAG_COUNT_CACHE_TTL_SECONDS = int(os.getenv("CLARIFAI_KNOWLEDGE_TAG_COUNT_CACHE_TTL_SECONDS", "60"))
+	COHORT_COUNT_CACHE_TTL_SECONDS = int(os.getenv("CLARIFAI_COHORT_COUNT_CACHE_TTL_SECONDS", "300"))
+	SENTIMENT_ENGINE = os.getenv("CLARIFAI_SENTIMENT_ENGINE", "textblob").strip().lower()
+	SENTIMENT_CACHE_MAX_ENTRIES = int(os.getenv("CLARIFAI_SENTIMENT_CACHE_MAX_ENTRIES", "2048"))
+	SENTIMENT_CACHE_TTL_SECONDS = int(os.getenv("CLARIFAI_SENTIMENT_CACHE_TTL_SECONDS", "900"))
+	SENTIMENT_WARMUP_ENABLED = os.getenv("CLARIFAI_SENTIMENT_WARMUP_ENABLED", "true").lower() in {
+		"1",
+		"true",
+		"yes",
+		"y",
+	}
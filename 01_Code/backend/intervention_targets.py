@@ -0,0 +1,197 @@
+from collections import Counter
+from itertools import product
+
+from sqlalchemy import func, inspect, select
+
+from invalidating_cache import ALL_KEYS, InvalidatingCache, bulk_statement_model, changed_instances
+from models import KnowledgePost, KnowledgePostTarget, StudentAcademicProfile, User, db
+
+
+ANY_TARGET = "*"
+# Columns that move a student between cohorts (or in and out of them).
+COHORT_COLUMNS = {
+    User: ("role", "is_active", "course", "section"),
+    StudentAcademicProfile: ("user_id", "course_code", "current_semester"),
+}
+
+
+def _csv_tokens(raw_value: str, *, uppercase: bool = False) -> list[str]:
+    tokens = []
+    for token in str(raw_value or "").split(","):
+        clean = token.strip()
+        if clean:
+            tokens.append(clean.upper() if uppercase else clean.lower())
+    return tokens
+
+
+def post_target_rows(post: KnowledgePost) -> list[tuple[str, str, str]]:
+    # The post side of _cohort_key's rules: an empty list, "all" semesters
+    # or "ALL" sections match everyone in that dimension.
+    courses = sorted(set(_csv_tokens(post.target_courses, uppercase=True))) or [ANY_TARGET]
+    semesters = sorted(set(_csv_tokens(post.target_semesters)))
+    if not semesters or "all" in semesters:
+        semesters = [ANY_TARGET]
+    sections = sorted(set(_csv_tokens(post.target_sections, uppercase=True)))
+    if not sections or "ALL" in sections:
+        sections = [ANY_TARGET]
+    return list(product(courses, semesters, sections))
+
+
+def sync_post_targets(post: KnowledgePost) -> None:
+    wanted = set(post_target_rows(post))
+    for target in list(post.targets):
+        key = (target.course, target.semester, target.section)
+        if key in wanted:
+            wanted.discard(key)
+        else:
+            post.targets.remove(target)
+    for course, semester, section in sorted(wanted):
+        post.targets.append(KnowledgePostTarget(course=course, semester=semester, section=section))
+
+
+def student_target_filter(course: str, semester, section: str):
+    courses = [ANY_TARGET]
+    if course:
+        courses.append(course.strip().upper())
+    semesters = [ANY_TARGET]
+    if semester is not None:
+        semesters.append(str(semester).strip().lower())
+    sections = [ANY_TARGET]
+    if section:
+        sections.append(section.strip().upper())
+    # Correlated EXISTS so SQLite can walk the board's order index and stop at
+    # the page limit instead of sorting every targeted post.
+    return (
+        select(KnowledgePostTarget.id)
+        .where(
+            KnowledgePostTarget.post_id == KnowledgePost.id,
+            KnowledgePostTarget.course.in_(courses),
+            KnowledgePostTarget.semester.in_(semesters),
+            KnowledgePostTarget.section.in_(sections),
+        )
+        .exists()
+    )
+
+
+def backfill_post_targets() -> int:
+    missing = (
+        KnowledgePost.query.filter(~KnowledgePost.targets.any())
+        .order_by(KnowledgePost.id)
+        .all()
+    )
+    for post in missing:
+        sync_post_targets(post)
+    if missing:
+        db.session.commit()
+    return len(missing)
+
+
+def _cohort_key(user_course, section, profile_course, semester) -> tuple[str, str, str]:
+    # The profile course wins over users.course, and semesters below 1 count
+    # as unknown (""). post_target_rows and student_target_filter match
+    # these keys, so reach, the board and update notices agree on who a post
+    # targets.
+    course = (profile_course or user_course or "").strip().upper()
+    try:
+        semester = int(semester) if semester is not None else None
+    except (TypeError, ValueError):
+        semester = None
+    semester_key = str(semester) if semester is not None and semester >= 1 else ""
+    return course, semester_key, (section or "").strip().upper()
+
+
+def _load_cohort_counts(*criteria) -> Counter:
+    # Active students per distinct (course, section, profile course,
+    # semester) combination, optionally narrowed by criteria on User.
+    rows = (
+        db.session.query(
+            User.course,
+            User.section,
+            StudentAcademicProfile.course_code,
+            StudentAcademicProfile.current_semester,
+            func.count(User.id),
+        )
+        .outerjoin(StudentAcademicProfile, StudentAcademicProfile.user_id == User.id)
+        .filter(User.role == "student", User.is_active.is_(True), *criteria)
+        .group_by(User.course, User.section, StudentAcademicProfile.course_code, StudentAcademicProfile.current_semester)
+        .all()
+    )
+    cohorts = Counter()
+    for user_course, section, profile_course, semester, count in rows:
+        cohorts[_cohort_key(user_course, section, profile_course, semester)] += count
+    return cohorts
+
+
+def student_cohort(user_id: int) -> tuple[str, int | None, str]:
+    # (course, semester, section) to pass to student_target_filter.
+    row = (
+        db.session.query(User.course, User.section, StudentAcademicProfile.course_code, StudentAcademicProfile.current_semester)
+        .outerjoin(StudentAcademicProfile, StudentAcademicProfile.user_id == User.id)
+        .filter(User.id == user_id)
+        .first()
+    )
+    if row is None:
+        return "", None, ""
+    course, semester, section = _cohort_key(*row)
+    return course, int(semester) if semester else None, section
+
+
+def _target_key(post: KnowledgePost):
+    courses, semesters, sections = zip(*post_target_rows(post))
+    return frozenset(courses), frozenset(semesters), frozenset(sections)
+
+
+def _count_reach(cohorts: Counter, target_key) -> int:
+    courses, semesters, sections = target_key
+    return sum(
+        count
+        for (course, semester, section), count in cohorts.items()
+        if (ANY_TARGET in courses or course in courses)
+        and (ANY_TARGET in semesters or semester in semesters)
+        and (ANY_TARGET in sections or section in sections)
+    )
+
+
+# Active-student counts keyed by (course, semester, section), under one key.
+_cohort_index = InvalidatingCache("cohort_index", ttl_seconds=300.0)
+COHORT_INDEX_KEY = "cohorts"
+
+
+def configure_cohort_index(ttl_seconds: float) -> None:
+    _cohort_index.configure(ttl_seconds)
+
+
+def post_reach(post: KnowledgePost) -> int:
+    # How many active students the post's targets cover, from the cohort
+    # index instead of loading every student.
+    return _count_reach(_cohort_index.get_or_compute(COHORT_INDEX_KEY, _load_cohort_counts), _target_key(post))
+
+
+def students_reached(post: KnowledgePost, *criteria) -> int:
+    # Like post_reach, but only over the active students matching criteria
+    # (a handful of cohorts), counted live rather than from the index.
+    return _count_reach(_load_cohort_counts(*criteria), _target_key(post))
+
+
+def _cohort_changed(instance, session) -> bool:
+    columns = COHORT_COLUMNS.get(type(instance))
+    if not columns:
+        return False
+    if instance in session.new or instance in session.deleted:
+        return True
+    state = inspect(instance)
+    return any(state.attrs[column].history.has_changes() for column in columns)
+
+
+def _cohorts_touched(session):
+    if any(_cohort_changed(instance, session) for instance in changed_instances(session)):
+        return ALL_KEYS
+    return None
+
+
+def _bulk_cohorts_touched(orm_execute_state):
+    return ALL_KEYS if bulk_statement_model(orm_execute_state) in COHORT_COLUMNS else None
+
+
+def register_cohort_index_events() -> None:
+    _cohort_index.register_events(_cohorts_touched, _bulk_cohorts_touched)
@@ -0,0 +1,109 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+ALL_KEYS = "*"
+
+
+class InvalidatingCache:
+    """TTL cache whose entries are dropped when a commit changes their rows.
+
+    Each cache collects the keys a flush or a bulk statement touches in
+    ``session.info`` and drops them after the commit. Invalidation is
+    per-process: other workers keep serving their own entries until the TTL
+    runs out, so the TTL is how stale a value can get across workers.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int | None = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._info_key = f"{name}_stale_keys"
+        self._entries = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._collect_flush = None
+        self._collect_bulk = None
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds:
+                return entry[1]
+            generation = self._generation
+
+        value = compute()
+        with self._lock:
+            # A commit that landed while we were computing may already be
+            # stale in `value`; only keep it if nothing was invalidated meanwhile.
+            if generation == self._generation and self.ttl_seconds > 0:
+                if self.max_entries is not None and len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+                self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate(self, keys=ALL_KEYS) -> None:
+        with self._lock:
+            self._generation += 1
+            if keys == ALL_KEYS:
+                self._entries.clear()
+                return
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def configure(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.invalidate()
+
+    def mark_stale(self, session, keys) -> None:
+        # Queues keys (or ALL_KEYS) to drop when the session commits.
+        pending = session.info.get(self._info_key)
+        if pending == ALL_KEYS:
+            return
+        if keys == ALL_KEYS:
+            session.info[self._info_key] = ALL_KEYS
+            return
+        session.info.setdefault(self._info_key, set()).update(keys)
+
+    def register_events(self, collect_flush, collect_bulk) -> None:
+        # collect_flush(session) and collect_bulk(orm_execute_state) return
+        # the keys a flush or a bulk INSERT/UPDATE/DELETE touches: a set, or
+        # ALL_KEYS. Keys from a flush that was later rolled back are dropped
+        # by the next commit as well; dropping a few extra entries is harmless.
+        self._collect_flush = collect_flush
+        self._collect_bulk = collect_bulk
+        if event.contains(Session, "after_commit", self._apply_stale_keys):
+            return
+        event.listen(Session, "after_flush", self._collect_flush_keys)
+        event.listen(Session, "do_orm_execute", self._collect_bulk_keys)
+        event.listen(Session, "after_commit", self._apply_stale_keys)
+
+    def _collect_flush_keys(self, session, flush_context) -> None:
+        if session.info.get(self._info_key) == ALL_KEYS:
+            return
+        keys = self._collect_flush(session)
+        if keys:
+            self.mark_stale(session, keys)
+
+    def _collect_bulk_keys(self, orm_execute_state) -> None:
+        if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        keys = self._collect_bulk(orm_execute_state)
+        if keys:
+            self.mark_stale(orm_execute_state.session, keys)
+
+    def _apply_stale_keys(self, session) -> None:
+        keys = session.info.pop(self._info_key, None)
+        if keys:
+            self.invalidate(keys)
+
+
+def changed_instances(session) -> list:
+    return list(session.new) + list(session.dirty) + list(session.deleted)
+
+
+def bulk_statement_model(orm_execute_state):
+    mapper = orm_execute_state.bind_mapper
+    return mapper.class_ if mapper is not None else None
@@ -0,0 +1,603 @@
+import base64
+import binascii
+import json
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Integer,
+    and_,
+    bindparam,
+    func,
+    literal_column,
+    null,
+    or_,
+    select,
+    text,
+    union,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.sql import column as sql_column, table as sql_table
+
+from invalidating_cache import ALL_KEYS, InvalidatingCache, bulk_statement_model, changed_instances
+from intervention_targets import student_cohort, student_target_filter, students_reached
+from models import (
+    KnowledgeAttachment,
+    KnowledgePost,
+    KnowledgePostRevision,
+    KnowledgePostTag,
+    KnowledgePostTarget,
+    KnowledgeReaction,
+    KnowledgeView,
+    User,
+    db,
+)
+
+
+KNOWLEDGE_TAG_KEYWORDS = {
+    "algorithms": ["algorithm", "dsa", "graph", "dynamic programming", "sorting", "search"],
+    "backtracking": ["backtracking", "n-queen", "subset", "recursive"],
+    "recursion": ["recursion", "recursive", "stack"],
+    "exam-prep": ["exam", "viva", "revision", "question"],
+    "dbms": ["dbms", "database", "sql", "normalization", "transaction"],
+    "normalization": ["1nf", "2nf", "3nf", "bcnf", "normalization"],
+    "software-engineering": ["software engineering", "sdlc", "agile", "testing"],
+    "ci-cd": ["ci/cd", "pipeline", "deployment", "github actions", "gitlab"],
+    "devops": ["devops", "docker", "kubernetes", "container"],
+    "machine-learning": ["machine learning", "ml", "model", "training"],
+    "pytorch": ["pytorch", "tensor", "cuda"],
+    "cuda": ["cuda", "gpu", "nvidia"],
+    "3nf": ["3nf"],
+    "bcnf": ["bcnf"],
+}
+DEFAULT_POST_TAGS = ["study-notes", "student-experience"]
+MAX_POST_TAGS = 5
+# Row changes to these models can change a board's tag counts.
+TAG_COUNT_MODELS = (KnowledgePost, KnowledgePostTag, KnowledgePostTarget)
+TAG_COUNT_CACHE_MAX_ENTRIES = 512
+
+POST_SEARCH_TABLE = "knowledge_posts_fts"
+POST_SEARCH_COLUMNS = ["title", "content", "problem_context", "solution_steps", "outcome_result"]
+# bm25 weights, in POST_SEARCH_COLUMNS order: a title hit counts most.
+POST_SEARCH_WEIGHTS = [8.0, 2.0, 1.0, 1.0, 1.0]
+_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+_post_search_ready = False
+
+
+def attachments_by_post(post_ids) -> dict[int, list[KnowledgeAttachment]]:
+    # One query for every visible post instead of one per card; newest first,
+    # matching the order the per-post queries used.
+    post_ids = list(dict.fromkeys(post_ids or []))
+    grouped = {post_id: [] for post_id in post_ids}
+    if not post_ids:
+        return grouped
+    rows = (
+        KnowledgeAttachment.query.filter(KnowledgeAttachment.post_id.in_(post_ids))
+        .order_by(KnowledgeAttachment.created_at.desc(), KnowledgeAttachment.id.desc())
+        .all()
+    )
+    for attachment in rows:
+        grouped[attachment.post_id].append(attachment)
+    return grouped
+
+
+def extract_post_tags(post: KnowledgePost) -> list[str]:
+    corpus = " ".join(
+        [
+            post.title or "",
+            post.content or "",
+            post.problem_context or "",
+            post.solution_steps or "",
+            post.resource_references or "",
+            post.outcome_result or "",
+        ]
+    ).lower()
+    tags = [label for label, tokens in KNOWLEDGE_TAG_KEYWORDS.items() if any(token in corpus for token in tokens)]
+    return (tags or DEFAULT_POST_TAGS)[:MAX_POST_TAGS]
+
+
+def sync_post_tags(post: KnowledgePost) -> None:
+    wanted = extract_post_tags(post)
+    existing = {row.tag: row for row in post.tags}
+    for row in list(post.tags):
+        if row.tag not in wanted:
+            post.tags.remove(row)
+    for position, tag in enumerate(wanted):
+        row = existing.get(tag)
+        if row is None:
+            post.tags.append(KnowledgePostTag(tag=tag, position=position))
+        else:
+            row.position = position
+
+
+def tags_by_post(post_ids) -> dict[int, list[str]]:
+    post_ids = list(dict.fromkeys(post_ids or []))
+    grouped = {post_id: [] for post_id in post_ids}
+    if not post_ids:
+        return grouped
+    rows = (
+        db.session.query(KnowledgePostTag.post_id, KnowledgePostTag.tag)
+        .filter(KnowledgePostTag.post_id.in_(post_ids))
+        .order_by(KnowledgePostTag.post_id, KnowledgePostTag.position)
+        .all()
+    )
+    for post_id, tag in rows:
+        grouped[post_id].append(tag)
+    return grouped
+
+
+def post_tag_filter(tag: str):
+    return KnowledgePost.id.in_(select(KnowledgePostTag.post_id).where(KnowledgePostTag.tag == tag))
+
+
+def _count_tags(post_query) -> list[tuple[str, int]]:
+    post_ids = post_query.with_entities(KnowledgePost.id).order_by(None).subquery()
+    return (
+        db.session.query(KnowledgePostTag.tag, func.count(KnowledgePostTag.post_id))
+        .filter(KnowledgePostTag.post_id.in_(select(post_ids.c.id)))
+        .group_by(KnowledgePostTag.tag)
+        .order_by(func.count(KnowledgePostTag.post_id).desc(), KnowledgePostTag.tag)
+        .all()
+    )
+
+
+_tag_count_cache = InvalidatingCache("tag_count", ttl_seconds=60.0, max_entries=TAG_COUNT_CACHE_MAX_ENTRIES)
+
+
+def configure_tag_count_cache(ttl_seconds: float) -> None:
+    _tag_count_cache.configure(ttl_seconds)
+
+
+def tag_counts(post_query, cache_key=None) -> list[tuple[str, int]]:
+    # post_query is the board's post query before the tag filter, so the
+    # counts say how many cards each tag would leave. Counting walks every
+    # card on the board, so callers pass a key naming their filters to reuse
+    # the counts until a post, tag or target changes.
+    if cache_key is None:
+        return _count_tags(post_query)
+    return _tag_count_cache.get_or_compute(cache_key, lambda: [tuple(row) for row in _count_tags(post_query)])
+
+
+def _tag_counts_touched(session):
+    if any(isinstance(instance, TAG_COUNT_MODELS) for instance in changed_instances(session)):
+        return ALL_KEYS
+    return None
+
+
+def _bulk_tag_counts_touched(orm_execute_state):
+    return ALL_KEYS if bulk_statement_model(orm_execute_state) in TAG_COUNT_MODELS else None
+
+
+def register_tag_count_events() -> None:
+    _tag_count_cache.register_events(_tag_counts_touched, _bulk_tag_counts_touched)
+
+
+def backfill_post_tags(*, rebuild: bool = False) -> int:
+    # Every saved post has at least one tag, so a post without rows has
+    # never been tagged. rebuild re-tags everything after keyword changes.
+    query = KnowledgePost.query
+    if not rebuild:
+        query = query.filter(~KnowledgePost.tags.any())
+    posts = query.order_by(KnowledgePost.id).all()
+    for post in posts:
+        sync_post_tags(post)
+    if posts:
+        db.session.commit()
+    return len(posts)
+
+
+def ensure_post_search_index() -> bool:
+    # External-content FTS5 table over knowledge_posts; the triggers keep it
+    # in step with every INSERT, UPDATE and DELETE, bulk ones included.
+    global _post_search_ready
+    columns = ", ".join(POST_SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in POST_SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in POST_SEARCH_COLUMNS)
+    exists = db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": POST_SEARCH_TABLE},
+    ).first()
+    try:
+        db.session.execute(
+            text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {POST_SEARCH_TABLE} USING fts5("
+                f"{columns}, content='knowledge_posts', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+        )
+    except OperationalError:
+        db.session.rollback()
+        _post_search_ready = False
+        return False
+    db.session.execute(
+        text(
+            f"CREATE TRIGGER IF NOT EXISTS {POST_SEARCH_TABLE}_ai AFTER INSERT ON knowledge_posts BEGIN "
+            f"INSERT INTO {POST_SEARCH_TABLE}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        )
+    )
+    db.session.execute(
+        text(
+            f"CREATE TRIGGER IF NOT EXISTS {POST_SEARCH_TABLE}_ad AFTER DELETE ON knowledge_posts BEGIN "
+            f"INSERT INTO {POST_SEARCH_TABLE}({POST_SEARCH_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_values}); END"
+        )
+    )
+    db.session.execute(
+        text(
+            f"CREATE TRIGGER IF NOT EXISTS {POST_SEARCH_TABLE}_au AFTER UPDATE OF {columns} ON knowledge_posts BEGIN "
+            f"INSERT INTO {POST_SEARCH_TABLE}({POST_SEARCH_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {POST_SEARCH_TABLE}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        )
+    )
+    if not exists:
+        db.session.execute(text(f"INSERT INTO {POST_SEARCH_TABLE}({POST_SEARCH_TABLE}) VALUES ('rebuild')"))
+    db.session.commit()
+    _post_search_ready = True
+    return True
+
+
+def post_search_expression(search: str) -> str:
+    # Every word must match, each as a prefix: "norm sql" finds
+    # "normalization" in a post that also mentions SQL.
+    tokens = _SEARCH_TOKEN.findall(search or "")
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def post_search(search: str):
+    # Returns a (post_id, rank) subquery for the board queries to join on.
+    # It holds posts whose text matches through the index, ranked by bm25
+    # (lower is better), and posts whose faculty author's name contains the
+    # search, with a NULL rank unless their text matched too. Joining the
+    # small match set lets SQLite start from it instead of scanning posts.
+    needle = (search or "").strip().lower()
+    author_posts = select(KnowledgePost.id.label("post_id"), null().label("rank")).where(
+        KnowledgePost.author_id.in_(
+            select(User.id).where(
+                User.role == "faculty",
+                func.lower(User.full_name).contains(needle, autoescape=True),
+            )
+        )
+    )
+    expression = post_search_expression(search)
+    if _post_search_ready and expression:
+        index = literal_column(POST_SEARCH_TABLE)
+        text_posts = (
+            select(
+                literal_column("rowid").label("post_id"),
+                func.bm25(index, *POST_SEARCH_WEIGHTS).label("rank"),
+            )
+            .select_from(text(POST_SEARCH_TABLE))
+            .where(index.op("MATCH")(expression))
+        )
+    else:
+        text_posts = select(KnowledgePost.id.label("post_id"), null().label("rank")).where(
+            func.lower(KnowledgePost.title).contains(needle, autoescape=True)
+        )
+    hits = union_all(text_posts, author_posts).subquery()
+    return (
+        select(hits.c.post_id, func.min(hits.c.rank).label("rank"))
+        .group_by(hits.c.post_id)
+        .subquery("search_hits")
+    )
+
+
+# Stored counters kept in step with knowledge_reactions, keyed by reaction type.
+REACTION_COUNTERS = {"like": "like_count", "bookmark": "bookmark_count"}
+POST_COUNTER_COLUMNS = ("like_count", "bookmark_count", "open_count")
+
+
+def post_reaction_rank():
+    # The "most upvoted" score: two points per like, one per bookmark. The
+    # literal 2 (not a bound parameter) keeps the expression identical to
+    # ix_knowledge_posts_status_rank so SQLite can read the order off it.
+    return KnowledgePost.like_count * literal_column("2") + KnowledgePost.bookmark_count
+
+
+def bump_post_counter(column: str, deltas) -> None:
+    # deltas maps post id -> change. Runs in the caller's transaction, so the
+    # counter commits or rolls back with the reaction or view row it counts.
+    deltas = {post_id: delta for post_id, delta in dict(deltas).items() if delta}
+    if not deltas:
+        return
+    table = KnowledgePost.__table__
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("counter_post_id"))
+        .values(
+            {
+                column: func.max(table.c[column] + bindparam("counter_delta"), 0),
+                # A new like or view is not an edit of the post.
+                "updated_at": table.c.updated_at,
+            }
+        )
+    )
+    db.session.execute(
+        statement,
+        [{"counter_post_id": post_id, "counter_delta": delta} for post_id, delta in sorted(deltas.items())],
+    )
+
+
+def _counted_rows(query) -> dict[int, int]:
+    return {post_id: count for post_id, count in query.all()}
+
+
+def post_counter_drift(post_ids=None) -> list[tuple[int, str, int, int]]:
+    # (post id, column, stored value, counted value) for every stored counter
+    # that disagrees with the reaction and view rows.
+    def _scoped(query, column):
+        return query.filter(column.in_(post_ids)) if post_ids is not None else query
+
+    counted = {
+        "like_count": _counted_rows(
+            _scoped(db.session.query(KnowledgeReaction.post_id, func.count(KnowledgeReaction.id)), KnowledgeReaction.post_id)
+            .filter(KnowledgeReaction.reaction_type == "like")
+            .group_by(KnowledgeReaction.post_id)
+        ),
+        "bookmark_count": _counted_rows(
+            _scoped(db.session.query(KnowledgeReaction.post_id, func.count(KnowledgeReaction.id)), KnowledgeReaction.post_id)
+            .filter(KnowledgeReaction.reaction_type == "bookmark")
+            .group_by(KnowledgeReaction.post_id)
+        ),
+        "open_count": _counted_rows(
+            _scoped(db.session.query(KnowledgeView.post_id, func.count(KnowledgeView.id)), KnowledgeView.post_id)
+            .group_by(KnowledgeView.post_id)
+        ),
+    }
+    stored = _scoped(
+        db.session.query(KnowledgePost.id, *[getattr(KnowledgePost, column) for column in POST_COUNTER_COLUMNS]),
+        KnowledgePost.id,
+    ).order_by(KnowledgePost.id)
+    drift = []
+    for post_id, *values in stored.all():
+        for column, value in zip(POST_COUNTER_COLUMNS, values):
+            actual = counted[column].get(post_id, 0)
+            if value != actual:
+                drift.append((post_id, column, value, actual))
+    return drift
+
+
+def reconcile_post_counters(post_ids=None) -> list[tuple[int, str, int, int]]:
+    # Rewrites drifted counters from the reaction and view rows and returns
+    # what was fixed, in post_counter_drift's shape.
+    drift = post_counter_drift(post_ids)
+    for column in POST_COUNTER_COLUMNS:
+        bump_post_counter(column, {post_id: actual - value for post_id, name, value, actual in drift if name == column})
+    if drift:
+        db.session.commit()
+    return drift
+
+
+def board_order_keys(posts_query, sort_by: str, search_hits=None):
+    # Returns the query (joined to whatever the order needs) and the
+    # (expression, descending) keys. Every order ends in the post id, so the
+    # keys are unique and a cursor always points between two rows.
+    newest = [(KnowledgePost.created_at, True), (KnowledgePost.id, True)]
+    if sort_by == "oldest":
+        return posts_query, [(KnowledgePost.created_at, False), (KnowledgePost.id, False)]
+    if sort_by == "relevance" and search_hits is not None:
+        # Author-only matches have no bm25 score; 0 sorts them after every
+        # text match, whose scores are negative.
+        return posts_query, [(func.coalesce(search_hits.c.rank, 0.0), False)] + newest
+    if sort_by == "most_upvoted":
+        return posts_query, [(post_reaction_rank(), True)] + newest
+    return posts_query, newest
+
+
+def encode_board_cursor(sort_by: str, values) -> str:
+    payload = [sort_by] + [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_board_cursor(cursor: str, sort_by: str, key_count: int):
+    # A cursor from another sort order, or one that does not parse, starts
+    # the board from the top instead of failing the request.
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        if not isinstance(payload, list) or payload[:1] != [sort_by] or len(payload) != key_count + 1:
+            return None
+        values = []
+        for value in payload[1:]:
+            if isinstance(value, dict):
+                value = datetime.fromisoformat(value["dt"])
+            elif not isinstance(value, (int, float)) or isinstance(value, bool):
+                return None
+            values.append(value)
+        return values
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _after_keys(order_keys, values):
+    clauses = []
+    for position, (expression, descending) in enumerate(order_keys):
+        earlier = [order_keys[index][0] == values[index] for index in range(position)]
+        step = expression < values[position] if descending else expression > values[position]
+        clauses.append(and_(*earlier, step))
+    return or_(*clauses)
+
+
+def keyset_page(posts_query, order_keys, after, per_page: int):
+    # Fetches one page past `after` (the keys of the last row already shown)
+    # and returns (posts, keys of the last post or None on the last page).
+    if after is not None:
+        posts_query = posts_query.filter(_after_keys(order_keys, after))
+    rows = (
+        posts_query.add_columns(*[expression.label(f"order_key_{index}") for index, (expression, _) in enumerate(order_keys)])
+        .order_by(*[expression.desc() if descending else expression.asc() for expression, descending in order_keys])
+        .limit(per_page + 1)
+        .all()
+    )
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    posts = [row[0] for row in rows]
+    return posts, list(rows[-1][1:]) if has_more else None
+
+
+UNREAD_UPDATES_LIMIT = 12
+LEGACY_NOTIFICATIONS_TABLE = "knowledge_notifications"
+
+
+def record_post_revision(post: KnowledgePost, revised_at: datetime | None = None) -> None:
+    # One row per edit, whoever has engaged with the post; students pick it
+    # up from unread_post_updates the next time their board loads.
+    db.session.add(KnowledgePostRevision(post_id=post.id, revised_at=revised_at or datetime.utcnow()))
+
+
+def _engaged_before_revision(user_id: int):
+    # The student had opened or bookmarked the post by the time it was
+    # edited; both probes hit the (post_id, user_id, ...) unique indexes.
+    viewed = (
+        select(KnowledgeView.id)
+        .where(
+            KnowledgeView.post_id == KnowledgePostRevision.post_id,
+            KnowledgeView.user_id == user_id,
+            KnowledgeView.first_opened_at <= KnowledgePostRevision.revised_at,
+        )
+        .exists()
+    )
+    bookmarked = (
+        select(KnowledgeReaction.id)
+        .where(
+            KnowledgeReaction.post_id == KnowledgePostRevision.post_id,
+            KnowledgeReaction.user_id == user_id,
+            KnowledgeReaction.reaction_type == "bookmark",
+            KnowledgeReaction.created_at <= KnowledgePostRevision.revised_at,
+        )
+        .exists()
+    )
+    return or_(viewed, bookmarked)
+
+
+def _unread_updates_query(user_id: int, seen_at, seen_revision_id, *columns):
+    # Walks ix_knowledge_post_revisions_revised from the user's (revised at,
+    # revision id) watermark; a user who has never loaded the board has no
+    # watermark yet, and one without a revision id has seen every revision
+    # up to seen_at.
+    query = (
+        db.session.query(*columns)
+        .select_from(KnowledgePostRevision)
+        .join(KnowledgePost, KnowledgePost.id == KnowledgePostRevision.post_id)
+        .filter(
+            KnowledgePost.status == "published",
+            _engaged_before_revision(user_id),
+            # Only posts that still target the student, as when edits wrote
+            # one notification per targeted, engaged student.
+            student_target_filter(*student_cohort(user_id)),
+        )
+    )
+    if seen_at is not None:
+        newer = KnowledgePostRevision.revised_at > seen_at
+        if seen_revision_id is not None:
+            newer = or_(
+                newer,
+                and_(KnowledgePostRevision.revised_at == seen_at, KnowledgePostRevision.id > seen_revision_id),
+            )
+        query = query.filter(newer)
+    return query
+
+
+def unread_post_updates(
+    user_id: int, seen_at, seen_revision_id=None, limit: int = UNREAD_UPDATES_LIMIT
+) -> list[tuple[int, str, datetime, int]]:
+    # (post id, post title, revised at, revision id) for the oldest `limit`
+    # unread revisions, returned newest first. Taking the oldest means moving
+    # the watermark to the first row never skips an unread revision that was
+    # not shown, even one sharing its timestamp; the rest follow on the next
+    # load.
+    rows = [
+        tuple(row)
+        for row in _unread_updates_query(
+            user_id,
+            seen_at,
+            seen_revision_id,
+            KnowledgePostRevision.post_id,
+            KnowledgePost.title,
+            KnowledgePostRevision.revised_at,
+            KnowledgePostRevision.id,
+        )
+        .order_by(KnowledgePostRevision.revised_at.asc(), KnowledgePostRevision.id.asc())
+        .limit(limit)
+        .all()
+    ]
+    return rows[::-1]
+
+
+def unread_post_update_count(user_id: int, seen_at, seen_revision_id=None) -> int:
+    return _unread_updates_query(user_id, seen_at, seen_revision_id, func.count(KnowledgePostRevision.id)).scalar() or 0
+
+
+def engaged_student_count(post: KnowledgePost) -> int:
+    # Active students the post still targets who have opened or bookmarked
+    # it, i.e. who will see its next revision as an update.
+    readers = union(
+        select(KnowledgeView.user_id.label("user_id")).where(KnowledgeView.post_id == post.id),
+        select(KnowledgeReaction.user_id.label("user_id")).where(
+            KnowledgeReaction.post_id == post.id,
+            KnowledgeReaction.reaction_type == "bookmark",
+        ),
+    ).subquery()
+    return students_reached(post, User.id.in_(select(readers.c.user_id)))
+
+
+def migrate_legacy_notifications() -> int:
+    # Edits used to write one knowledge_notifications row per engaged student.
+    # Fold those rows into revisions and watermarks once, then drop the table.
+    exists = db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": LEGACY_NOTIFICATIONS_TABLE},
+    ).first()
+    if not exists:
+        return 0
+
+    legacy = sql_table(
+        LEGACY_NOTIFICATIONS_TABLE,
+        sql_column("post_id", Integer),
+        sql_column("user_id", Integer),
+        sql_column("is_read", Boolean),
+        sql_column("created_at", DateTime),
+    )
+    # Every row of one edit shares its timestamp, so each distinct
+    # (post, timestamp) pair is one revision.
+    edits = db.session.execute(
+        select(legacy.c.post_id, legacy.c.created_at)
+        .join(KnowledgePost.__table__, KnowledgePost.__table__.c.id == legacy.c.post_id)
+        .distinct()
+    ).all()
+    for post_id, revised_at in edits:
+        db.session.add(KnowledgePostRevision(post_id=post_id, revised_at=revised_at))
+
+    # Everything before the migration counts as seen, except rows still
+    # unread: those users start just before their oldest unread update.
+    now = datetime.utcnow()
+    db.session.execute(
+        update(User.__table__)
+        .where(User.__table__.c.knowledge_updates_seen_at.is_(None))
+        .values(knowledge_updates_seen_at=now)
+    )
+    unread = db.session.execute(
+        select(legacy.c.user_id, func.min(legacy.c.created_at))
+        .where(legacy.c.is_read.is_(False))
+        .group_by(legacy.c.user_id)
+    ).all()
+    for user_id, oldest_unread in unread:
+        db.session.execute(
+            update(User.__table__)
+            .where(User.__table__.c.id == user_id)
+            .values(knowledge_updates_seen_at=oldest_unread - timedelta(microseconds=1))
+        )
+
+    db.session.execute(text(f"DROP TABLE {LEGACY_NOTIFICATIONS_TABLE}"))
+    db.session.commit()
+    return len(edits)
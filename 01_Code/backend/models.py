@@ -27,6 +27,9 @@ class User(db.Model):
 	is_active = db.Column(db.Boolean, default=True, nullable=False)
 	first_login_at = db.Column(db.DateTime, nullable=True)
 	last_login_at = db.Column(db.DateTime, nullable=True)
+	knowledge_updates_seen_at = db.Column(db.DateTime, nullable=True)
+	# Breaks ties between revisions committed with the same timestamp.
+	knowledge_updates_seen_revision_id = db.Column(db.Integer, nullable=True)
 	created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
 	submitted_feedback = db.relationship(
@@ -43,7 +46,6 @@ class User(db.Model):
 	)
 	authored_posts = db.relationship("KnowledgePost", back_populates="author", lazy="dynamic")
 	knowledge_reactions = db.relationship("KnowledgeReaction", back_populates="user", lazy="dynamic")
-	knowledge_notifications = db.relationship("KnowledgeNotification", back_populates="user", lazy="dynamic")
 	knowledge_views = db.relationship("KnowledgeView", back_populates="user", lazy="dynamic")
 	created_checklists = db.relationship(
 		"Checklist",
@@ -96,6 +98,8 @@ class Feedback(db.Model):
 	class_session_at = db.Column(db.DateTime, nullable=True, default=datetime.utcnow)
 	feedback_text = db.Column(db.Text, nullable=False)
 	sentiment = db.Column(db.String(20), nullable=False)
+	sentiment_confidence = db.Column(db.Integer, nullable=False, default=0)
+	sentiment_version = db.Column(db.Integer, nullable=False, default=0)
 	status = db.Column(db.String(30), nullable=False)
 	admin_note = db.Column(db.Text, nullable=True)
 	student_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -114,6 +118,16 @@ class Feedback(db.Model):
 
 class KnowledgePost(db.Model):
 	__tablename__ = "knowledge_posts"
+	__table_args__ = (
+		db.Index("ix_knowledge_posts_status_created", "status", "created_at", "id"),
+		db.Index(
+			"ix_knowledge_posts_status_rank",
+			"status",
+			db.text("(like_count * 2 + bookmark_count)"),
+			"created_at",
+			"id",
+		),
+	)
 
 	id = db.Column(db.Integer, primary_key=True)
 	title = db.Column(db.String(180), nullable=False)
@@ -130,7 +144,10 @@ class KnowledgePost(db.Model):
 	published_at = db.Column(db.DateTime, nullable=True)
 	updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 	revision_count = db.Column(db.Integer, nullable=False, default=0)
-	author_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+	like_count = db.Column(db.Integer, nullable=False, default=0)
+	bookmark_count = db.Column(db.Integer, nullable=False, default=0)
+	open_count = db.Column(db.Integer, nullable=False, default=0)
+	author_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
 	created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
 	author = db.relationship("User", back_populates="authored_posts")
@@ -146,8 +163,8 @@ class KnowledgePost(db.Model):
 		lazy="dynamic",
 		cascade="all, delete-orphan",
 	)
-	notifications = db.relationship(
-		"KnowledgeNotification",
+	revisions = db.relationship(
+		"KnowledgePostRevision",
 		back_populates="post",
 		lazy="dynamic",
 		cascade="all, delete-orphan",
@@ -158,6 +175,54 @@ class KnowledgePost(db.Model):
 		lazy="dynamic",
 		cascade="all, delete-orphan",
 	)
+	targets = db.relationship(
+		"KnowledgePostTarget",
+		back_populates="post",
+		cascade="all, delete-orphan",
+	)
+	tags = db.relationship(
+		"KnowledgePostTag",
+		back_populates="post",
+		cascade="all, delete-orphan",
+		order_by="KnowledgePostTag.position",
+	)
+
+
+class KnowledgePostTarget(db.Model):
+	__tablename__ = "knowledge_post_targets"
+
+	# One row per (course, semester, section) combination a post targets;
+	# "*" stands for "any" in that column.
+	id = db.Column(db.Integer, primary_key=True)
+	post_id = db.Column(db.Integer, db.ForeignKey("knowledge_posts.id"), nullable=False)
+	course = db.Column(db.String(16), nullable=False, default="*")
+	semester = db.Column(db.String(16), nullable=False, default="*")
+	section = db.Column(db.String(16), nullable=False, default="*")
+
+	post = db.relationship("KnowledgePost", back_populates="targets")
+
+	__table_args__ = (
+		db.UniqueConstraint("post_id", "course", "semester", "section", name="uq_knowledge_post_target"),
+		db.Index("ix_knowledge_post_targets_match", "course", "semester", "section", "post_id"),
+	)
+
+
+class KnowledgePostTag(db.Model):
+	__tablename__ = "knowledge_post_tags"
+
+	# Computed from the post text when it is saved; position keeps the
+	# order the tags are shown in.
+	id = db.Column(db.Integer, primary_key=True)
+	post_id = db.Column(db.Integer, db.ForeignKey("knowledge_posts.id"), nullable=False)
+	tag = db.Column(db.String(40), nullable=False)
+	position = db.Column(db.Integer, nullable=False, default=0)
+
+	post = db.relationship("KnowledgePost", back_populates="tags")
+
+	__table_args__ = (
+		db.UniqueConstraint("post_id", "tag", name="uq_knowledge_post_tag"),
+		db.Index("ix_knowledge_post_tags_tag", "tag", "post_id"),
+	)
 
 
 class KnowledgeAttachment(db.Model):
@@ -166,12 +231,28 @@ class KnowledgeAttachment(db.Model):
 	id = db.Column(db.Integer, primary_key=True)
 	post_id = db.Column(db.Integer, db.ForeignKey("knowledge_posts.id"), nullable=False)
 	file_name = db.Column(db.String(255), nullable=False)
-	file_path = db.Column(db.String(400), nullable=False)
+	storage_key = db.Column(db.String(400), nullable=False)
 	file_ext = db.Column(db.String(20), nullable=False)
 	file_size = db.Column(db.Integer, nullable=False, default=0)
+	blob_id = db.Column(db.Integer, db.ForeignKey("stored_blobs.id"), nullable=True, index=True)
 	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 	post = db.relationship("KnowledgePost", back_populates="attachments")
+	blob = db.relationship("StoredBlob")
+
+
+class StoredBlob(db.Model):
+	__tablename__ = "stored_blobs"
+
+	# One uploaded file, stored once under its SHA-256 however many
+	# intervention attachments and checklist groups use it. ref_count is the
+	# number of those uses; the file goes when it drops to zero.
+	id = db.Column(db.Integer, primary_key=True)
+	sha256 = db.Column(db.String(64), nullable=False, unique=True)
+	storage_key = db.Column(db.String(400), nullable=False)
+	size = db.Column(db.Integer, nullable=False, default=0)
+	ref_count = db.Column(db.Integer, nullable=False, default=0)
+	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 
 class KnowledgeReaction(db.Model):
@@ -191,18 +272,21 @@ class KnowledgeReaction(db.Model):
 	)
 
 
-class KnowledgeNotification(db.Model):
-	__tablename__ = "knowledge_notifications"
+class KnowledgePostRevision(db.Model):
+	__tablename__ = "knowledge_post_revisions"
 
+	# One row per edit of a published post. Students read their unread
+	# updates off these rows and the users.knowledge_updates_seen_at /
+	# knowledge_updates_seen_revision_id watermark.
 	id = db.Column(db.Integer, primary_key=True)
 	post_id = db.Column(db.Integer, db.ForeignKey("knowledge_posts.id"), nullable=False)
-	user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-	message = db.Column(db.String(300), nullable=False)
-	is_read = db.Column(db.Boolean, nullable=False, default=False)
-	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+	revised_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+	post = db.relationship("KnowledgePost", back_populates="revisions")
 
-	post = db.relationship("KnowledgePost", back_populates="notifications")
-	user = db.relationship("User", back_populates="knowledge_notifications")
+	__table_args__ = (
+		db.Index("ix_knowledge_post_revisions_revised", "revised_at", "post_id"),
+	)
 
 
 class KnowledgeView(db.Model):
@@ -222,6 +306,55 @@ class KnowledgeView(db.Model):
 	)
 
 
+class ChecklistGroup(db.Model):
+	__tablename__ = "checklist_groups"
+
+	id = db.Column(db.Integer, primary_key=True)
+	group_key = db.Column(db.String(64), unique=True, nullable=False)
+	faculty_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+	title = db.Column(db.String(180), nullable=False)
+	description = db.Column(db.Text, nullable=True)
+	subject = db.Column(db.String(180), nullable=False, default="No specific subject")
+	category = db.Column(db.String(80), nullable=False, default="General")
+	priority = db.Column(db.String(20), nullable=False, default="medium")
+	due_date = db.Column(db.Date, nullable=True)
+	target_course = db.Column(db.String(20), nullable=False, default="BOTH")
+	target_semester = db.Column(db.String(20), nullable=False, default="all")
+	target_section = db.Column(db.String(20), nullable=False, default="all")
+	attachment = db.Column(db.Text, nullable=True)
+	task_count = db.Column(db.Integer, nullable=False, default=0)
+	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+	updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+	faculty = db.relationship("User", foreign_keys=[faculty_id])
+	tasks = db.relationship(
+		"ChecklistTask",
+		back_populates="group",
+		order_by="ChecklistTask.position",
+		cascade="all, delete-orphan",
+	)
+	assignments = db.relationship("Checklist", back_populates="group", lazy="dynamic")
+
+	__table_args__ = (
+		db.Index("ix_checklist_groups_faculty_created", "faculty_id", "created_at"),
+	)
+
+
+class ChecklistTask(db.Model):
+	__tablename__ = "checklist_tasks"
+
+	id = db.Column(db.Integer, primary_key=True)
+	group_id = db.Column(db.Integer, db.ForeignKey("checklist_groups.id"), nullable=False)
+	position = db.Column(db.Integer, nullable=False)
+	text = db.Column(db.String(255), nullable=False)
+
+	group = db.relationship("ChecklistGroup", back_populates="tasks")
+
+	__table_args__ = (
+		db.UniqueConstraint("group_id", "position", name="uq_checklist_task_position"),
+	)
+
+
 class Checklist(db.Model):
 	__tablename__ = "checklists"
 
@@ -230,11 +363,31 @@ class Checklist(db.Model):
 	description = db.Column(db.Text, nullable=True)
 	is_completed = db.Column(db.Boolean, default=False, nullable=False)
 	faculty_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-	student_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+	student_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+	group_id = db.Column(db.Integer, db.ForeignKey("checklist_groups.id"), nullable=True)
+	# Bit i set means task position i is done for this student.
+	completed_mask = db.Column(db.Integer, nullable=False, default=0)
+	completion_locked = db.Column(db.Boolean, nullable=False, default=False)
+	# Bumped on every write; ORM updates check it, bulk updates increment it.
+	version = db.Column(db.Integer, nullable=False, default=0)
 	created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
 	faculty = db.relationship("User", back_populates="created_checklists", foreign_keys=[faculty_id])
 	student = db.relationship("User", back_populates="student_checklists", foreign_keys=[student_id])
+	group = db.relationship("ChecklistGroup", back_populates="assignments")
+
+	__mapper_args__ = {"version_id_col": version}
+
+	# Covers the per-group progress aggregation without touching the table.
+	__table_args__ = (
+		db.Index(
+			"ix_checklists_group_progress",
+			"group_id",
+			"is_completed",
+			"completed_mask",
+			"completion_locked",
+		),
+	)
 
 
 class ModerationLog(db.Model):
@@ -429,6 +582,7 @@ class StudentExperience(db.Model):
 	resource_links = db.Column(db.Text, nullable=True)
 	sentiment = db.Column(db.String(20), nullable=False, default="neutral")
 	sentiment_confidence = db.Column(db.Integer, nullable=False, default=0)
+	sentiment_version = db.Column(db.Integer, nullable=False, default=0)
 	status = db.Column(db.String(20), nullable=False, default="pending")
 	admin_note = db.Column(db.Text, nullable=True)
 	upvote_count = db.Column(db.Integer, nullable=False, default=0)
@@ -506,6 +660,7 @@ class PendingFacultyFeedback(db.Model):
 	feedback_text = db.Column(db.Text, nullable=False)
 	sentiment = db.Column(db.String(20), nullable=False)
 	sentiment_confidence = db.Column(db.Integer, nullable=False, default=0)
+	sentiment_version = db.Column(db.Integer, nullable=False, default=0)
 	status = db.Column(db.String(30), nullable=False, default="holding")
 	admin_note = db.Column(db.Text, nullable=True)
 	created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
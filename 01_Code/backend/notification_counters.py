@@ -0,0 +1,154 @@
+from sqlalchemy import func, inspect
+
+from invalidating_cache import ALL_KEYS, InvalidatingCache, bulk_statement_model, changed_instances
+from knowledge_store import unread_post_update_count
+from models import (
+    Checklist,
+    ExperienceReport,
+    Feedback,
+    KnowledgePostRevision,
+    KnowledgePostTarget,
+    KnowledgeReaction,
+    PendingFacultyFeedback,
+    SemesterMismatchRequest,
+    StudentAcademicProfile,
+    StudentExperience,
+    User,
+    WebsiteFeedback,
+    db,
+)
+
+
+ADMIN_SCOPE = ("admin", None)
+ALL_SCOPES = ALL_KEYS
+# Execution option for bulk statements whose caller names the badges they
+# touch with mark_badges_stale instead of dropping every badge.
+SCOPES_DECLARED = "notification_scopes_declared"
+
+# Which cached badges a row change can affect, as (role, owner attribute)
+# pairs; an owner of None means the single shared admin badge, and ALL_SCOPES
+# drops every badge (a revision or retarget can reach any student who engaged
+# with the post).
+_SCOPE_RULES = {
+    WebsiteFeedback: (("admin", None),),
+    SemesterMismatchRequest: (("admin", None),),
+    StudentExperience: (("admin", None),),
+    ExperienceReport: (("admin", None),),
+    PendingFacultyFeedback: (("admin", None),),
+    Feedback: (("admin", None), ("student", "student_id"), ("faculty", "faculty_id")),
+    Checklist: (("student", "student_id"), ("faculty", "faculty_id")),
+    KnowledgePostRevision: ALL_SCOPES,
+    KnowledgePostTarget: ALL_SCOPES,
+    KnowledgeReaction: (("student", "user_id"),),
+    User: (("student", "id"),),
+    StudentAcademicProfile: (("student", "user_id"),),
+}
+
+
+def _admin_counts() -> dict:
+    counts = {
+        "unread_suggestions_count": WebsiteFeedback.query.filter_by(is_read=False).count(),
+        "pending_semester_exceptions_count": SemesterMismatchRequest.query.filter_by(status="pending").count(),
+        "moderation_queue_count": Feedback.query.filter_by(status="under_review").count(),
+        "pending_experience_moderation_count": StudentExperience.query.filter_by(status="pending").count(),
+        "open_experience_reports_count": ExperienceReport.query.filter_by(status="open").count(),
+        "pending_faculty_feedback_count": PendingFacultyFeedback.query.filter(
+            PendingFacultyFeedback.status.in_(["holding", "under_review"])
+        ).count(),
+    }
+    counts["role_notification_badge_count"] = sum(counts.values())
+    return counts
+
+
+def _student_counts(user_id: int) -> dict:
+    feedback_updates_count = Feedback.query.filter(
+        Feedback.student_id == user_id,
+        Feedback.status.in_(["approved", "request_edit", "rejected"]),
+    ).count()
+    pending_checklist_count = Checklist.query.filter_by(student_id=user_id, is_completed=False).count()
+    watermark = (
+        db.session.query(User.knowledge_updates_seen_at, User.knowledge_updates_seen_revision_id)
+        .filter(User.id == user_id)
+        .first()
+    )
+    intervention_updates_count = unread_post_update_count(user_id, *watermark) if watermark else 0
+    return {
+        "role_notification_badge_count": feedback_updates_count + pending_checklist_count + intervention_updates_count,
+    }
+
+
+def _faculty_counts(user_id: int) -> dict:
+    approved_feedback_count = Feedback.query.filter_by(faculty_id=user_id, status="approved").count()
+    active_checklists_count = (
+        Checklist.query.with_entities(func.count(func.distinct(Checklist.group_id)))
+        .filter(Checklist.faculty_id == user_id, Checklist.is_completed.is_(False))
+        .scalar()
+    ) or 0
+    return {"role_notification_badge_count": approved_feedback_count + active_checklists_count}
+
+
+_badge_cache = InvalidatingCache("notification_counter", ttl_seconds=30.0)
+
+
+def configure_notification_counters(ttl_seconds: float) -> None:
+    _badge_cache.configure(ttl_seconds)
+
+
+def notification_badge_counts(role: str, user_id: int) -> dict:
+    if role == "admin":
+        return _badge_cache.get_or_compute(ADMIN_SCOPE, _admin_counts)
+    if role == "student":
+        return _badge_cache.get_or_compute(("student", user_id), lambda: _student_counts(user_id))
+    if role == "faculty":
+        return _badge_cache.get_or_compute(("faculty", user_id), lambda: _faculty_counts(user_id))
+    return {}
+
+
+def _owner_values(instance, attribute: str) -> set:
+    # Include the pre-update value so reassigning a row refreshes both owners.
+    # Read loaded state only; touching an expired attribute here would emit SQL mid-flush.
+    state = inspect(instance)
+    history = state.attrs[attribute].history
+    values = set(history.added or ()) | set(history.deleted or ()) | set(history.unchanged or ())
+    values.add(state.dict.get(attribute))
+    values.discard(None)
+    return values
+
+
+def _collect_scopes(session):
+    scopes = set()
+    for instance in changed_instances(session):
+        if isinstance(instance, User) and instance in session.deleted:
+            return ALL_SCOPES
+        rules = _SCOPE_RULES.get(type(instance))
+        if not rules:
+            continue
+        if rules == ALL_SCOPES:
+            return ALL_SCOPES
+        for role, attribute in rules:
+            if attribute is None:
+                scopes.add((role, None))
+                continue
+            owner_ids = _owner_values(instance, attribute)
+            if not owner_ids:
+                # Owner column expired and unloaded; fall back to dropping every badge.
+                return ALL_SCOPES
+            for owner_id in owner_ids:
+                scopes.add((role, owner_id))
+    return scopes
+
+
+def mark_badges_stale(scopes) -> None:
+    _badge_cache.mark_stale(db.session, scopes)
+
+
+def _collect_bulk_scopes(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE statements skip the unit of work, so drop every
+    # badge unless the caller declared the affected ones.
+    if orm_execute_state.execution_options.get(SCOPES_DECLARED):
+        return None
+    return ALL_SCOPES if bulk_statement_model(orm_execute_state) in _SCOPE_RULES else None
+
+
+def register_notification_counter_events() -> None:
+    _badge_cache.register_events(_collect_scopes, _collect_bulk_scopes)
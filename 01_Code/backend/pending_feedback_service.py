@@ -35,6 +35,8 @@ def release_held_feedback_for_faculty(faculty_user) -> int:
             class_session_at=row.class_session_at,
             feedback_text=row.feedback_text,
             sentiment=row.sentiment,
+            sentiment_confidence=row.sentiment_confidence,
+            sentiment_version=row.sentiment_version,
             status="approved",
             admin_note=row.admin_note,
         )
@@ -23,7 +23,7 @@ from models import (
 	db,
 )
 from models import ExperienceReport, StudentExperience
-from routes.auth import SECURITY_QUESTIONS, login_required, role_required
+from routes.auth import SECURITY_QUESTIONS, current_user, login_required, role_required
 
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
@@ -1277,7 +1277,7 @@ def updates_live():
 @login_required
 @role_required("admin")
 def profile_settings():
-	admin_user = User.query.get(session["user_id"])
+	admin_user = current_user()
 	if not admin_user:
 		flash("Admin account not found.", "danger")
 		return redirect(url_for("auth.logout"))
@@ -1359,7 +1359,7 @@ def profile_settings():
 @login_required
 @role_required("admin")
 def profile_settings_live():
-	admin_user = User.query.get(session["user_id"])
+	admin_user = current_user()
 	if not admin_user:
 		return jsonify({"error": "not_found"}), 404
 
@@ -0,0 +1,140 @@
+import mimetypes
+from datetime import timezone
+
+from flask import Blueprint, Response, abort, request, session
+from werkzeug.http import is_resource_modified
+
+from attachment_store import checklist_attachment_key
+from checklist_store import load_attachment
+from models import Checklist, KnowledgeAttachment, KnowledgePost, StoredBlob, db
+from routes.auth import login_required
+from storage_backends import StorageError, attachment_storage
+
+
+attachments_bp = Blueprint("attachments", __name__, url_prefix="/attachments")
+
+# Types a browser may render in place; anything else is always a download.
+INLINE_MIMETYPES = {
+	"application/pdf",
+	"image/png",
+	"image/jpeg",
+	"text/plain",
+	"text/csv",
+}
+
+
+def _utc(value):
+	if value.tzinfo is None:
+		value = value.replace(tzinfo=timezone.utc)
+	return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _stream_from(first_chunk: bytes, chunks):
+	try:
+		yield first_chunk
+		yield from chunks
+	finally:
+		chunks.close()
+
+
+def _stored_file_response(storage_key: str, file_name: str, *, blob=None):
+	# Blobs are content-addressed, so their SHA-256 is a strong validator and
+	# the row already knows the size: revalidations never reach the storage
+	# backend. Attachments older than the blob store ask it.
+	if blob is not None:
+		storage_key = blob.storage_key
+		size = blob.size
+		etag = blob.sha256
+		last_modified = _utc(blob.created_at)
+	else:
+		stored = attachment_storage().stat(storage_key)
+		if stored is None:
+			abort(404)
+		size = stored.size
+		etag = stored.etag
+		last_modified = _utc(stored.last_modified)
+
+	mimetype = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+	disposition = "inline"
+	if request.args.get("download") == "1" or mimetype not in INLINE_MIMETYPES:
+		disposition = "attachment"
+
+	response = Response(mimetype=mimetype)
+	response.set_etag(etag)
+	response.last_modified = last_modified
+	response.accept_ranges = "bytes"
+	response.headers["Cache-Control"] = "private, no-cache"
+	response.headers["X-Content-Type-Options"] = "nosniff"
+	response.headers.set("Content-Disposition", disposition, filename=file_name)
+
+	if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+		response.status_code = 304
+		return response
+
+	start, stop = 0, size
+	byte_range = request.range
+	if byte_range is not None and byte_range.units == "bytes" and len(byte_range.ranges) == 1:
+		# A stale If-Range means the client's partial copy is outdated: send
+		# the whole file instead of a slice of the new one.
+		if_range = request.if_range
+		fresh = (if_range.etag is None or if_range.etag == etag) and (
+			if_range.date is None or last_modified <= _utc(if_range.date)
+		)
+		if fresh:
+			bounds = byte_range.range_for_length(size)
+			if bounds is None:
+				response.status_code = 416
+				response.headers["Content-Range"] = f"bytes */{size}"
+				return response
+			start, stop = bounds
+			response.status_code = 206
+			response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+
+	if stop > start and request.method != "HEAD":
+		# Read the first chunk now: a missing object must be a 404, not a
+		# stream that breaks after the 200 has been sent.
+		chunks = attachment_storage().read(storage_key, start, stop if response.status_code == 206 else None)
+		try:
+			first_chunk = next(chunks, b"")
+		except FileNotFoundError:
+			abort(404)
+		except StorageError as exc:
+			if exc.status != 404:
+				raise
+			abort(404)
+		response.response = _stream_from(first_chunk, chunks)
+	response.direct_passthrough = True
+	response.content_length = stop - start
+	return response
+
+
+@attachments_bp.route("/knowledge/<int:attachment_id>")
+@login_required
+def knowledge_attachment(attachment_id: int):
+	attachment = db.session.get(KnowledgeAttachment, attachment_id)
+	if attachment is None:
+		abort(404)
+	post = db.session.get(KnowledgePost, attachment.post_id)
+	if post is None or (post.status != "published" and post.author_id != session.get("user_id")):
+		abort(404)
+	return _stored_file_response(attachment.storage_key, attachment.file_name, blob=attachment.blob)
+
+
+@attachments_bp.route("/checklist/<int:checklist_id>")
+@login_required
+def checklist_attachment(checklist_id: int):
+	checklist = db.session.get(Checklist, checklist_id)
+	if checklist is None or checklist.group is None:
+		abort(404)
+	user_id = session.get("user_id")
+	allowed = session.get("role") == "admin" or user_id in {
+		checklist.student_id,
+		checklist.faculty_id,
+		checklist.group.faculty_id,
+	}
+	attachment = load_attachment(checklist.group.attachment)
+	storage_key = checklist_attachment_key(attachment)
+	if not allowed or not storage_key:
+		abort(404)
+	blob = db.session.get(StoredBlob, attachment["blob_id"]) if attachment.get("blob_id") else None
+	return _stored_file_response(storage_key, attachment.get("name") or storage_key.rsplit("/", 1)[-1], blob=blob)
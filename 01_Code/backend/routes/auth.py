@@ -4,7 +4,8 @@ from datetime import date, datetime
 from functools import wraps
 from pathlib import Path
 
-from flask import Blueprint, current_app, flash, redirect, render_template, request, session, url_for
+from flask import Blueprint, current_app, flash, g, redirect, render_template, request, session, url_for
+from sqlalchemy.orm import joinedload
 
 from models import CourseConfig, SemesterMismatchRequest, StudentAcademicProfile, User, db
 from pending_feedback_service import release_held_feedback_for_faculty
@@ -20,6 +21,31 @@ SECURITY_QUESTIONS = [
 ]
 
 
+@auth_bp.before_app_request
+def _reset_request_identity():
+	# g outlives a single request when a caller keeps an app context pushed
+	# across requests (the smoke tests do), so start every request clean.
+	g.pop("current_user", None)
+	g.pop("course_configs", None)
+
+
+def current_user():
+	if "current_user" not in g:
+		user_id = session.get("user_id")
+		g.current_user = (
+			User.query.options(joinedload(User.student_profile)).filter_by(id=user_id).first() if user_id else None
+		)
+	return g.current_user
+
+
+def course_config_for(course_code: str):
+	configs = g.setdefault("course_configs", {})
+	key = (course_code or "").strip().upper()
+	if key not in configs:
+		configs[key] = CourseConfig.query.filter_by(course_code=key, is_active=True).first()
+	return configs[key]
+
+
 def login_required(view_func):
 	@wraps(view_func)
 	def wrapper(*args, **kwargs):
@@ -1,35 +1,60 @@
 import csv
-import json
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
 from uuid import uuid4
 
-from flask import Blueprint, current_app, flash, jsonify, redirect, render_template, request, session, url_for
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
 from sqlalchemy import func, or_
+from sqlalchemy.orm import contains_eager
 from werkzeug.utils import secure_filename
 
+from attachment_store import release_attachment, release_checklist_attachment, save_upload
+from checklist_store import (
+	checklist_audience_ids,
+	checklist_group_details,
+	checklist_group_progress,
+	checklist_group_totals,
+	delete_group_assignments,
+	dump_attachment,
+	publish_checklist_group,
+	replace_group_tasks,
+	update_group_assignments,
+)
+from intervention_targets import post_reach, sync_post_targets
+from knowledge_store import (
+	attachments_by_post,
+	board_order_keys,
+	decode_board_cursor,
+	encode_board_cursor,
+	engaged_student_count,
+	keyset_page,
+	post_search,
+	post_tag_filter,
+	record_post_revision,
+	sync_post_tags,
+	tag_counts,
+	tags_by_post,
+)
 from models import (
 	Checklist,
+	ChecklistGroup,
 	CourseConfig,
 	FacultyAssignment,
 	Feedback,
 	KnowledgeAttachment,
-	KnowledgeNotification,
 	KnowledgePost,
-	KnowledgeReaction,
-	KnowledgeView,
+	StudentAcademicProfile,
 	SubjectOffering,
 	User,
 	db,
 )
 from models import ExperienceUpvote, StudentExperience
-from routes.auth import SECURITY_QUESTIONS, login_required, role_required
+from routes.auth import SECURITY_QUESTIONS, current_user, login_required, role_required
 
 
 faculty_bp = Blueprint("faculty", __name__, url_prefix="/faculty")
 
 
-CHECKLIST_META_PREFIX = "[[CLARIFAI_META]]"
 SUBJECT_CATALOG_PATH = Path(__file__).resolve().parents[1] / "data" / "subjects.csv"
 IST_ZONE = timezone(timedelta(hours=5, minutes=30))
 CHECKLIST_ATTACHMENT_MAX_BYTES = 20 * 1024 * 1024
@@ -74,6 +99,9 @@ CHECKLIST_DEFAULT_CATEGORIES = [
 	"General",
 	"Examinations",
 ]
+CHECKLISTS_PER_PAGE = 20
+RESOURCE_BOARD_PER_PAGE = 20
+UPDATES_PER_KIND = 25
 
 
 def _normalize_priority(raw_priority: str):
@@ -239,66 +267,6 @@ def _normalize_subject_for_course(
 	return None, f"Choose a valid {target_course} subject or keep No specific subject."
 
 
-def _student_course_code(student: User | None):
-	if not student:
-		return ""
-	if student.student_profile and student.student_profile.course_code:
-		return _normalize_course_code(student.student_profile.course_code)
-	return _normalize_course_code(student.course)
-
-
-def _normalize_task_indexes(raw_indexes, total_tasks: int):
-	if total_tasks <= 0:
-		return []
-	if not isinstance(raw_indexes, list):
-		return []
-	normalized = set()
-	for raw in raw_indexes:
-		try:
-			idx = int(raw)
-		except (TypeError, ValueError):
-			continue
-		if 0 <= idx < total_tasks:
-			normalized.add(idx)
-	return sorted(normalized)
-
-
-def _checklist_tasks_state(title: str, details: dict, is_completed: bool):
-	tasks = [item.strip() for item in details.get("tasks", []) if str(item).strip()]
-	if not tasks:
-		fallback = details.get("description") or title
-		fallback = str(fallback or "Complete this checklist item").strip()
-		tasks = [fallback]
-	completed_indexes = _normalize_task_indexes(details.get("completed_tasks", []), len(tasks))
-	if is_completed and not completed_indexes and tasks:
-		completed_indexes = list(range(len(tasks)))
-	if len(completed_indexes) == len(tasks) and tasks:
-		state = "complete"
-	elif completed_indexes:
-		state = "partial"
-	else:
-		state = "null"
-	return {
-		"tasks": tasks,
-		"completed_indexes": completed_indexes,
-		"total": len(tasks),
-		"completed": len(completed_indexes),
-		"state": state,
-	}
-
-
-def _student_current_semester(student: User | None):
-	if not student or not student.student_profile:
-		return None
-	try:
-		value = int(student.student_profile.current_semester)
-	except (TypeError, ValueError):
-		return None
-	if value < 1:
-		return None
-	return value
-
-
 def _checklist_categories():
 	try:
 		from routes.student import EXPERIENCE_CATEGORIES
@@ -314,7 +282,7 @@ def _make_checklist_group_id():
 	return f"CL-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid4().hex[:10]}"
 
 
-def _save_checklist_attachment(uploaded_file, group_id: str):
+def _save_checklist_attachment(uploaded_file):
 	if not uploaded_file or not getattr(uploaded_file, "filename", ""):
 		return None, None
 
@@ -334,22 +302,16 @@ def _save_checklist_attachment(uploaded_file, group_id: str):
 	if content_length and content_length > CHECKLIST_ATTACHMENT_MAX_BYTES:
 		return None, "Attachment exceeds 20MB. Please use a Drive link for larger files."
 
-	upload_root = Path(current_app.static_folder) / "uploads" / "checklists"
-	upload_root.mkdir(parents=True, exist_ok=True)
-	stored_name = f"{group_id}_{filename}"
-	target = upload_root / stored_name
-	uploaded_file.save(target)
-
-	file_size = target.stat().st_size
-	if file_size > CHECKLIST_ATTACHMENT_MAX_BYTES:
-		target.unlink(missing_ok=True)
+	blob = save_upload(uploaded_file, extension, CHECKLIST_ATTACHMENT_MAX_BYTES)
+	if blob is None:
 		return None, "Attachment exceeds 20MB. Please use a Drive link for larger files."
 
 	return {
 		"kind": "file",
 		"name": filename,
-		"path": f"uploads/checklists/{stored_name}",
-		"size_mb": round(file_size / (1024 * 1024), 2),
+		"key": blob.storage_key,
+		"blob_id": blob.id,
+		"size_mb": round(blob.size / (1024 * 1024), 2),
 	}, None
 
 
@@ -545,162 +507,41 @@ def _post_is_within_edit_window(post: KnowledgePost):
 	return datetime.utcnow() - anchor <= timedelta(hours=24)
 
 
-def _student_matches_intervention_targets(student: User, post: KnowledgePost):
-	courses = set(_parse_csv_values(post.target_courses, uppercase=True))
-	semesters = {value.lower() for value in _parse_csv_values(post.target_semesters, uppercase=False)}
-	sections = set(_parse_csv_values(post.target_sections, uppercase=True))
-
-	student_course = _student_course_code(student)
-	if courses and student_course not in courses:
-		return False
-
-	student_semester = _student_current_semester(student)
-	if semesters and "all" not in semesters:
-		if student_semester is None or str(student_semester) not in semesters:
-			return False
-
-	if sections and "ALL" not in sections:
-		student_section = _normalize_section(student.section)
-		if not student_section or student_section not in sections:
-			return False
-
-	return True
-
-
-def _targeted_students_for_post(post: KnowledgePost):
-	students = User.query.filter_by(role="student", is_active=True).all()
-	return [student for student in students if _student_matches_intervention_targets(student, post)]
-
-
 def _save_intervention_attachments(uploaded_files, post_id: int):
 	valid_files = [f for f in (uploaded_files or []) if f and getattr(f, "filename", "")]
 	if len(valid_files) > INTERVENTION_ATTACHMENT_MAX_FILES:
 		return None, f"You can upload at most {INTERVENTION_ATTACHMENT_MAX_FILES} files per intervention."
 
-	upload_root = Path(current_app.static_folder) / "uploads" / "interventions"
-	upload_root.mkdir(parents=True, exist_ok=True)
-
-	attachments = []
-	saved_paths = []
+	named_files = []
 	for item in valid_files:
 		filename = secure_filename(item.filename or "")
 		if not filename:
 			continue
 		extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
 		if extension not in INTERVENTION_ALLOWED_EXTENSIONS:
-			for path in saved_paths:
-				Path(path).unlink(missing_ok=True)
 			return None, "Only PDF, DOC, DOCX, and image files are allowed."
+		named_files.append((item, filename, extension))
 
-		stored_name = f"post_{post_id}_{uuid4().hex[:10]}_{filename}"
-		target = upload_root / stored_name
-		item.save(target)
-		saved_paths.append(target)
-
-		file_size = target.stat().st_size
-		if file_size > INTERVENTION_ATTACHMENT_MAX_BYTES:
-			for path in saved_paths:
-				Path(path).unlink(missing_ok=True)
+	attachments = []
+	for item, filename, extension in named_files:
+		blob = save_upload(item, extension, INTERVENTION_ATTACHMENT_MAX_BYTES)
+		if blob is None:
+			# Blobs taken for earlier files are dropped with the caller's rollback.
 			return None, "Each attachment must be 30MB or smaller."
-
 		attachments.append(
 			KnowledgeAttachment(
 				post_id=post_id,
 				file_name=filename,
-				file_path=f"uploads/interventions/{stored_name}",
+				storage_key=blob.storage_key,
 				file_ext=extension,
-				file_size=file_size,
+				file_size=blob.size,
+				blob=blob,
 			)
 		)
 
 	return attachments, None
 
 
-def _delete_attachment_file(attachment: KnowledgeAttachment):
-	file_path = (attachment.file_path or "").strip()
-	if not file_path:
-		return
-	target = Path(current_app.static_folder) / file_path
-	target.unlink(missing_ok=True)
-
-
-def _intervention_reaction_counts(post_ids):
-	if not post_ids:
-		return {}, {}, {}
-	like_rows = (
-		db.session.query(KnowledgeReaction.post_id, func.count(KnowledgeReaction.id))
-		.filter(KnowledgeReaction.post_id.in_(post_ids), KnowledgeReaction.reaction_type == "like")
-		.group_by(KnowledgeReaction.post_id)
-		.all()
-	)
-	bookmark_rows = (
-		db.session.query(KnowledgeReaction.post_id, func.count(KnowledgeReaction.id))
-		.filter(KnowledgeReaction.post_id.in_(post_ids), KnowledgeReaction.reaction_type == "bookmark")
-		.group_by(KnowledgeReaction.post_id)
-		.all()
-	)
-	view_rows = (
-		db.session.query(KnowledgeView.post_id, func.count(KnowledgeView.id))
-		.filter(KnowledgeView.post_id.in_(post_ids))
-		.group_by(KnowledgeView.post_id)
-		.all()
-	)
-	return (
-		{row[0]: row[1] for row in like_rows},
-		{row[0]: row[1] for row in bookmark_rows},
-		{row[0]: row[1] for row in view_rows},
-	)
-
-
-def _grouped_checklist_activity(checklist_rows):
-	grouped = {}
-	for row in checklist_rows:
-		details = _parse_checklist_description(row.description or "")
-		state = _checklist_tasks_state(row.title, details, row.is_completed)["state"]
-		group_id = details["group_id"] or f"legacy-{row.id}"
-
-		if group_id not in grouped:
-			grouped[group_id] = {
-				"group_id": group_id,
-				"title": row.title,
-				"created_at": row.created_at,
-				"target_course": details.get("target_course", "BOTH"),
-				"target_semester": details.get("target_semester", "all"),
-				"target_section": details.get("target_section", "all"),
-				"students": 0,
-				"complete_count": 0,
-				"partial_count": 0,
-				"null_count": 0,
-			}
-
-		bucket = grouped[group_id]
-		bucket["students"] += 1
-		if row.created_at and (bucket["created_at"] is None or row.created_at > bucket["created_at"]):
-			bucket["created_at"] = row.created_at
-
-		if state == "complete":
-			bucket["complete_count"] += 1
-		elif state == "partial":
-			bucket["partial_count"] += 1
-		else:
-			bucket["null_count"] += 1
-
-	items = []
-	for bucket in grouped.values():
-		if bucket["students"] and bucket["complete_count"] == bucket["students"]:
-			aggregate_state = "complete"
-		elif bucket["partial_count"] > 0 or bucket["complete_count"] > 0:
-			aggregate_state = "partial"
-		else:
-			aggregate_state = "null"
-
-		bucket["aggregate_state"] = aggregate_state
-		items.append(bucket)
-
-	items.sort(key=lambda item: item["created_at"] or datetime.min, reverse=True)
-	return items
-
-
 def _faculty_visible_post(post_id: int):
 	post = (
 		KnowledgePost.query.join(User, KnowledgePost.author_id == User.id)
@@ -735,41 +576,6 @@ def _target_summary(post: KnowledgePost):
 	}
 
 
-def _queue_intervention_update_notifications(post: KnowledgePost, students):
-	engaged_ids = set(
-		row[0]
-		for row in db.session.query(KnowledgeView.user_id)
-		.filter(KnowledgeView.post_id == post.id)
-		.all()
-	)
-	engaged_ids.update(
-		row[0]
-		for row in db.session.query(KnowledgeReaction.user_id)
-		.filter(
-			KnowledgeReaction.post_id == post.id,
-			KnowledgeReaction.reaction_type == "bookmark",
-		)
-		.all()
-	)
-
-	now = datetime.utcnow()
-	notified_count = 0
-	for student in students:
-		if student.id not in engaged_ids:
-			continue
-		db.session.add(
-			KnowledgeNotification(
-				post_id=post.id,
-				user_id=student.id,
-				message=f"Intervention updated: {post.title}. Please review the latest changes.",
-				is_read=False,
-				created_at=now,
-			)
-		)
-		notified_count += 1
-	return notified_count
-
-
 def _extract_semester_token(raw_value):
 	if raw_value is None:
 		return ""
@@ -780,89 +586,6 @@ def _extract_semester_token(raw_value):
 	return digits or text
 
 
-def _serialize_checklist_description(
-	description: str,
-	subject: str,
-	priority: str,
-	due_date,
-	*,
-	category: str = "General",
-	target_course: str = "BOTH",
-	target_semester: str = "all",
-	target_section: str = "all",
-	tasks=None,
-	completed_tasks=None,
-	completion_locked: bool = False,
-	group_id: str = "",
-	attachment: dict | None = None,
-):
-	task_values = [item.strip() for item in (tasks or []) if str(item).strip()]
-	completed_values = _normalize_task_indexes(completed_tasks or [], len(task_values))
-	meta = {
-		"subject": (subject or "No specific subject").strip() or "No specific subject",
-		"priority": _normalize_priority(priority),
-		"due_date": due_date.strftime("%Y-%m-%d") if due_date else "",
-		"category": (category or "General").strip() or "General",
-		"target_course": _normalize_target_course(target_course),
-		"target_semester": _normalize_target_semester(target_semester),
-		"target_section": _normalize_target_section(target_section),
-		"tasks": task_values,
-		"completed_tasks": completed_values,
-		"completion_locked": bool(completion_locked),
-		"group_id": (group_id or "").strip(),
-		"attachment": attachment or None,
-	}
-	meta_blob = f"{CHECKLIST_META_PREFIX}{json.dumps(meta, separators=(',', ':'))}"
-	body = (description or "").strip()
-	if body:
-		return f"{meta_blob}\n{body}"
-	return meta_blob
-
-
-def _parse_checklist_description(raw_description: str):
-	details = {
-		"subject": "No specific subject",
-		"priority": "medium",
-		"due_date": None,
-		"category": "General",
-		"target_course": "BOTH",
-		"target_semester": "all",
-		"target_section": "all",
-		"tasks": [],
-		"completed_tasks": [],
-		"completion_locked": False,
-		"group_id": "",
-		"attachment": None,
-		"description": (raw_description or "").strip(),
-	}
-
-	if not details["description"].startswith(CHECKLIST_META_PREFIX):
-		return details
-
-	first_line, _, remainder = details["description"].partition("\n")
-	meta_raw = first_line[len(CHECKLIST_META_PREFIX) :].strip()
-	try:
-		meta = json.loads(meta_raw)
-	except (TypeError, json.JSONDecodeError):
-		meta = {}
-
-	details["subject"] = (meta.get("subject") or "No specific subject").strip() or "No specific subject"
-	details["priority"] = _normalize_priority(meta.get("priority", "medium"))
-	details["due_date"] = _parse_iso_date(meta.get("due_date", ""))
-	details["category"] = (meta.get("category") or "General").strip() or "General"
-	details["target_course"] = _normalize_target_course(meta.get("target_course", "BOTH"))
-	details["target_semester"] = _normalize_target_semester(meta.get("target_semester", "all"))
-	details["target_section"] = _normalize_target_section(meta.get("target_section", "all"))
-	details["tasks"] = [item.strip() for item in meta.get("tasks", []) if str(item).strip()]
-	details["completed_tasks"] = _normalize_task_indexes(meta.get("completed_tasks", []), len(details["tasks"]))
-	details["completion_locked"] = bool(meta.get("completion_locked", False))
-	details["group_id"] = (meta.get("group_id") or "").strip()
-	attachment = meta.get("attachment")
-	details["attachment"] = attachment if isinstance(attachment, dict) else None
-	details["description"] = remainder.strip()
-	return details
-
-
 def _due_state(due_date, is_completed: bool):
 	if is_completed:
 		return "completed"
@@ -1088,7 +811,7 @@ def _resolve_trend_month_window(start_raw: str, end_raw: str, minimum_months: in
 @login_required
 @role_required("faculty")
 def dashboard():
-	faculty_user = User.query.get(session["user_id"])
+	faculty_user = current_user()
 	selected_subject_semester = (request.args.get("subject_semester", "all") or "all").strip()
 	selected_subject_section = _normalize_section(request.args.get("subject_section", "all")) or "all"
 	trend_start = (request.args.get("trend_start") or "").strip()
@@ -1221,11 +944,6 @@ def dashboard():
 	else:
 		faculty_subject_summary = f"{faculty_subjects[0]}, {faculty_subjects[1]} +{len(faculty_subjects) - 2} more"
 
-	checklists = (
-		Checklist.query.filter_by(faculty_id=faculty_user.id)
-		.order_by(Checklist.created_at.desc())
-		.all()
-	)
 	intervention_posts = (
 		KnowledgePost.query.filter_by(author_id=faculty_user.id)
 		.order_by(KnowledgePost.created_at.desc())
@@ -1241,22 +959,11 @@ def dashboard():
 	subject_data = _subject_sentiment(subject_filtered_feedback, limit=5)
 
 	approved_count = len(approved_feedback)
-	group_states = {}
-	for item in checklists:
-		details = _parse_checklist_description(item.description or "")
-		group_id = details["group_id"] or f"legacy-{item.id}"
-		state = _checklist_tasks_state(item.title, details, item.is_completed)["state"]
-		if state == "complete":
-			group_states.setdefault(group_id, "complete")
-		elif state == "partial":
-			group_states[group_id] = "partial"
-		else:
-			if group_states.get(group_id) != "partial":
-				group_states[group_id] = "null"
+	checklist_totals = checklist_group_totals(faculty_user.id)
 
-	pending_count = len([state for state in group_states.values() if state != "complete"])
-	active_checklists = len(group_states)
-	interventions_logged = sum(len(_targeted_students_for_post(post)) for post in published_interventions)
+	pending_count = checklist_totals["total"] - checklist_totals["complete"]
+	active_checklists = checklist_totals["total"]
+	interventions_logged = sum(post_reach(post) for post in published_interventions)
 	avg_aspect_score = round(sum(aspect_scores.values()) / len(aspect_scores), 1) if aspect_scores else None
 
 	dashboard_payload = {
@@ -1296,10 +1003,9 @@ def dashboard():
 		filtered_teaching_offerings=filtered_teaching_offerings,
 		total_teaching_offerings=len(assigned_offerings),
 		approved_feedback=approved_feedback,
-		checklists=checklists,
 		recent_resources=recent_resources,
 		total_resources=len(published_interventions),
-		completed_count=len([item for item in checklists if item.is_completed]),
+		completed_count=Checklist.query.filter_by(faculty_id=faculty_user.id, is_completed=True).count(),
 		pending_count=pending_count,
 		approved_count=approved_count,
 		active_checklists=active_checklists,
@@ -1316,90 +1022,59 @@ def dashboard():
 @role_required("faculty")
 def resource_board():
 	search = request.args.get("q", "").strip()
-	sort_by = request.args.get("sort", "most_upvoted").strip().lower()
+	sort_by = request.args.get("sort", "relevance" if search else "most_upvoted").strip().lower()
 	date_from_value = request.args.get("date_from", "").strip()
 	date_to_value = request.args.get("date_to", "").strip()
 	date_from = _parse_iso_date(date_from_value)
 	date_to = _parse_iso_date(date_to_value)
-	if sort_by not in {"most_upvoted", "oldest", "recent"}:
+	selected_tag = request.args.get("tag", "").strip().lower()
+	cursor = request.args.get("after", "").strip()
+	if sort_by not in {"most_upvoted", "oldest", "recent", "relevance"} or (sort_by == "relevance" and not search):
 		sort_by = "most_upvoted"
 
-	posts = (
+	posts_query = (
 		KnowledgePost.query.join(User, KnowledgePost.author_id == User.id)
+		.options(contains_eager(KnowledgePost.author))
 		.filter(User.role == "faculty", KnowledgePost.status == "published")
-		.order_by(KnowledgePost.created_at.desc())
-		.all()
 	)
+	search_hits = None
+	if search:
+		search_hits = post_search(search)
+		posts_query = posts_query.join(search_hits, search_hits.c.post_id == KnowledgePost.id)
+	if date_from:
+		posts_query = posts_query.filter(KnowledgePost.created_at >= datetime.combine(date_from, time.min))
+	if date_to:
+		posts_query = posts_query.filter(KnowledgePost.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+	board_tags = tag_counts(posts_query, cache_key=("faculty", search, date_from, date_to))
+	if selected_tag:
+		posts_query = posts_query.filter(post_tag_filter(selected_tag))
+	posts_query, order_keys = board_order_keys(posts_query, sort_by, search_hits)
+	after = decode_board_cursor(cursor, sort_by, len(order_keys))
+	posts, next_keys = keyset_page(posts_query, order_keys, after, RESOURCE_BOARD_PER_PAGE)
 	post_ids = [post.id for post in posts]
-	like_counts, bookmark_counts, view_counts = _intervention_reaction_counts(post_ids)
+	attachments = attachments_by_post(post_ids)
+	post_tags = tags_by_post(post_ids)
 
 	board_cards = []
 	for post in posts:
-		tags = []
-		tag_source = " ".join(
-			[
-				post.title or "",
-				post.content or "",
-				post.problem_context or "",
-				post.solution_steps or "",
-				post.resource_references or "",
-				post.outcome_result or "",
-			]
-		)
-		for token in tag_source.lower().split():
-			clean = "".join(ch for ch in token if ch.isalnum() or ch == "-")
-			if len(clean) >= 4:
-				tags.append(clean)
-		tags = sorted(set(tags))[:8]
-
-		likes = like_counts.get(post.id, 0)
-		bookmarks = bookmark_counts.get(post.id, 0)
-		opened = view_counts.get(post.id, 0)
-		reach_count = len(_targeted_students_for_post(post))
+		likes = post.like_count
+		bookmarks = post.bookmark_count
+		opened = post.open_count
+		reach_count = post_reach(post)
 		board_cards.append(
 			{
 				"post": post,
-				"tags": tags,
+				"tags": post_tags[post.id],
 				"likes": likes,
 				"bookmarks": bookmarks,
 				"opened_count": opened,
 				"reach_count": reach_count,
-				"attachments": post.attachments.order_by(KnowledgeAttachment.created_at.desc()).all(),
+				"attachments": attachments[post.id],
 				"target_summary": _target_summary(post),
-				"rank": (likes * 2) + bookmarks + reach_count,
+				"rank": (likes * 2) + bookmarks,
 			}
 		)
 
-	if search:
-		needle = search.lower()
-		board_cards = [
-			item
-			for item in board_cards
-			if needle in item["post"].title.lower()
-			or needle in (item["post"].author.full_name or "").lower()
-		]
-
-	if date_from:
-		board_cards = [
-			item
-			for item in board_cards
-			if item["post"].created_at and item["post"].created_at.date() >= date_from
-		]
-
-	if date_to:
-		board_cards = [
-			item
-			for item in board_cards
-			if item["post"].created_at and item["post"].created_at.date() <= date_to
-		]
-
-	if sort_by == "recent":
-		board_cards.sort(key=lambda item: item["post"].created_at, reverse=True)
-	elif sort_by == "oldest":
-		board_cards.sort(key=lambda item: item["post"].created_at)
-	else:
-		board_cards.sort(key=lambda item: item["rank"], reverse=True)
-
 	return render_template(
 		"knowledge_board.html",
 		board_cards=board_cards,
@@ -1407,6 +1082,10 @@ def resource_board():
 		sort_by=sort_by,
 		date_from_value=date_from_value if date_from else "",
 		date_to_value=date_to_value if date_to else "",
+		board_tags=board_tags,
+		selected_tag=selected_tag,
+		next_cursor=encode_board_cursor(sort_by, next_keys) if next_keys is not None else None,
+		is_first_page=not cursor,
 		board_filter_endpoint="faculty.resource_board",
 		board_page_title="Interventions - Resource Board",
 		board_heading="Faculty Resource Interventions",
@@ -1436,17 +1115,14 @@ def my_resources():
 		.all()
 	)
 	post_ids = [post.id for post in posts]
-	like_counts, bookmark_counts, view_counts = _intervention_reaction_counts(post_ids)
 	for post in posts:
-		post.like_count = like_counts.get(post.id, 0)
-		post.bookmark_count = bookmark_counts.get(post.id, 0)
-		post.opened_count = view_counts.get(post.id, 0)
-		post.reach_count = len(_targeted_students_for_post(post)) if post.status == "published" else 0
+		post.reach_count = post_reach(post) if post.status == "published" else 0
 		post.edit_window_open = post.status != "published" or _post_is_within_edit_window(post)
 
 	return render_template(
 		"student_my_posts.html",
 		posts=posts,
+		attachments=attachments_by_post(post_ids),
 		page_title="My Intervention Resources",
 		heading="My Intervention Resources",
 		board_url=url_for("faculty.resource_board"),
@@ -1468,8 +1144,7 @@ def resource_post_detail(post_id: int):
 	if not post:
 		return jsonify({"error": "not_found"}), 404
 
-	likes, bookmarks, opened = _intervention_reaction_counts([post.id])
-	attachments = post.attachments.order_by(KnowledgeAttachment.created_at.desc()).all()
+	attachments = attachments_by_post([post.id])[post.id]
 
 	payload = {
 		"id": post.id,
@@ -1485,15 +1160,15 @@ def resource_post_detail(post_id: int):
 		"created_at_ist": _utc_to_ist(post.created_at).strftime("%d %b %Y %I:%M %p") if post.created_at else "-",
 		"target": _target_summary(post),
 		"metrics": {
-			"likes": int(likes.get(post.id, 0)),
-			"saved": int(bookmarks.get(post.id, 0)),
-			"opened": int(opened.get(post.id, 0)),
-			"reach": len(_targeted_students_for_post(post)) if post.status == "published" else 0,
+			"likes": post.like_count,
+			"saved": post.bookmark_count,
+			"opened": post.open_count,
+			"reach": post_reach(post) if post.status == "published" else 0,
 		},
 		"attachments": [
 			{
 				"name": attachment.file_name,
-				"url": url_for("static", filename=attachment.file_path),
+				"url": url_for("attachments.knowledge_attachment", attachment_id=attachment.id),
 			}
 			for attachment in attachments
 		],
@@ -1526,16 +1201,13 @@ def resource_metrics():
 		if post.status == "published" or post.author_id == session.get("user_id"):
 			allowed_posts.append(post)
 
-	allowed_ids = [post.id for post in allowed_posts]
-	likes, bookmarks, opened = _intervention_reaction_counts(allowed_ids)
-
 	items = {}
 	for post in allowed_posts:
 		items[str(post.id)] = {
-			"likes": int(likes.get(post.id, 0)),
-			"saved": int(bookmarks.get(post.id, 0)),
-			"opened": int(opened.get(post.id, 0)),
-			"reach": len(_targeted_students_for_post(post)) if post.status == "published" else 0,
+			"likes": post.like_count,
+			"saved": post.bookmark_count,
+			"opened": post.open_count,
+			"reach": post_reach(post) if post.status == "published" else 0,
 		}
 
 	return jsonify({"items": items})
@@ -1584,6 +1256,8 @@ def resource_post():
 			author_id=session["user_id"],
 			published_at=datetime.utcnow() if payload["status"] == "published" else None,
 		)
+		sync_post_targets(post)
+		sync_post_tags(post)
 
 		db.session.add(post)
 		db.session.flush()
@@ -1656,7 +1330,7 @@ def edit_resource_post(post_id: int):
 			form_values=values,
 			is_edit=True,
 			post=post,
-			existing_attachments=post.attachments.order_by(KnowledgeAttachment.created_at.desc()).all(),
+			existing_attachments=attachments_by_post([post.id])[post.id],
 			edit_window_open=edit_window_open,
 		)
 
@@ -1688,6 +1362,8 @@ def edit_resource_post(post_id: int):
 		post.target_courses = payload["target_course"]
 		post.target_semesters = payload["target_semester"]
 		post.target_sections = payload["target_section"]
+		sync_post_targets(post)
+		sync_post_tags(post)
 		post.revision_count = int(post.revision_count or 0) + 1
 		if post.status == "published" and not post.published_at:
 			post.published_at = datetime.utcnow()
@@ -1704,7 +1380,7 @@ def edit_resource_post(post_id: int):
 				KnowledgeAttachment.id.in_(remove_ids),
 			).all()
 			for row in remove_rows:
-				_delete_attachment_file(row)
+				release_attachment(row)
 				db.session.delete(row)
 
 		new_attachments, attach_error = _save_intervention_attachments(request.files.getlist("attachments"), post.id)
@@ -1716,8 +1392,8 @@ def edit_resource_post(post_id: int):
 			db.session.add(attachment)
 
 		if was_published and post.status == "published":
-			target_students = _targeted_students_for_post(post)
-			notified_count = _queue_intervention_update_notifications(post, target_students)
+			record_post_revision(post)
+			notified_count = engaged_student_count(post)
 		else:
 			notified_count = 0
 
@@ -1743,7 +1419,7 @@ def delete_resource_post(post_id: int):
 		return redirect(url_for("faculty.my_resources"))
 	attachments = post.attachments.all()
 	for attachment in attachments:
-		_delete_attachment_file(attachment)
+		release_attachment(attachment)
 
 	db.session.delete(post)
 	db.session.commit()
@@ -1918,127 +1594,63 @@ def checklists_page():
 	selected_section_raw = (request.args.get("section") or "all").strip()
 	selected_section = _normalize_target_section(selected_section_raw)
 
-	all_rows = Checklist.query.filter_by(faculty_id=session["user_id"]).order_by(Checklist.created_at.desc()).all()
-	grouped = {}
-	for row in all_rows:
-		details = _parse_checklist_description(row.description or "")
-		state = _checklist_tasks_state(row.title, details, row.is_completed)
-		group_id = details["group_id"] or f"legacy-{row.id}"
-
-		if group_id not in grouped:
-			grouped[group_id] = {
-				"id": row.id,
-				"group_id": group_id,
-				"title": row.title,
-				"description": details["description"],
-				"subject": details["subject"],
-				"category": details["category"],
-				"priority": details["priority"],
-				"target_course": details["target_course"],
-				"target_semester": details["target_semester"],
-				"target_section": details["target_section"],
-				"due_date": details["due_date"],
-				"completion_locked": bool(details.get("completion_locked", False)),
-				"attachment": details["attachment"],
-				"created_at": row.created_at,
-				"students": 0,
-				"complete_count": 0,
-				"partial_count": 0,
-				"null_count": 0,
-				"total_tasks": max(state["total"], 1),
-				"completed_tasks": 0,
-			}
-
-		bucket = grouped[group_id]
-		bucket["completion_locked"] = bool(bucket["completion_locked"] and details.get("completion_locked", False))
-		bucket["students"] += 1
-		bucket["total_tasks"] = max(bucket["total_tasks"], state["total"])
-		bucket["completed_tasks"] += state["completed"]
-		if state["state"] == "complete":
-			bucket["complete_count"] += 1
-		elif state["state"] == "partial":
-			bucket["partial_count"] += 1
-		else:
-			bucket["null_count"] += 1
-
-	checklists = []
-	for item in grouped.values():
-		if item["students"] and item["complete_count"] == item["students"]:
-			aggregate_state = "complete"
-		elif item["partial_count"] > 0 or item["complete_count"] > 0:
-			aggregate_state = "partial"
-		else:
-			aggregate_state = "null"
-
-		due_state = _due_state(item["due_date"], aggregate_state == "complete")
-		item["aggregate_state"] = aggregate_state
-		item["due_state"] = due_state
-		item["due_label"] = _due_label(item["due_date"], due_state)
-		denom = max(item["students"], 1)
-		item["complete_ratio"] = int(round((item["complete_count"] / denom) * 100))
-		item["partial_ratio"] = int(round((item["partial_count"] / denom) * 100))
-		item["null_ratio"] = int(round((item["null_count"] / denom) * 100))
-		task_denom = max(item["students"] * max(item["total_tasks"], 1), 1)
-		item["task_progress_percent"] = int(round((item["completed_tasks"] / task_denom) * 100))
-		checklists.append(item)
-
-	if selected_course != "ALL":
-		if selected_course == "BOTH":
-			checklists = [item for item in checklists if item["target_course"] == "BOTH"]
-		else:
-			checklists = [
-				item
-				for item in checklists
-				if item["target_course"] in {selected_course, "BOTH"}
-			]
-
-	if selected_semester != "all":
-		checklists = [
-			item
-			for item in checklists
-			if item["target_semester"] in {"all", selected_semester}
-		]
-
-	if selected_section != "all":
-		checklists = [
-			item
-			for item in checklists
-			if item["target_section"] in {"all", selected_section}
-		]
-
-	if selected_category != "all":
-		checklists = [item for item in checklists if item["category"] == selected_category]
-
-	if status != "all":
-		checklists = [item for item in checklists if item["aggregate_state"] == status]
-
-	checklists.sort(key=lambda item: item["created_at"], reverse=True)
-	checklist_totals = {
-		"total": len(checklists),
-		"complete": len([item for item in checklists if item["aggregate_state"] == "complete"]),
-		"partial": len([item for item in checklists if item["aggregate_state"] == "partial"]),
-		"null": len([item for item in checklists if item["aggregate_state"] == "null"]),
-		"students": sum(item["students"] for item in checklists),
+	created_from = _parse_iso_date(request.args.get("created_from", ""))
+	created_to = _parse_iso_date(request.args.get("created_to", ""))
+	if created_from and created_to and created_from > created_to:
+		created_from, created_to = created_to, created_from
+
+	progress_filters = {
+		"course": selected_course,
+		"category": selected_category,
+		"semester": selected_semester,
+		"section": selected_section,
+		"created_from": created_from,
+		"created_to": created_to,
+		"status": status,
 	}
+	checklist_totals = checklist_group_totals(session["user_id"], **progress_filters)
+	page_count = max((checklist_totals["total"] + CHECKLISTS_PER_PAGE - 1) // CHECKLISTS_PER_PAGE, 1)
+	page = min(max(request.args.get("page", 1, type=int) or 1, 1), page_count)
+
+	checklists = checklist_group_progress(
+		session["user_id"],
+		page=page,
+		per_page=CHECKLISTS_PER_PAGE,
+		**progress_filters,
+	)
+	for item in checklists:
+		due_state = _due_state(item["due_date"], item["aggregate_state"] == "complete")
+		denom = max(item["students"], 1)
+		task_denom = max(item["students"] * item["total_tasks"], 1)
+		item.update(
+			{
+				"due_state": due_state,
+				"due_label": _due_label(item["due_date"], due_state),
+				"complete_ratio": int(round((item["complete_count"] / denom) * 100)),
+				"partial_ratio": int(round((item["partial_count"] / denom) * 100)),
+				"null_ratio": int(round((item["null_count"] / denom) * 100)),
+				"task_progress_percent": int(round((item["completed_tasks"] / task_denom) * 100)),
+			}
+		)
 
 	subject_catalog_by_course = _load_subject_catalog_by_course()
-	active_students = User.query.filter_by(role="student", is_active=True).all()
-	section_options = sorted(
-		{
-			_normalize_section(student.section)
-			for student in active_students
-			if _normalize_section(student.section)
-		}
+	# One row per distinct (profile course, course, section) instead of one
+	# per active student.
+	section_rows = (
+		db.session.query(StudentAcademicProfile.course_code, User.course, User.section)
+		.outerjoin(StudentAcademicProfile, StudentAcademicProfile.user_id == User.id)
+		.filter(User.role == "student", User.is_active.is_(True), func.trim(func.coalesce(User.section, "")) != "")
+		.distinct()
+		.all()
 	)
 	section_options_by_course = {"MCA": set(), "BCA": set(), "BOTH": set()}
-	for student in active_students:
-		section = _normalize_section(student.section)
-		if not section:
-			continue
-		course = _student_course_code(student)
+	for profile_course, user_course, raw_section in section_rows:
+		section = _normalize_section(raw_section)
+		course = _normalize_course_code(profile_course or user_course)
 		if course in {"MCA", "BCA"}:
 			section_options_by_course[course].add(section)
 		section_options_by_course["BOTH"].add(section)
+	section_options = sorted(section_options_by_course["BOTH"])
 	for course in section_options_by_course:
 		section_options_by_course[course] = sorted(section_options_by_course[course])
 	semester_options_by_course = {
@@ -2056,6 +1668,10 @@ def checklists_page():
 		selected_category=selected_category,
 		selected_semester=selected_semester,
 		selected_section=selected_section,
+		selected_from=created_from.isoformat() if created_from else "",
+		selected_to=created_to.isoformat() if created_to else "",
+		page=page,
+		page_count=page_count,
 		checklist_totals=checklist_totals,
 		subject_options=[],
 		subject_catalog_by_course=subject_catalog_by_course,
@@ -2112,7 +1728,7 @@ def create_checklist():
 	attachment_meta = None
 	file_payload = request.files.get("attachment_file")
 	if file_payload and (file_payload.filename or "").strip():
-		attachment_meta, file_error = _save_checklist_attachment(file_payload, group_id)
+		attachment_meta, file_error = _save_checklist_attachment(file_payload)
 		if file_error:
 			flash(file_error, "danger")
 			return redirect(url_for(redirect_target))
@@ -2126,50 +1742,29 @@ def create_checklist():
 		else:
 			attachment_meta["link"] = attachment_link
 
-	students = User.query.filter_by(role="student", is_active=True).order_by(User.id.asc()).all()
-	matched_students = []
-	for student in students:
-		course = _student_course_code(student)
-		section = _normalize_section(student.section) or "A"
-		if target_course != "BOTH" and course != target_course:
-			continue
-		if target_section != "all" and section != target_section:
-			continue
-		if target_semester != "all":
-			current_sem = _student_current_semester(student)
-			if str(current_sem or "") != target_semester:
-				continue
-		matched_students.append(student)
-
-	if not matched_students:
+	student_ids = checklist_audience_ids(target_course, target_semester, target_section)
+	if not student_ids:
 		flash("No active students match the selected course/semester/section filters.", "danger")
 		return redirect(url_for(redirect_target))
 
-	for student in matched_students:
-		checklist = Checklist(
-			title=title,
-			description=_serialize_checklist_description(
-				description,
-				subject,
-				priority,
-				due_date,
-				category=category,
-				target_course=target_course,
-				target_semester=target_semester,
-				target_section=target_section,
-				tasks=task_lines,
-				completed_tasks=[],
-				completion_locked=False,
-				group_id=group_id,
-				attachment=attachment_meta,
-			),
-			faculty_id=session["user_id"],
-			student_id=student.id,
-		)
-		db.session.add(checklist)
-	db.session.commit()
+	group = ChecklistGroup(
+		group_key=group_id,
+		faculty_id=session["user_id"],
+		title=title,
+		description=description or None,
+		subject=subject,
+		category=category,
+		priority=priority,
+		due_date=due_date,
+		target_course=target_course,
+		target_semester=target_semester,
+		target_section=target_section,
+		attachment=dump_attachment(attachment_meta),
+	)
+	replace_group_tasks(group, task_lines)
+	published_count = publish_checklist_group(group, student_ids)
 
-	flash(f"Checklist published to {len(matched_students)} students.", "success")
+	flash(f"Checklist published to {published_count} students.", "success")
 	return redirect(url_for(redirect_target))
 
 
@@ -2182,19 +1777,8 @@ def edit_checklist(checklist_id: int):
 		flash("Checklist not found.", "danger")
 		return redirect(url_for("faculty.checklists_page"))
 
-	current_details = _parse_checklist_description(checklist.description or "")
-	group_id = current_details["group_id"]
-	all_faculty_rows = Checklist.query.filter_by(faculty_id=session["user_id"]).all()
-	if group_id:
-		group_rows = [
-			row
-			for row in all_faculty_rows
-			if _parse_checklist_description(row.description or "")["group_id"] == group_id
-		]
-	else:
-		group_rows = [checklist]
-	if not group_rows:
-		group_rows = [checklist]
+	group = checklist.group
+	current_details = checklist_group_details(group)
 
 	def _render_edit_form(override: dict | None = None):
 		payload = {
@@ -2286,10 +1870,11 @@ def edit_checklist(checklist_id: int):
 			return _render_edit_form(render_payload)
 
 		updated_attachment = None if remove_attachment else current_details.get("attachment")
+		replaces_file = remove_attachment
 		file_payload = request.files.get("attachment_file")
 		if file_payload and (file_payload.filename or "").strip():
-			attachment_group = group_id or _make_checklist_group_id()
-			updated_attachment, file_error = _save_checklist_attachment(file_payload, attachment_group)
+			updated_attachment, file_error = _save_checklist_attachment(file_payload)
+			replaces_file = True
 			if file_error:
 				flash(file_error, "danger")
 				return _render_edit_form(render_payload)
@@ -2303,36 +1888,22 @@ def edit_checklist(checklist_id: int):
 			else:
 				updated_attachment["link"] = attachment_link
 
-		stable_group_id = group_id or _make_checklist_group_id()
 		if category not in _checklist_categories():
 			category = "General"
 
-		for row in group_rows:
-			existing = _parse_checklist_description(row.description or "")
-			existing_state = _checklist_tasks_state(row.title, existing, row.is_completed)
-			new_completed = [idx for idx in existing_state["completed_indexes"] if idx < len(task_lines)]
-			if row.is_completed and len(new_completed) < len(task_lines):
-				new_completed = list(range(len(task_lines)))
-			row.title = title
-			row.is_completed = bool(task_lines) and len(new_completed) == len(task_lines)
-			row.description = _serialize_checklist_description(
-				description,
-				subject,
-				priority,
-				due_date,
-				category=category,
-				target_course=existing.get("target_course", "BOTH"),
-				target_semester=existing.get("target_semester", "all"),
-				target_section=existing.get("target_section", "all"),
-				tasks=task_lines,
-				completed_tasks=new_completed,
-				completion_locked=existing.get("completion_locked", False),
-				group_id=stable_group_id,
-				attachment=updated_attachment,
-			)
+		group.title = title
+		group.description = description or None
+		group.subject = subject
+		group.category = category
+		group.priority = priority
+		group.due_date = due_date
+		if replaces_file:
+			release_checklist_attachment(group.attachment)
+		group.attachment = dump_attachment(updated_attachment)
+		updated_count = update_group_assignments(group, title, task_lines)
 
 		db.session.commit()
-		flash(f"Checklist updated for {len(group_rows)} student assignment(s).", "success")
+		flash(f"Checklist updated for {updated_count} student assignment(s).", "success")
 		return redirect(url_for("faculty.checklists_page"))
 
 	return _render_edit_form()
@@ -2346,22 +1917,12 @@ def delete_checklist(checklist_id: int):
 	if not checklist:
 		flash("Checklist not found.", "danger")
 		return redirect(url_for("faculty.checklists_page"))
-	details = _parse_checklist_description(checklist.description or "")
-	group_id = details["group_id"]
-	if group_id:
-		all_rows = Checklist.query.filter_by(faculty_id=session["user_id"]).all()
-		delete_rows = [
-			row
-			for row in all_rows
-			if _parse_checklist_description(row.description or "")["group_id"] == group_id
-		]
-	else:
-		delete_rows = [checklist]
-
-	for row in delete_rows:
-		db.session.delete(row)
+	group = checklist.group
+	deleted_count = delete_group_assignments(group)
+	release_checklist_attachment(group.attachment)
+	db.session.delete(group)
 	db.session.commit()
-	flash(f"Checklist deleted for {len(delete_rows)} student assignment(s).", "success")
+	flash(f"Checklist deleted for {deleted_count} student assignment(s).", "success")
 	return redirect(url_for("faculty.checklists_page"))
 
 
@@ -2434,7 +1995,7 @@ def experiences():
 @login_required
 @role_required("faculty")
 def updates_page():
-	faculty_user = User.query.get(session["user_id"])
+	faculty_user = current_user()
 	selected_type = (request.args.get("type") or "all").strip().lower()
 	if selected_type not in {"all", "feedback", "checklist", "intervention"}:
 		selected_type = "all"
@@ -2444,12 +2005,8 @@ def updates_page():
 		.order_by(Feedback.created_at.desc())
 		.all()
 	)
-	checklist_rows = (
-		Checklist.query.filter_by(faculty_id=faculty_user.id)
-		.order_by(Checklist.created_at.desc())
-		.all()
-	)
-	checklist_groups = _grouped_checklist_activity(checklist_rows)
+	checklist_groups = checklist_group_progress(faculty_user.id, per_page=UPDATES_PER_KIND)
+	checklist_totals = checklist_group_totals(faculty_user.id)
 	intervention_posts = (
 		KnowledgePost.query.filter_by(author_id=faculty_user.id)
 		.order_by(KnowledgePost.updated_at.desc(), KnowledgePost.created_at.desc())
@@ -2458,11 +2015,8 @@ def updates_page():
 	published_interventions = [post for post in intervention_posts if post.status == "published"]
 	draft_interventions = [post for post in intervention_posts if post.status == "draft"]
 
-	post_ids = [post.id for post in intervention_posts]
-	_, bookmark_counts, view_counts = _intervention_reaction_counts(post_ids)
-
 	events = []
-	for row in approved_feedback[:25]:
+	for row in approved_feedback[:UPDATES_PER_KIND]:
 		events.append(
 			{
 				"kind": "feedback",
@@ -2472,7 +2026,7 @@ def updates_page():
 			}
 		)
 
-	for item in checklist_groups[:25]:
+	for item in checklist_groups:
 		semester_label = "All Semesters" if item["target_semester"] == "all" else f"Sem {item['target_semester']}"
 		section_label = "All Sections" if item["target_section"] == "all" else f"Section {item['target_section']}"
 		events.append(
@@ -2488,14 +2042,14 @@ def updates_page():
 			}
 		)
 
-	for post in intervention_posts[:25]:
+	for post in intervention_posts[:UPDATES_PER_KIND]:
 		target = _target_summary(post)
 		events.append(
 			{
 				"kind": "intervention",
 				"created_at": post.updated_at or post.created_at,
 				"title": f"{post.status.title()} intervention: {post.title}",
-				"detail": f"{target['courses']} | {target['semesters']} | {target['sections']} - Opened {view_counts.get(post.id, 0)} - Saved {bookmark_counts.get(post.id, 0)}",
+				"detail": f"{target['courses']} | {target['semesters']} | {target['sections']} - Opened {post.open_count} - Saved {post.bookmark_count}",
 			}
 		)
 
@@ -2510,11 +2064,11 @@ def updates_page():
 		selected_type=selected_type,
 		events=events,
 		approved_feedback_count=len(approved_feedback),
-		active_checklist_count=len([item for item in checklist_groups if item["aggregate_state"] != "complete"]),
+		active_checklist_count=checklist_totals["total"] - checklist_totals["complete"],
 		published_intervention_count=len(published_interventions),
 		draft_intervention_count=len(draft_interventions),
-		engaged_open_count=sum(view_counts.get(post.id, 0) for post in intervention_posts),
-		engaged_save_count=sum(bookmark_counts.get(post.id, 0) for post in intervention_posts),
+		engaged_open_count=sum(post.open_count for post in intervention_posts),
+		engaged_save_count=sum(post.bookmark_count for post in intervention_posts),
 	)
 
 
@@ -2522,7 +2076,7 @@ def updates_page():
 @login_required
 @role_required("faculty")
 def profile_settings():
-	faculty_user = User.query.get(session["user_id"])
+	faculty_user = current_user()
 	if not faculty_user:
 		flash("Faculty account not found.", "danger")
 		return redirect(url_for("auth.logout"))
@@ -1,5 +1,4 @@
 import csv
-import json
 import random
 import re
 from datetime import date, datetime, time, timedelta, timezone
@@ -7,19 +6,41 @@ from pathlib import Path
 from types import SimpleNamespace
 
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
-from sqlalchemy import func, or_
+from sqlalchemy import or_
+from sqlalchemy.orm import contains_eager, joinedload
+from sqlalchemy.orm.exc import StaleDataError
 from academic_mapping_store import find_assignment, list_assignments_for_slot
 
+from checklist_store import (
+	checklist_group_details,
+	checklist_progress,
+	full_task_mask,
+	group_task_texts,
+	mask_from_indexes,
+	set_checklist_task,
+)
+from intervention_targets import student_target_filter
+from knowledge_store import (
+	REACTION_COUNTERS,
+	attachments_by_post,
+	board_order_keys,
+	bump_post_counter,
+	decode_board_cursor,
+	encode_board_cursor,
+	keyset_page,
+	post_search,
+	post_tag_filter,
+	tag_counts,
+	tags_by_post,
+	unread_post_updates,
+)
 from models import (
 	Checklist,
-	CourseConfig,
+	ChecklistGroup,
 	FacultyAssignment,
 	Feedback,
-	KnowledgeAttachment,
-	KnowledgeNotification,
 	KnowledgePost,
 	KnowledgeReaction,
-	KnowledgeView,
 	PendingFacultyFeedback,
 	SemesterMismatchRequest,
 	SubjectOffering,
@@ -27,8 +48,9 @@ from models import (
 	db,
 )
 from models import ExperienceReport, ExperienceUpvote, StudentExperience
-from routes.auth import SECURITY_QUESTIONS, login_required, role_required
-from sentiment import analyze_sentiment_with_confidence
+from routes.auth import SECURITY_QUESTIONS, course_config_for, current_user, login_required, role_required
+from sentiment import SENTIMENT_VERSION, analyze_sentiment_cached
+from view_tracker import record_knowledge_views
 
 
 student_bp = Blueprint("student", __name__, url_prefix="/student")
@@ -52,6 +74,7 @@ FIXED_FEEDBACK_TAGS = [
 ]
 
 SUBJECT_CATALOG_PATH = Path(__file__).resolve().parents[1] / "data" / "subjects.csv"
+KNOWLEDGE_BOARD_PER_PAGE = 20
 
 EXPERIENCE_CATEGORIES = [
 	"Academic",
@@ -106,7 +129,6 @@ EXPERIENCE_REPORT_CATEGORIES = [
 	"Other",
 ]
 IST_ZONE = timezone(timedelta(hours=5, minutes=30))
-CHECKLIST_META_PREFIX = "[[CLARIFAI_META]]"
 
 
 def _ist_now() -> datetime:
@@ -122,20 +144,6 @@ def _parse_iso_date(raw_value: str):
 		return None
 
 
-def _normalize_checklist_priority(raw_priority: str):
-	priority = (raw_priority or "medium").strip().lower()
-	if priority not in {"high", "medium", "low"}:
-		return "medium"
-	return priority
-
-
-def _normalize_checklist_target_course(raw_value: str):
-	value = (raw_value or "BOTH").strip().upper()
-	if value not in {"MCA", "BCA", "BOTH"}:
-		return "BOTH"
-	return value
-
-
 def _normalize_checklist_target_semester(raw_value):
 	text = str(raw_value or "").strip().lower()
 	if not text or text == "all":
@@ -159,110 +167,63 @@ def _normalize_checklist_section(raw_value: str):
 	return text.upper()
 
 
-def _normalize_checklist_indexes(raw_indexes, total_tasks: int):
-	if total_tasks <= 0 or not isinstance(raw_indexes, list):
-		return []
-	values = set()
-	for raw in raw_indexes:
-		try:
-			idx = int(raw)
-		except (TypeError, ValueError):
-			continue
-		if 0 <= idx < total_tasks:
-			values.add(idx)
-	return sorted(values)
-
-
-def _parse_checklist_description(raw_description: str):
-	details = {
-		"subject": "No specific subject",
-		"priority": "medium",
-		"due_date": None,
-		"category": "General",
-		"target_course": "BOTH",
-		"target_semester": "all",
-		"target_section": "all",
-		"tasks": [],
-		"completed_tasks": [],
-		"completion_locked": False,
-		"group_id": "",
-		"attachment": None,
-		"description": (raw_description or "").strip(),
-	}
+def _student_checklist_query(student_id: int, *, course: str, category: str, semester: str, section: str):
+	query = (
+		Checklist.query.join(ChecklistGroup, Checklist.group_id == ChecklistGroup.id)
+		.options(
+			contains_eager(Checklist.group).selectinload(ChecklistGroup.tasks),
+			joinedload(Checklist.faculty),
+		)
+		.filter(Checklist.student_id == student_id)
+	)
+	if course == "BOTH":
+		query = query.filter(ChecklistGroup.target_course == "BOTH")
+	elif course in {"MCA", "BCA"}:
+		query = query.filter(ChecklistGroup.target_course.in_([course, "BOTH"]))
+	if category != "all":
+		query = query.filter(ChecklistGroup.category == category)
+	if semester != "all":
+		query = query.filter(ChecklistGroup.target_semester.in_(["all", semester]))
+	if section != "all":
+		query = query.filter(ChecklistGroup.target_section.in_(["all", section]))
+	return query.order_by(Checklist.created_at.desc())
+
+
+def _filter_checklist_status(query, status: str):
+	if status == "complete":
+		return query.filter(Checklist.is_completed.is_(True))
+	if status == "partial":
+		return query.filter(Checklist.is_completed.is_(False), Checklist.completed_mask != 0)
+	if status == "null":
+		return query.filter(Checklist.is_completed.is_(False), Checklist.completed_mask == 0)
+	return query
+
+
+def _student_checklist_categories(student_id: int):
+	rows = (
+		db.session.query(ChecklistGroup.category)
+		.join(Checklist, Checklist.group_id == ChecklistGroup.id)
+		.filter(Checklist.student_id == student_id)
+		.distinct()
+		.all()
+	)
+	return {row[0] for row in rows if row[0]}
 
-	if not details["description"].startswith(CHECKLIST_META_PREFIX):
-		return details
 
-	first_line, _, remainder = details["description"].partition("\n")
-	meta_raw = first_line[len(CHECKLIST_META_PREFIX) :].strip()
-	try:
-		meta = json.loads(meta_raw)
-	except (TypeError, json.JSONDecodeError):
-		meta = {}
-
-	details["subject"] = (meta.get("subject") or "No specific subject").strip() or "No specific subject"
-	details["priority"] = _normalize_checklist_priority(meta.get("priority", "medium"))
-	details["due_date"] = _parse_iso_date(meta.get("due_date", ""))
-	details["category"] = (meta.get("category") or "General").strip() or "General"
-	details["target_course"] = _normalize_checklist_target_course(meta.get("target_course", "BOTH"))
-	details["target_semester"] = _normalize_checklist_target_semester(meta.get("target_semester", "all"))
-	details["target_section"] = _normalize_checklist_section(meta.get("target_section", "all"))
-	details["tasks"] = [item.strip() for item in meta.get("tasks", []) if str(item).strip()]
-	details["completed_tasks"] = _normalize_checklist_indexes(meta.get("completed_tasks", []), len(details["tasks"]))
-	details["completion_locked"] = bool(meta.get("completion_locked", False))
-	details["group_id"] = (meta.get("group_id") or "").strip()
-	attachment = meta.get("attachment")
-	details["attachment"] = attachment if isinstance(attachment, dict) else None
-	details["description"] = remainder.strip()
-	return details
-
-
-def _serialize_checklist_description(details: dict):
-	due_date = details.get("due_date")
-	meta = {
-		"subject": (details.get("subject") or "No specific subject").strip() or "No specific subject",
-		"priority": _normalize_checklist_priority(details.get("priority", "medium")),
-		"due_date": due_date.strftime("%Y-%m-%d") if due_date else "",
-		"category": (details.get("category") or "General").strip() or "General",
-		"target_course": _normalize_checklist_target_course(details.get("target_course", "BOTH")),
-		"target_semester": _normalize_checklist_target_semester(details.get("target_semester", "all")),
-		"target_section": _normalize_checklist_section(details.get("target_section", "all")),
-		"tasks": [item.strip() for item in details.get("tasks", []) if str(item).strip()],
-		"completed_tasks": _normalize_checklist_indexes(
-			details.get("completed_tasks", []),
-			len([item.strip() for item in details.get("tasks", []) if str(item).strip()]),
-		),
-		"completion_locked": bool(details.get("completion_locked", False)),
-		"group_id": (details.get("group_id") or "").strip(),
-		"attachment": details.get("attachment") if isinstance(details.get("attachment"), dict) else None,
-	}
-	meta_blob = f"{CHECKLIST_META_PREFIX}{json.dumps(meta, separators=(',', ':'))}"
-	body = (details.get("description") or "").strip()
-	if body:
-		return f"{meta_blob}\n{body}"
-	return meta_blob
-
-
-def _checklist_task_state(title: str, details: dict, is_completed: bool):
-	tasks = [item.strip() for item in details.get("tasks", []) if str(item).strip()]
-	if not tasks:
-		fallback = details.get("description") or title or "Complete this checklist item"
-		tasks = [str(fallback).strip()]
-	completed_indexes = _normalize_checklist_indexes(details.get("completed_tasks", []), len(tasks))
-	if is_completed and not completed_indexes:
-		completed_indexes = list(range(len(tasks)))
-	if len(completed_indexes) == len(tasks):
-		state = "complete"
-	elif completed_indexes:
-		state = "partial"
-	else:
-		state = "null"
+def _checklist_task_payload(checklist: Checklist):
+	state = checklist_progress(checklist, group_task_texts(checklist.group))
+	due_date = checklist.group.due_date if checklist.group else None
+	due_state = _checklist_due_state(due_date, state["state"])
 	return {
-		"tasks": tasks,
-		"completed_indexes": completed_indexes,
-		"total": len(tasks),
-		"completed": len(completed_indexes),
-		"state": state,
+		"id": checklist.id,
+		"version": checklist.version,
+		"completed_indexes": state["completed_indexes"],
+		"completed_tasks": state["completed"],
+		"total_tasks": state["total"],
+		"state": state["state"],
+		"due_state": due_state,
+		"due_label": _checklist_due_label(due_date, due_state),
+		"completion_locked": checklist.completion_locked,
 	}
 
 
@@ -449,36 +410,6 @@ def _split_feedback_tags(raw_value: str):
 	return [token.strip() for token in raw_value.split(",") if token.strip()]
 
 
-def _extract_post_tags(title: str, content: str):
-	corpus = f"{title} {content}".lower()
-	keyword_map = {
-		"algorithms": ["algorithm", "dsa", "graph", "dynamic programming", "sorting", "search"],
-		"backtracking": ["backtracking", "n-queen", "subset", "recursive"],
-		"recursion": ["recursion", "recursive", "stack"],
-		"exam-prep": ["exam", "viva", "revision", "question"],
-		"dbms": ["dbms", "database", "sql", "normalization", "transaction"],
-		"normalization": ["1nf", "2nf", "3nf", "bcnf", "normalization"],
-		"software-engineering": ["software engineering", "sdlc", "agile", "testing"],
-		"ci-cd": ["ci/cd", "pipeline", "deployment", "github actions", "gitlab"],
-		"devops": ["devops", "docker", "kubernetes", "container"],
-		"machine-learning": ["machine learning", "ml", "model", "training"],
-		"pytorch": ["pytorch", "tensor", "cuda"],
-		"cuda": ["cuda", "gpu", "nvidia"],
-		"3nf": ["3nf"],
-		"bcnf": ["bcnf"],
-	}
-
-	tags = []
-	for label, tokens in keyword_map.items():
-		if any(token in corpus for token in tokens):
-			tags.append(label)
-
-	if not tags:
-		tags = ["study-notes", "student-experience"]
-
-	return tags[:5]
-
-
 def _parse_csv_values(raw_value: str, *, uppercase: bool = False):
 	if not raw_value:
 		return []
@@ -524,24 +455,6 @@ def _student_matches_intervention(post: KnowledgePost, student: User, semester_v
 	return True
 
 
-def _knowledge_reaction_counts(post_ids):
-	if not post_ids:
-		return {}, {}
-	like_rows = (
-		db.session.query(KnowledgeReaction.post_id, func.count(KnowledgeReaction.id))
-		.filter(KnowledgeReaction.post_id.in_(post_ids), KnowledgeReaction.reaction_type == "like")
-		.group_by(KnowledgeReaction.post_id)
-		.all()
-	)
-	bookmark_rows = (
-		db.session.query(KnowledgeReaction.post_id, func.count(KnowledgeReaction.id))
-		.filter(KnowledgeReaction.post_id.in_(post_ids), KnowledgeReaction.reaction_type == "bookmark")
-		.group_by(KnowledgeReaction.post_id)
-		.all()
-	)
-	return ({row[0]: row[1] for row in like_rows}, {row[0]: row[1] for row in bookmark_rows})
-
-
 def _intervention_target_summary(post: KnowledgePost):
 	courses = _parse_csv_values(post.target_courses, uppercase=True)
 	semesters = _parse_csv_values(post.target_semesters)
@@ -585,7 +498,7 @@ def _predict_realtime_semester(student: User | None) -> int | None:
 		return None
 
 	course_code = (profile.course_code or (student.course if student else "") or "MCA").strip().upper()
-	config = CourseConfig.query.filter_by(course_code=course_code, is_active=True).first()
+	config = course_config_for(course_code)
 	semesters_per_year = int(config.semesters_per_year) if config and config.semesters_per_year else 2
 	max_semester = int(profile.max_semester or (config.total_semesters if config else 4) or 4)
 
@@ -793,7 +706,7 @@ def _reviews_filter_options(student: User | None):
 @login_required
 @role_required("student")
 def dashboard():
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	subject_catalog = _load_subject_catalog(student.course if student else "MCA")
 	current_semester_display = 1
 	profile = student.student_profile if student else None
@@ -812,7 +725,6 @@ def dashboard():
 	merged_feedback = _merge_student_feedback_rows(student.id)
 	feedback_items = merged_feedback[:5]
 	total_feedback = len(merged_feedback)
-	checklists = Checklist.query.filter_by(student_id=student.id).order_by(Checklist.created_at.desc()).all()
 	student_course = (student.course or "").strip().upper() if student else ""
 	if student_course not in {"MCA", "BCA"}:
 		student_course = "MCA"
@@ -827,15 +739,21 @@ def dashboard():
 	if checklist_filter_status not in {"all", "complete", "partial", "null"}:
 		checklist_filter_status = "all"
 
-	checklist_category_pool = set(EXPERIENCE_CATEGORIES)
-	for item in checklists:
-		details = _parse_checklist_description(item.description or "")
-		if details.get("category"):
-			checklist_category_pool.add(details["category"])
-	checklist_category_options = sorted(checklist_category_pool)
+	checklist_category_options = sorted(set(EXPERIENCE_CATEGORIES) | _student_checklist_categories(student.id))
 	if checklist_filter_category != "all" and checklist_filter_category not in checklist_category_options:
 		checklist_filter_category = "all"
 
+	checklists = _filter_checklist_status(
+		_student_checklist_query(
+			student.id,
+			course=checklist_filter_course,
+			category=checklist_filter_category,
+			semester=checklist_filter_semester,
+			section=checklist_filter_section,
+		),
+		checklist_filter_status,
+	).all()
+
 	dashboard_checklists = []
 	total_task_units = 0
 	completed_task_units = 0
@@ -843,24 +761,8 @@ def dashboard():
 	partial_checklists = 0
 	null_checklists = 0
 	for item in checklists:
-		details = _parse_checklist_description(item.description or "")
-		target_course = details.get("target_course", "BOTH")
-		target_semester = details.get("target_semester", "all")
-		target_section = details.get("target_section", "all")
-		if checklist_filter_course == "BOTH" and target_course != "BOTH":
-			continue
-		if checklist_filter_course in {"MCA", "BCA"} and target_course not in {checklist_filter_course, "BOTH"}:
-			continue
-		if checklist_filter_category != "all" and details.get("category", "General") != checklist_filter_category:
-			continue
-		if checklist_filter_semester != "all" and target_semester not in {"all", checklist_filter_semester}:
-			continue
-		if checklist_filter_section != "all" and target_section not in {"all", checklist_filter_section}:
-			continue
-
-		state = _checklist_task_state(item.title, details, item.is_completed)
-		if checklist_filter_status != "all" and state["state"] != checklist_filter_status:
-			continue
+		details = checklist_group_details(item.group)
+		state = checklist_progress(item, details["tasks"])
 		completed_indexes = set(state["completed_indexes"])
 		total_task_units += state["total"]
 		completed_task_units += state["completed"]
@@ -1150,8 +1052,10 @@ def _apply_feedback_payload(feedback_item: Feedback, payload: dict) -> int:
 	feedback_item.feedback_tags = payload["feedback_tags"]
 	feedback_item.class_session_at = payload["class_session_at"]
 	feedback_item.feedback_text = payload["feedback_text"]
-	sentiment, confidence = analyze_sentiment_with_confidence(payload["feedback_text"])
+	sentiment, confidence = analyze_sentiment_cached(payload["feedback_text"])
 	feedback_item.sentiment = sentiment
+	feedback_item.sentiment_confidence = confidence
+	feedback_item.sentiment_version = SENTIMENT_VERSION
 	feedback_item.status = "approved" if feedback_item.sentiment == "positive" else "under_review"
 	feedback_item.admin_note = None
 	return confidence
@@ -1161,7 +1065,7 @@ def _apply_feedback_payload(feedback_item: Feedback, payload: dict) -> int:
 @login_required
 @role_required("student")
 def submit_feedback():
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	payload, error = _validate_feedback_form(request.form, student)
 	if error:
 		flash(error, "danger")
@@ -1178,7 +1082,7 @@ def submit_feedback():
 		result_status = feedback.status
 		delivery_state = "faculty"
 	else:
-		sentiment, confidence = analyze_sentiment_with_confidence(payload["feedback_text"])
+		sentiment, confidence = analyze_sentiment_cached(payload["feedback_text"])
 		queue_status = "holding" if sentiment == "positive" else "under_review"
 		pending = PendingFacultyFeedback(
 			student_id=session["user_id"],
@@ -1196,6 +1100,7 @@ def submit_feedback():
 			feedback_text=payload["feedback_text"],
 			sentiment=sentiment,
 			sentiment_confidence=confidence,
+			sentiment_version=SENTIMENT_VERSION,
 			status=queue_status,
 		)
 		db.session.add(pending)
@@ -1229,7 +1134,7 @@ def sentiment_preview():
 	if not text:
 		return jsonify({"error": "Feedback text is required."}), 400
 
-	sentiment, confidence = analyze_sentiment_with_confidence(text)
+	sentiment, confidence = analyze_sentiment_cached(text)
 	return jsonify({"sentiment": sentiment, "confidence": confidence})
 
 
@@ -1279,7 +1184,7 @@ def reviews():
 	elif selected_tag != "all":
 		selected_tag = "all"
 
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	current_semester_display, subject_filter_options, faculty_filter_options = _reviews_filter_options(student)
 	faculty_list = User.query.filter_by(role="faculty", is_active=True).order_by(User.full_name.asc()).all()
 
@@ -1315,7 +1220,7 @@ def reviews():
 @login_required
 @role_required("student")
 def create_review():
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	payload, error = _validate_feedback_form(request.form, student)
 	if error:
 		flash(error, "danger")
@@ -1339,7 +1244,7 @@ def edit_review(feedback_id: int):
 		flash("Review not found.", "danger")
 		return redirect(url_for("student.reviews"))
 
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	faculty_list = User.query.filter_by(role="faculty", is_active=True).order_by(User.full_name.asc()).all()
 	subject_catalog = _load_subject_catalog(student.course if student else "MCA")
 	selected_tags = _split_feedback_tags(feedback_item.feedback_tags)
@@ -1392,14 +1297,16 @@ def delete_review(feedback_id: int):
 @role_required("student")
 def knowledge_board():
 	search = request.args.get("q", "").strip()
-	sort_by = request.args.get("sort", "most_upvoted").strip().lower()
+	sort_by = request.args.get("sort", "relevance" if search else "most_upvoted").strip().lower()
 	date_from_value = request.args.get("date_from", "").strip()
 	date_to_value = request.args.get("date_to", "").strip()
 	date_from = _parse_iso_date(date_from_value)
 	date_to = _parse_iso_date(date_to_value)
-	if sort_by not in {"most_upvoted", "oldest", "recent"}:
+	selected_tag = request.args.get("tag", "").strip().lower()
+	cursor = request.args.get("after", "").strip()
+	if sort_by not in {"most_upvoted", "oldest", "recent", "relevance"} or (sort_by == "relevance" and not search):
 		sort_by = "most_upvoted"
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	current_semester = _predict_realtime_semester(student)
 	if current_semester is None and student and student.student_profile and student.student_profile.current_semester:
 		try:
@@ -1407,37 +1314,77 @@ def knowledge_board():
 		except (TypeError, ValueError):
 			current_semester = None
 
-	posts = (
-		KnowledgePost.query.join(User, KnowledgePost.author_id == User.id)
-		.filter(User.role == "faculty", KnowledgePost.status == "published")
-		.order_by(KnowledgePost.created_at.desc())
-		.all()
-	)
-	posts = [post for post in posts if student and _student_matches_intervention(post, student, current_semester)]
-	post_ids = [post.id for post in posts]
-	now = datetime.utcnow()
-	if post_ids:
-		existing_views = {
-			row.post_id: row
-			for row in KnowledgeView.query.filter(
-				KnowledgeView.user_id == session["user_id"],
-				KnowledgeView.post_id.in_(post_ids),
-			).all()
+	seen_at = student.knowledge_updates_seen_at if student else None
+	seen_revision_id = student.knowledge_updates_seen_revision_id if student else None
+	unread_updates = unread_post_updates(session["user_id"], seen_at, seen_revision_id)
+	notification_items = [
+		{
+			"message": f"Intervention updated: {title}. Please review the latest changes.",
+			"created_at": revised_at,
+			"post_id": post_id,
 		}
-		for post_id in post_ids:
-			view = existing_views.get(post_id)
-			if view:
-				view.last_opened_at = now
-				continue
-			db.session.add(
-				KnowledgeView(
-					post_id=post_id,
-					user_id=session["user_id"],
-					first_opened_at=now,
-					last_opened_at=now,
-				)
+		for post_id, title, revised_at, _ in unread_updates
+	]
+	if student and (unread_updates or seen_at is None):
+		# Move the watermark to the newest update shown rather than "now", so an
+		# edit committed while this page was loading, and any unread updates
+		# past the shown limit (even one with the same timestamp), still show
+		# next time.
+		if unread_updates:
+			student.knowledge_updates_seen_at, student.knowledge_updates_seen_revision_id = unread_updates[0][2:]
+		else:
+			student.knowledge_updates_seen_at = datetime.utcnow()
+			student.knowledge_updates_seen_revision_id = None
+		# Commit before loading the board so the cards are not expired by it.
+		db.session.commit()
+
+	posts = []
+	board_tags = []
+	next_cursor = None
+	if student:
+		posts_query = (
+			KnowledgePost.query.join(User, KnowledgePost.author_id == User.id)
+			.options(contains_eager(KnowledgePost.author))
+			.filter(
+				User.role == "faculty",
+				KnowledgePost.status == "published",
+				student_target_filter(
+					_student_course_for_intervention(student),
+					current_semester,
+					student.section,
+				),
 			)
-	like_counts, bookmark_counts = _knowledge_reaction_counts(post_ids)
+		)
+		search_hits = None
+		if search:
+			search_hits = post_search(search)
+			posts_query = posts_query.join(search_hits, search_hits.c.post_id == KnowledgePost.id)
+		if date_from:
+			posts_query = posts_query.filter(KnowledgePost.created_at >= datetime.combine(date_from, time.min))
+		if date_to:
+			posts_query = posts_query.filter(KnowledgePost.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+		board_tags = tag_counts(
+			posts_query,
+			cache_key=(
+				"student",
+				_student_course_for_intervention(student),
+				current_semester,
+				student.section,
+				search,
+				date_from,
+				date_to,
+			),
+		)
+		if selected_tag:
+			posts_query = posts_query.filter(post_tag_filter(selected_tag))
+		posts_query, order_keys = board_order_keys(posts_query, sort_by, search_hits)
+		after = decode_board_cursor(cursor, sort_by, len(order_keys))
+		posts, next_keys = keyset_page(posts_query, order_keys, after, KNOWLEDGE_BOARD_PER_PAGE)
+		if next_keys is not None:
+			next_cursor = encode_board_cursor(sort_by, next_keys)
+	post_ids = [post.id for post in posts]
+	attachments = attachments_by_post(post_ids)
+	post_tags = tags_by_post(post_ids)
 	reaction_rows = []
 	if post_ids:
 		reaction_rows = KnowledgeReaction.query.filter(
@@ -1448,91 +1395,34 @@ def knowledge_board():
 
 	board_cards = []
 	for post in posts:
-		tags = _extract_post_tags(
-			post.title,
-			" ".join(
-				[
-					post.content or "",
-					post.problem_context or "",
-					post.solution_steps or "",
-					post.resource_references or "",
-					post.outcome_result or "",
-				]
-			),
-		)
-		likes = like_counts.get(post.id, 0)
-		bookmarks = bookmark_counts.get(post.id, 0)
+		likes = post.like_count
+		bookmarks = post.bookmark_count
 		board_cards.append(
 			{
 				"post": post,
-				"tags": tags,
+				"tags": post_tags[post.id],
 				"likes": likes,
 				"bookmarks": bookmarks,
 				"comments": 0,
 				"rank": (likes * 2) + bookmarks,
-				"attachments": post.attachments.order_by(KnowledgeAttachment.created_at.desc()).all(),
+				"attachments": attachments[post.id],
 				"target_summary": _intervention_target_summary(post),
 				"liked": (post.id, "like") in active_reactions,
 				"bookmarked": (post.id, "bookmark") in active_reactions,
 			}
 		)
 
-	if search:
-		needle = search.lower()
-		board_cards = [
-			item
-			for item in board_cards
-			if needle in item["post"].title.lower()
-			or needle in (item["post"].author.full_name or "").lower()
-		]
-
-	if date_from:
-		board_cards = [
-			item
-			for item in board_cards
-			if item["post"].created_at and item["post"].created_at.date() >= date_from
-		]
-
-	if date_to:
-		board_cards = [
-			item
-			for item in board_cards
-			if item["post"].created_at and item["post"].created_at.date() <= date_to
-		]
-
-	if sort_by == "recent":
-		board_cards.sort(key=lambda item: item["post"].created_at, reverse=True)
-	elif sort_by == "oldest":
-		board_cards.sort(key=lambda item: item["post"].created_at)
-	else:
-		board_cards.sort(key=lambda item: item["rank"], reverse=True)
-
-	unread_notifications = (
-		KnowledgeNotification.query.filter_by(user_id=session["user_id"], is_read=False)
-		.order_by(KnowledgeNotification.created_at.desc())
-		.limit(12)
-		.all()
-	)
-	notification_items = [
-		{
-			"message": note.message,
-			"created_at": note.created_at,
-			"post_id": note.post_id,
-		}
-		for note in unread_notifications
-	]
-	if unread_notifications:
-		for note in unread_notifications:
-			note.is_read = True
-	db.session.commit()
-
-	return render_template(
+	page = render_template(
 		"knowledge_board.html",
 		board_cards=board_cards,
 		search=search,
 		sort_by=sort_by,
 		date_from_value=date_from_value if date_from else "",
 		date_to_value=date_to_value if date_to else "",
+		board_tags=board_tags,
+		selected_tag=selected_tag,
+		next_cursor=next_cursor,
+		is_first_page=not cursor,
 		board_filter_endpoint="student.knowledge_board",
 		board_page_title="Knowledge Board",
 		board_heading="Knowledge Board",
@@ -1553,13 +1443,18 @@ def knowledge_board():
 		notification_items=notification_items,
 		enable_compose_modal=False,
 	)
+	# Recorded after rendering: with the buffer off this commits, which would
+	# expire the cards the template still has to read.
+	if post_ids:
+		record_knowledge_views(session["user_id"], post_ids)
+	return page
 
 
 @student_bp.route("/resource-post/<int:post_id>/detail")
 @login_required
 @role_required("student")
 def resource_post_detail(post_id: int):
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	if not student:
 		return jsonify({"error": "not_found"}), 404
 
@@ -1578,15 +1473,7 @@ def resource_post_detail(post_id: int):
 	if not post or not _student_matches_intervention(post, student, current_semester):
 		return jsonify({"error": "not_found"}), 404
 
-	likes, bookmarks = _knowledge_reaction_counts([post.id])
-	opened_count = (
-		db.session.query(func.count(KnowledgeView.id)).filter(KnowledgeView.post_id == post.id).scalar() or 0
-	)
-	reach_count = (
-		db.session.query(func.count(func.distinct(KnowledgeView.user_id))).filter(KnowledgeView.post_id == post.id).scalar()
-		or 0
-	)
-	attachments = post.attachments.order_by(KnowledgeAttachment.created_at.desc()).all()
+	attachments = attachments_by_post([post.id])[post.id]
 
 	payload = {
 		"id": post.id,
@@ -1602,15 +1489,16 @@ def resource_post_detail(post_id: int):
 		"created_at_ist": _utc_to_ist(post.created_at).strftime("%d %b %Y %I:%M %p") if post.created_at else "-",
 		"target": _intervention_target_summary(post),
 		"metrics": {
-			"likes": int(likes.get(post.id, 0)),
-			"saved": int(bookmarks.get(post.id, 0)),
-			"opened": int(opened_count),
-			"reach": int(reach_count),
+			"likes": post.like_count,
+			"saved": post.bookmark_count,
+			"opened": post.open_count,
+			# knowledge_views holds one row per student, so reach is the open count.
+			"reach": post.open_count,
 		},
 		"attachments": [
 			{
 				"name": attachment.file_name,
-				"url": url_for("static", filename=attachment.file_path),
+				"url": url_for("attachments.knowledge_attachment", attachment_id=attachment.id),
 			}
 			for attachment in attachments
 		],
@@ -1663,7 +1551,7 @@ def react_knowledge_post(post_id: int):
 		flash("Invalid reaction type.", "danger")
 		return redirect(request.referrer or url_for("student.knowledge_board"))
 
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	if not student:
 		flash("Student account not found.", "danger")
 		return redirect(url_for("auth.logout"))
@@ -1699,6 +1587,7 @@ def react_knowledge_post(post_id: int):
 				reaction_type=reaction_type,
 			)
 		)
+	bump_post_counter(REACTION_COUNTERS[reaction_type], {post_id: -1 if existing else 1})
 	db.session.commit()
 	return redirect(request.referrer or url_for("student.knowledge_board"))
 
@@ -1810,7 +1699,7 @@ def create_experience():
 		flash("Experience body must not exceed 10,000 characters.", "danger")
 		return redirect(url_for("student.create_experience"))
 
-	sentiment, confidence = analyze_sentiment_with_confidence(body)
+	sentiment, confidence = analyze_sentiment_cached(body)
 	auto_status = _experience_auto_status(sentiment)
 
 	anon_id = _generate_experience_anon_id()
@@ -1824,6 +1713,7 @@ def create_experience():
 		resource_links=resource_links if resource_links else None,
 		sentiment=sentiment,
 		sentiment_confidence=confidence,
+		sentiment_version=SENTIMENT_VERSION,
 		status=auto_status,
 	)
 	db.session.add(exp)
@@ -1930,7 +1820,7 @@ def edit_experience(exp_id: int):
 		flash("Experience body must not exceed 10,000 characters.", "danger")
 		return redirect(url_for("student.edit_experience", exp_id=exp_id))
 
-	sentiment, confidence = analyze_sentiment_with_confidence(body)
+	sentiment, confidence = analyze_sentiment_cached(body)
 	next_status = _experience_auto_status(sentiment)
 
 	exp.title = title
@@ -1940,6 +1830,7 @@ def edit_experience(exp_id: int):
 	exp.resource_links = resource_links if resource_links else None
 	exp.sentiment = sentiment
 	exp.sentiment_confidence = confidence
+	exp.sentiment_version = SENTIMENT_VERSION
 	exp.status = next_status
 	exp.admin_note = None
 	db.session.commit()
@@ -2079,7 +1970,7 @@ def delete_knowledge_post(post_id: int):
 @login_required
 @role_required("student")
 def profile_settings():
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	if not student:
 		flash("Student account not found.", "danger")
 		return redirect(url_for("auth.logout"))
@@ -2276,10 +2167,7 @@ def toggle_checklist(checklist_id: int):
 	section_filter = _normalize_checklist_section(request.form.get("section", "all"))
 	action = (request.form.get("action") or "toggle_task").strip().lower()
 
-	details = _parse_checklist_description(checklist.description or "")
-	state = _checklist_task_state(checklist.title, details, checklist.is_completed)
-	if details.get("completion_locked"):
-		flash("Checklist is finalized and cannot be changed.", "warning")
+	def _back():
 		if redirect_target == "student.dashboard":
 			return redirect(url_for("student.dashboard"))
 		return redirect(
@@ -2293,92 +2181,81 @@ def toggle_checklist(checklist_id: int):
 			)
 		)
 
-	if action == "mark_complete":
-		details["tasks"] = list(state["tasks"])
-		details["completed_tasks"] = list(range(len(state["tasks"])))
-		details["completion_locked"] = True
-		checklist.description = _serialize_checklist_description(details)
-		checklist.is_completed = True
-		db.session.commit()
-		flash("Checklist marked as completed permanently.", "success")
-		if redirect_target == "student.dashboard":
-			return redirect(url_for("student.dashboard"))
-		return redirect(
-			url_for(
-				"student.my_checklists",
-				status=status_filter,
-				course=course_filter,
-				category=category_filter,
-				semester=semester_filter,
-				section=section_filter,
-			)
-		)
+	state = checklist_progress(checklist, group_task_texts(checklist.group))
+	if checklist.completion_locked:
+		flash("Checklist is finalized and cannot be changed.", "warning")
+		return _back()
 
-	current = set(state["completed_indexes"])
 	task_index_raw = (request.form.get("task_index") or "").strip()
-
-	if task_index_raw:
+	if action != "mark_complete" and task_index_raw:
 		try:
 			task_index = int(task_index_raw)
 		except ValueError:
 			flash("Invalid checklist task selection.", "danger")
-			if redirect_target == "student.dashboard":
-				return redirect(url_for("student.dashboard"))
-			return redirect(
-				url_for(
-					"student.my_checklists",
-					status=status_filter,
-					course=course_filter,
-					category=category_filter,
-					semester=semester_filter,
-					section=section_filter,
-				)
-			)
+			return _back()
 
 		if task_index < 0 or task_index >= len(state["tasks"]):
 			flash("Checklist task index is out of range.", "danger")
-			if redirect_target == "student.dashboard":
-				return redirect(url_for("student.dashboard"))
-			return redirect(
-				url_for(
-					"student.my_checklists",
-					status=status_filter,
-					course=course_filter,
-					category=category_filter,
-					semester=semester_filter,
-					section=section_filter,
-				)
-			)
+			return _back()
 
-		if task_index in current:
-			current.remove(task_index)
-		else:
-			current.add(task_index)
+		done = task_index not in state["completed_indexes"]
+		if set_checklist_task(checklist.id, session["user_id"], task_index, done) is None:
+			db.session.rollback()
+			flash("Checklist changed while you were updating it. Please try again.", "warning")
+			return _back()
+		db.session.commit()
+		return _back()
+
+	if action == "mark_complete":
+		checklist.completed_mask = full_task_mask(state["total"])
+		checklist.completion_locked = True
+		checklist.is_completed = True
 	else:
 		if state["state"] == "complete":
-			current = set()
+			updated_completed = []
 		else:
-			current = set(range(len(state["tasks"])))
+			updated_completed = list(range(len(state["tasks"])))
+		checklist.completed_mask = mask_from_indexes(updated_completed, state["total"])
+		checklist.is_completed = bool(state["tasks"]) and len(updated_completed) == len(state["tasks"])
 
-	updated_completed = sorted(current)
-	details["tasks"] = list(state["tasks"])
-	details["completed_tasks"] = updated_completed
-	checklist.description = _serialize_checklist_description(details)
-	checklist.is_completed = bool(state["tasks"]) and len(updated_completed) == len(state["tasks"])
-	db.session.commit()
+	try:
+		db.session.commit()
+	except StaleDataError:
+		db.session.rollback()
+		flash("Checklist changed while you were updating it. Please try again.", "warning")
+		return _back()
 
-	if redirect_target == "student.dashboard":
-		return redirect(url_for("student.dashboard"))
-	return redirect(
-		url_for(
-			"student.my_checklists",
-			status=status_filter,
-			course=course_filter,
-			category=category_filter,
-			semester=semester_filter,
-			section=section_filter,
-		)
-	)
+	if action == "mark_complete":
+		flash("Checklist marked as completed permanently.", "success")
+	return _back()
+
+
+@student_bp.route("/checklist/<int:checklist_id>/task", methods=["POST"])
+@login_required
+@role_required("student")
+def update_checklist_task(checklist_id: int):
+	checklist = Checklist.query.filter_by(id=checklist_id, student_id=session["user_id"]).first()
+	if not checklist:
+		return jsonify({"error": "not_found"}), 404
+
+	payload = request.get_json(silent=True) or {}
+	tasks = group_task_texts(checklist.group)
+	try:
+		task_index = int(payload.get("task_index"))
+	except (TypeError, ValueError):
+		return jsonify({"error": "invalid_task"}), 400
+	if task_index < 0 or task_index >= len(tasks):
+		return jsonify({"error": "invalid_task"}), 400
+
+	updated = set_checklist_task(checklist.id, session["user_id"], task_index, bool(payload.get("done")))
+	if updated is None:
+		db.session.rollback()
+		db.session.refresh(checklist)
+		error = "locked" if checklist.completion_locked else "conflict"
+		return jsonify({"error": error, **_checklist_task_payload(checklist)}), 409
+
+	db.session.commit()
+	return jsonify(_checklist_task_payload(checklist))
 
 
 @student_bp.route("/checklists")
@@ -2388,7 +2265,7 @@ def my_checklists():
 	status = request.args.get("status", "all").strip().lower()
 	if status not in {"all", "complete", "partial", "null"}:
 		status = "all"
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	student_course = (student.course or "").strip().upper() if student else ""
 	if student_course not in {"MCA", "BCA"}:
 		student_course = "MCA"
@@ -2399,16 +2276,16 @@ def my_checklists():
 	selected_category = (request.args.get("category") or "all").strip()
 	selected_semester = _normalize_checklist_target_semester(request.args.get("semester", "all"))
 	selected_section = _normalize_checklist_section(request.args.get("section", "all"))
-	all_items = Checklist.query.filter_by(student_id=session["user_id"]).order_by(Checklist.created_at.desc()).all()
-
-	category_pool = set(EXPERIENCE_CATEGORIES)
-	for item in all_items:
-		details = _parse_checklist_description(item.description or "")
-		if details.get("category"):
-			category_pool.add(details["category"])
-	category_options = sorted(category_pool)
+	category_options = sorted(set(EXPERIENCE_CATEGORIES) | _student_checklist_categories(session["user_id"]))
 	if selected_category != "all" and selected_category not in category_options:
 		selected_category = "all"
+	all_items = _student_checklist_query(
+		session["user_id"],
+		course=selected_course,
+		category=selected_category,
+		semester=selected_semester,
+		section=selected_section,
+	).all()
 
 	total_task_units = 0
 	completed_task_units = 0
@@ -2420,21 +2297,11 @@ def my_checklists():
 	checklist_cards = []
 	for item in all_items:
 		days_open = max((datetime.utcnow() - item.created_at).days, 0)
-		details = _parse_checklist_description(item.description or "")
-		target_course = details.get("target_course", "BOTH")
-		target_semester = details.get("target_semester", "all")
-		target_section = details.get("target_section", "all")
-		if selected_course == "BOTH" and target_course != "BOTH":
-			continue
-		if selected_course in {"MCA", "BCA"} and target_course not in {selected_course, "BOTH"}:
-			continue
-		if selected_category != "all" and details.get("category", "General") != selected_category:
-			continue
-		if selected_semester != "all" and target_semester not in {"all", selected_semester}:
-			continue
-		if selected_section != "all" and target_section not in {"all", selected_section}:
-			continue
-		state = _checklist_task_state(item.title, details, item.is_completed)
+		details = checklist_group_details(item.group)
+		target_course = details["target_course"]
+		target_semester = details["target_semester"]
+		target_section = details["target_section"]
+		state = checklist_progress(item, details["tasks"])
 		due_state = _checklist_due_state(details["due_date"], state["state"])
 		due_label = _checklist_due_label(details["due_date"], due_state)
 
@@ -2475,8 +2342,8 @@ def my_checklists():
 				"target_course": target_course,
 				"target_semester": target_semester,
 				"target_section": target_section,
-				"completion_locked": bool(details.get("completion_locked", False)),
-				"can_mark_complete": not bool(details.get("completion_locked", False)),
+				"completion_locked": item.completion_locked,
+				"can_mark_complete": not item.completion_locked,
 				"due_label": due_label,
 				"due_state": due_state,
 				"days_open": days_open,
@@ -2525,6 +2392,8 @@ def my_checklists():
 		null_count=null_count,
 		overdue_count=overdue_count,
 		progress_percent=progress_percent,
+		total_task_units=total_task_units,
+		completed_task_units=completed_task_units,
 	)
 
 
@@ -2532,7 +2401,7 @@ def my_checklists():
 @login_required
 @role_required("student")
 def submit_feedback_page():
-	student = User.query.get(session["user_id"])
+	student = current_user()
 	student_course = (student.course if student else "MCA").strip().upper()
 	student_section = (student.section if student else "").strip().upper()
 	current_semester_display = _predict_realtime_semester(student) or 1
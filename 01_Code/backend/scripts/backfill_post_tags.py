@@ -0,0 +1,60 @@
+"""
+ClarifAI Knowledge Post Tag Backfill
+====================================
+Recomputes the stored tags (knowledge_post_tags) of every knowledge post from
+its text, e.g. after the keyword map in knowledge_store.py changes.
+
+Posts that have never been tagged are already filled in when the app starts;
+this script re-tags every post so existing rows follow the current keywords.
+
+USAGE:
+    cd 01_Code\\backend
+
+    # List the posts whose tags would change, without writing anything
+    py -3.11 scripts/backfill_post_tags.py --dry-run
+
+    # Re-tag every post
+    py -3.11 scripts/backfill_post_tags.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app import app
+from knowledge_store import backfill_post_tags, extract_post_tags, tags_by_post
+from models import KnowledgePost
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Recompute stored knowledge post tags from the post text.")
+    parser.add_argument("--dry-run", action="store_true", help="Only list posts whose tags would change.")
+    args = parser.parse_args()
+
+    with app.app_context():
+        posts = KnowledgePost.query.order_by(KnowledgePost.id).all()
+        stored = tags_by_post([post.id for post in posts])
+        changed = []
+        for post in posts:
+            wanted = extract_post_tags(post)
+            if stored[post.id] != wanted:
+                changed.append(post.id)
+                print(f"post {post.id}: {', '.join(stored[post.id]) or '-'} -> {', '.join(wanted)}")
+
+        if args.dry_run:
+            print(f"{len(changed)} of {len(posts)} posts would be re-tagged.")
+            return 0
+
+        backfill_post_tags(rebuild=True)
+        print(f"Re-tagged {len(posts)} posts; {len(changed)} changed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
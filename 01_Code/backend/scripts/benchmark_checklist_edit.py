@@ -0,0 +1,226 @@
+"""
+ClarifAI Checklist Edit Benchmark
+=================================
+Times one faculty edit of a checklist group (a task inserted at the front and
+another removed) for groups of different sizes and compares:
+
+    - per-object: the previous path. It loads every assignment row of the
+      group and rewrites title, completed_mask and is_completed one ORM object
+      at a time in a single commit.
+    - set-based: the current path. A single UPDATE remaps every row's mask
+      in SQL (checklist_store.update_group_assignments).
+
+Both paths produce the same masks; the run fails if they do not.
+
+The benchmark runs against a throwaway SQLite file configured before the app
+is imported; the real database is never touched.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/benchmark_checklist_edit.py
+    py -3.11 scripts/benchmark_checklist_edit.py --sizes 1000 5000 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import config
+
+WORK_DIR = tempfile.TemporaryDirectory(prefix="clarifai_edit_bench_")
+config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(WORK_DIR.name) / 'bench.db'}"
+config.Config.ADMIN_BOOTSTRAP_ENABLED = False
+config.Config.SENTIMENT_WARMUP_ENABLED = False
+config.Config.USER_DELETE_GUARD_ENABLED = False
+
+from sqlalchemy import event, insert, update
+
+from app import app
+from checklist_store import (
+    full_task_mask,
+    group_task_texts,
+    publish_checklist_group,
+    replace_group_tasks,
+    task_position_map,
+    update_group_assignments,
+)
+from models import Checklist, ChecklistGroup, ChecklistTask, User, db
+
+
+OLD_TASKS = ["Read the notes", "Solve the worksheet", "Submit the summary", "Attend the review"]
+NEW_TASKS = ["Watch the recording", "Read the notes", "Submit the summary", "Attend the review"]
+
+
+class _WriteLockTimer:
+    def __init__(self):
+        self.longest_ms = 0.0
+        self._started = None
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self._started is None and statement.lstrip().split(" ", 1)[0].upper() in {"INSERT", "UPDATE", "DELETE"}:
+            self._started = time.perf_counter()
+
+    def commit(self, conn):
+        if self._started is not None:
+            self.longest_ms = max(self.longest_ms, (time.perf_counter() - self._started) * 1000)
+            self._started = None
+
+    def __enter__(self):
+        event.listen(db.engine, "before_cursor_execute", self.before_cursor_execute)
+        event.listen(db.engine, "commit", self.commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(db.engine, "before_cursor_execute", self.before_cursor_execute)
+        event.remove(db.engine, "commit", self.commit)
+
+
+def _reset_tables() -> None:
+    Checklist.query.delete(synchronize_session=False)
+    ChecklistTask.query.delete(synchronize_session=False)
+    ChecklistGroup.query.delete(synchronize_session=False)
+    User.query.delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _seed(students: int) -> int:
+    _reset_tables()
+    faculty = User(
+        unique_user_code="BFAC1",
+        full_name="Bench Faculty",
+        email="bench.faculty@example.com",
+        role="faculty",
+        faculty_id="BFAC001",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    db.session.add(faculty)
+    db.session.commit()
+
+    db.session.execute(
+        insert(User),
+        [
+            {
+                "unique_user_code": f"BS{index:06d}",
+                "full_name": f"Bench Student {index}",
+                "email": f"bench.student{index}@example.com",
+                "role": "student",
+                "course": "MCA",
+                "password_hash": "-",
+                "security_question": "-",
+                "security_answer_hash": "-",
+                "is_active": True,
+                "created_at": datetime.utcnow(),
+            }
+            for index in range(students)
+        ],
+    )
+    student_ids = [row[0] for row in db.session.query(User.id).filter(User.role == "student").order_by(User.id).all()]
+
+    group = ChecklistGroup(
+        group_key="bench-edit",
+        faculty_id=faculty.id,
+        title="Benchmark checklist",
+        due_date=date.today() + timedelta(days=7),
+        target_course="MCA",
+        target_semester="all",
+        target_section="all",
+    )
+    replace_group_tasks(group, OLD_TASKS)
+    publish_checklist_group(group, student_ids)
+
+    rng = random.Random(students)
+    full_mask = full_task_mask(len(OLD_TASKS))
+    masks = []
+    rows = db.session.query(Checklist.id, Checklist.version).filter(Checklist.group_id == group.id).all()
+    for row_id, version in rows:
+        mask = rng.randint(0, full_mask)
+        # Bulk updates by primary key check the version column like ORM flushes.
+        masks.append({"id": row_id, "version": version, "completed_mask": mask, "is_completed": mask == full_mask})
+    db.session.execute(update(Checklist), masks)
+    db.session.commit()
+    return group.id
+
+
+def _per_object_edit(group_id: int) -> int:
+    group = db.session.get(ChecklistGroup, group_id)
+    position_map = task_position_map(group_task_texts(group), NEW_TASKS)
+    replace_group_tasks(group, NEW_TASKS)
+    new_full_mask = full_task_mask(len(NEW_TASKS))
+    rows = group.assignments.all()
+    for row in rows:
+        if row.is_completed:
+            new_completed = new_full_mask
+        else:
+            new_completed = 0
+            for old, new in position_map.items():
+                if row.completed_mask & (1 << old):
+                    new_completed |= 1 << new
+        row.title = "Benchmark checklist (edited)"
+        row.completed_mask = new_completed
+        row.is_completed = new_completed == new_full_mask
+    db.session.commit()
+    return len(rows)
+
+
+def _set_based_edit(group_id: int) -> int:
+    group = db.session.get(ChecklistGroup, group_id)
+    count = update_group_assignments(group, "Benchmark checklist (edited)", NEW_TASKS)
+    db.session.commit()
+    return count
+
+
+def _mask_snapshot(group_id: int) -> list[tuple[int, bool]]:
+    return [
+        (row.completed_mask, row.is_completed)
+        for row in db.session.query(Checklist.completed_mask, Checklist.is_completed)
+        .filter(Checklist.group_id == group_id)
+        .order_by(Checklist.student_id)
+        .all()
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark group-wide checklist edits for several group sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000], help="Students per checklist group.")
+    args = parser.parse_args()
+
+    print(f"Edit: {OLD_TASKS} -> {NEW_TASKS}")
+    print()
+    print(f"{'students':>9} {'path':<10} {'total ms':>9} {'longest write ms':>17}")
+    with app.app_context():
+        for size in args.sizes:
+            snapshots = {}
+            for label, edit in (("per-object", _per_object_edit), ("set-based", _set_based_edit)):
+                group_id = _seed(size)
+                db.session.expunge_all()
+                started = time.perf_counter()
+                with _WriteLockTimer() as lock_timer:
+                    count = edit(group_id)
+                total_ms = (time.perf_counter() - started) * 1000
+                if count != size:
+                    print(f"{label}: expected {size} rows, updated {count}")
+                    return 1
+                snapshots[label] = _mask_snapshot(group_id)
+                print(f"{size:>9} {label:<10} {total_ms:>9.1f} {lock_timer.longest_ms:>17.1f}")
+            if snapshots["per-object"] != snapshots["set-based"]:
+                print(f"Masks differ between paths for {size} students.")
+                return 1
+        _reset_tables()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
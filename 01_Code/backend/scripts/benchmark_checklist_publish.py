@@ -0,0 +1,231 @@
+"""
+ClarifAI Checklist Publish Benchmark
+====================================
+Times publishing one checklist to audiences of different sizes and compares:
+
+    - per-object: the previous path. It loads every active student, filters
+      them in Python (one lazy profile load each) and adds one ORM Checklist
+      per match in a single commit.
+    - bulk: the current path. One joined query resolves the audience
+      (checklist_store.checklist_audience_ids), then chunked INSERTs write
+      the rows (checklist_store.publish_checklist_group).
+
+For each path the report shows audience time, insert time, total time and the
+longest single write transaction, which is roughly how long SQLite's write
+lock was held in one go.
+
+The benchmark runs against a throwaway SQLite file configured before the app
+is imported; the real database is never touched.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/benchmark_checklist_publish.py
+    py -3.11 scripts/benchmark_checklist_publish.py --sizes 100 1000 10000 --chunk-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import config
+
+WORK_DIR = tempfile.TemporaryDirectory(prefix="clarifai_publish_bench_")
+config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(WORK_DIR.name) / 'bench.db'}"
+config.Config.ADMIN_BOOTSTRAP_ENABLED = False
+config.Config.SENTIMENT_WARMUP_ENABLED = False
+config.Config.USER_DELETE_GUARD_ENABLED = False
+
+from sqlalchemy import event, insert
+
+from app import app
+from checklist_store import checklist_audience_ids, publish_checklist_group, replace_group_tasks
+from models import Checklist, ChecklistGroup, ChecklistTask, StudentAcademicProfile, User, db
+
+
+TARGET = ("MCA", "2", "all")
+# Extra students outside TARGET, as a fraction of the audience, so the filter does real work.
+OUTSIDE_TARGET_RATIO = 0.25
+
+
+class _WriteLockTimer:
+    def __init__(self):
+        self.longest_ms = 0.0
+        self._started = None
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self._started is None and statement.lstrip().split(" ", 1)[0].upper() in {"INSERT", "UPDATE", "DELETE"}:
+            self._started = time.perf_counter()
+
+    def commit(self, conn):
+        if self._started is not None:
+            self.longest_ms = max(self.longest_ms, (time.perf_counter() - self._started) * 1000)
+            self._started = None
+
+    def __enter__(self):
+        event.listen(db.engine, "before_cursor_execute", self.before_cursor_execute)
+        event.listen(db.engine, "commit", self.commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(db.engine, "before_cursor_execute", self.before_cursor_execute)
+        event.remove(db.engine, "commit", self.commit)
+
+
+def _reset_tables() -> None:
+    Checklist.query.delete(synchronize_session=False)
+    ChecklistTask.query.delete(synchronize_session=False)
+    ChecklistGroup.query.delete(synchronize_session=False)
+    StudentAcademicProfile.query.delete(synchronize_session=False)
+    User.query.delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _seed(recipients: int) -> int:
+    _reset_tables()
+    faculty = User(
+        unique_user_code="BFAC1",
+        full_name="Bench Faculty",
+        email="bench.faculty@example.com",
+        role="faculty",
+        faculty_id="BFAC001",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    db.session.add(faculty)
+    db.session.commit()
+
+    total = recipients + int(recipients * OUTSIDE_TARGET_RATIO)
+    users = []
+    for index in range(total):
+        users.append(
+            {
+                "unique_user_code": f"BS{index:06d}",
+                "full_name": f"Bench Student {index}",
+                "email": f"bench.student{index}@example.com",
+                "role": "student",
+                "section": "AB"[index % 2],
+                "course": "MCA",
+                "password_hash": "-",
+                "security_question": "-",
+                "security_answer_hash": "-",
+                "is_active": True,
+                "created_at": datetime.utcnow(),
+            }
+        )
+    db.session.execute(insert(User), users)
+    student_ids = [row[0] for row in db.session.query(User.id).filter(User.role == "student").order_by(User.id).all()]
+    profiles = []
+    for position, student_id in enumerate(student_ids):
+        profiles.append(
+            {
+                "user_id": student_id,
+                "course_code": "MCA",
+                "batch_start_year": 2025,
+                "batch_end_year": 2027,
+                "admission_month": 8,
+                "admission_year": 2025,
+                "current_semester": 2 if position < recipients else 4,
+                "max_semester": 4,
+            }
+        )
+    db.session.execute(insert(StudentAcademicProfile), profiles)
+    db.session.commit()
+    return faculty.id
+
+
+def _new_group(faculty_id: int, key: str) -> ChecklistGroup:
+    group = ChecklistGroup(
+        group_key=key,
+        faculty_id=faculty_id,
+        title="Benchmark checklist",
+        due_date=date.today() + timedelta(days=7),
+        target_course=TARGET[0],
+        target_semester=TARGET[1],
+        target_section=TARGET[2],
+    )
+    replace_group_tasks(group, ["Read the notes", "Solve the worksheet", "Submit the summary"])
+    return group
+
+
+def _per_object_publish(faculty_id: int) -> tuple[int, float, float]:
+    target_course, target_semester, target_section = TARGET
+    started = time.perf_counter()
+    matched = []
+    for student in User.query.filter_by(role="student", is_active=True).order_by(User.id.asc()).all():
+        profile = student.student_profile
+        course = ((profile.course_code if profile and profile.course_code else student.course) or "").strip().upper()
+        section = (student.section or "").strip().upper() or "A"
+        if target_course != "BOTH" and course != target_course:
+            continue
+        if target_section != "all" and section != target_section:
+            continue
+        if target_semester != "all" and str(profile.current_semester if profile else "") != target_semester:
+            continue
+        matched.append(student)
+    audience_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    group = _new_group(faculty_id, "bench-per-object")
+    db.session.add(group)
+    for student in matched:
+        db.session.add(Checklist(title=group.title, faculty_id=faculty_id, student_id=student.id, group=group))
+    db.session.commit()
+    return len(matched), audience_ms, (time.perf_counter() - started) * 1000
+
+
+def _bulk_publish(faculty_id: int, chunk_size: int) -> tuple[int, float, float]:
+    started = time.perf_counter()
+    student_ids = checklist_audience_ids(*TARGET)
+    audience_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    count = publish_checklist_group(_new_group(faculty_id, "bench-bulk"), student_ids, chunk_size=chunk_size)
+    return count, audience_ms, (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark checklist publishing for several audience sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Matching recipients per run.")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Rows per INSERT transaction on the bulk path.")
+    args = parser.parse_args()
+
+    print(f"Target course/semester/section: {'/'.join(TARGET)}; chunk size {args.chunk_size}")
+    print()
+    print(
+        f"{'recipients':>10} {'path':<11} {'audience ms':>12} {'insert ms':>10} "
+        f"{'total ms':>9} {'longest write ms':>17}"
+    )
+    with app.app_context():
+        for size in args.sizes:
+            for label, publish in (
+                ("per-object", _per_object_publish),
+                ("bulk", lambda faculty_id: _bulk_publish(faculty_id, args.chunk_size)),
+            ):
+                faculty_id = _seed(size)
+                db.session.expunge_all()
+                with _WriteLockTimer() as lock_timer:
+                    count, audience_ms, insert_ms = publish(faculty_id)
+                if count != size:
+                    print(f"{label}: expected {size} recipients, published {count}")
+                    return 1
+                print(
+                    f"{size:>10} {label:<11} {audience_ms:>12.1f} {insert_ms:>10.1f} "
+                    f"{audience_ms + insert_ms:>9.1f} {lock_timer.longest_ms:>17.1f}"
+                )
+        _reset_tables()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+"""
+ClarifAI Intervention Reach Benchmark
+=====================================
+Times the "Reach" metric (how many active students an intervention targets)
+for the posts of one faculty metrics poll, for several student body sizes,
+and compares:
+
+    - scan: the previous path. It loads every active student and checks the
+      post's targets against each one in Python, once per post.
+    - index: intervention_targets.post_reach, answered from the cohort index
+      (active-student counts per course, semester and section). "cold" times
+      the poll right after the index was dropped, so it includes the one
+      GROUP BY that rebuilds it; "warm" is every poll after that.
+
+Both paths are checked to return the same reach for every post.
+
+The benchmark runs against a throwaway SQLite file configured before the app
+is imported; the real database is never touched.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/benchmark_intervention_reach.py
+    py -3.11 scripts/benchmark_intervention_reach.py --students 500 2000 5000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import config
+
+WORK_DIR = tempfile.TemporaryDirectory(prefix="clarifai_reach_bench_")
+config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(WORK_DIR.name) / 'bench.db'}"
+config.Config.ADMIN_BOOTSTRAP_ENABLED = False
+config.Config.SENTIMENT_WARMUP_ENABLED = False
+config.Config.USER_DELETE_GUARD_ENABLED = False
+
+from sqlalchemy import insert
+
+from app import app
+from intervention_targets import _cohort_index, post_reach
+from models import KnowledgePost, StudentAcademicProfile, User, db
+
+
+POLL_POSTS = 20
+COURSES = ["MCA", "BCA"]
+SECTIONS = ["A", "B", "C"]
+TARGETS = [
+    ("MCA", "all", "ALL"),
+    ("MCA", "2", "A"),
+    ("BCA", "4", "ALL"),
+    ("MCA,BCA", "1,3", "B,C"),
+    ("BCA", "all", "C"),
+]
+
+
+def _reset_tables() -> None:
+    KnowledgePost.query.delete(synchronize_session=False)
+    StudentAcademicProfile.query.delete(synchronize_session=False)
+    User.query.delete(synchronize_session=False)
+    db.session.commit()
+    # Post ids are reused by the next seed; drop the deleted objects first.
+    db.session.expunge_all()
+
+
+def _seed(students: int) -> list[KnowledgePost]:
+    _reset_tables()
+    rng = random.Random(students)
+    faculty = User(
+        unique_user_code="BFAC1",
+        full_name="Bench Faculty",
+        email="bench.faculty@example.com",
+        role="faculty",
+        faculty_id="BFAC001",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    db.session.add(faculty)
+    now = datetime.utcnow()
+    courses = [rng.choice(COURSES) for _ in range(students)]
+    db.session.execute(
+        insert(User),
+        [
+            {
+                "unique_user_code": f"BS{index:06d}",
+                "full_name": f"Bench Student {index}",
+                "email": f"bench.student{index}@example.com",
+                "role": "student",
+                "section": rng.choice(SECTIONS),
+                "course": courses[index],
+                "password_hash": "-",
+                "security_question": "-",
+                "security_answer_hash": "-",
+                "is_active": index % 25 != 0,
+                "created_at": now,
+            }
+            for index in range(students)
+        ],
+    )
+    db.session.commit()
+    student_ids = [row[0] for row in db.session.query(User.id).filter(User.role == "student").order_by(User.id).all()]
+    db.session.execute(
+        insert(StudentAcademicProfile),
+        [
+            {
+                "user_id": student_id,
+                "course_code": courses[index],
+                "batch_start_year": 2025,
+                "batch_end_year": 2027,
+                "admission_month": 8,
+                "admission_year": 2025,
+                "current_semester": rng.randint(1, 4),
+                "max_semester": 4,
+            }
+            for index, student_id in enumerate(student_ids)
+        ],
+    )
+    posts = []
+    for index in range(POLL_POSTS):
+        target_courses, target_semesters, target_sections = TARGETS[index % len(TARGETS)]
+        post = KnowledgePost(
+            title=f"Intervention {index}",
+            content="Worked example.",
+            status="published",
+            target_courses=target_courses,
+            target_semesters=target_semesters,
+            target_sections=target_sections,
+            author_id=faculty.id,
+        )
+        db.session.add(post)
+        posts.append(post)
+    db.session.commit()
+    return posts
+
+
+def _scan_reach(post: KnowledgePost) -> int:
+    # The previous path, kept here as the reference: every active student,
+    # checked against the post's targets in Python.
+    courses = {token.strip().upper() for token in (post.target_courses or "").split(",") if token.strip()}
+    semesters = {token.strip().lower() for token in (post.target_semesters or "").split(",") if token.strip()}
+    sections = {token.strip().upper() for token in (post.target_sections or "").split(",") if token.strip()}
+    reach = 0
+    for student in User.query.filter_by(role="student", is_active=True).all():
+        profile = student.student_profile
+        course = ((profile.course_code if profile and profile.course_code else student.course) or "").strip().upper()
+        try:
+            semester = int(profile.current_semester) if profile else None
+        except (TypeError, ValueError):
+            semester = None
+        if semester is not None and semester < 1:
+            semester = None
+        section = (student.section or "").strip().upper()
+        if courses and course not in courses:
+            continue
+        if semesters and "all" not in semesters and (semester is None or str(semester) not in semesters):
+            continue
+        if sections and "ALL" not in sections and (not section or section not in sections):
+            continue
+        reach += 1
+    return reach
+
+
+def _median_ms(poll, repeat: int, before=None) -> float:
+    timings = []
+    for _ in range(repeat):
+        if before:
+            before()
+        db.session.expire_all()
+        started = time.perf_counter()
+        poll()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark intervention reach for several student body sizes.")
+    parser.add_argument("--students", type=int, nargs="+", default=[500, 2000, 5000], help="Students per run.")
+    parser.add_argument("--repeat", type=int, default=3, help="Polls per measurement.")
+    args = parser.parse_args()
+
+    print(f"{'students':>8} {'path':<11} {'poll ms':>9}")
+    with app.app_context():
+        for size in args.students:
+            posts = _seed(size)
+            scanned = [_scan_reach(post) for post in posts]
+            indexed = [post_reach(post) for post in posts]
+            if scanned != indexed:
+                print(f"Reach mismatch at {size} students: scan {scanned} != index {indexed}")
+                return 1
+
+            timings = {
+                "scan": _median_ms(lambda: [_scan_reach(post) for post in posts], args.repeat),
+                "index cold": _median_ms(
+                    lambda: [post_reach(post) for post in posts],
+                    args.repeat,
+                    before=_cohort_index.invalidate,
+                ),
+                "index warm": _median_ms(lambda: [post_reach(post) for post in posts], args.repeat),
+            }
+            for label, median_ms in timings.items():
+                print(f"{size:>8} {label:<11} {median_ms:>9.1f}")
+        _reset_tables()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
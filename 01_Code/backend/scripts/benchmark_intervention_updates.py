@@ -0,0 +1,191 @@
+"""
+ClarifAI Intervention Update Benchmark
+======================================
+Times the two halves of the "intervention updated" notices for several
+numbers of engaged students (students who opened the edited intervention):
+
+    - edit: what a faculty edit of a published intervention now writes and
+      counts: one knowledge_post_revisions row plus the engaged-student count
+      shown in the flash message, then the commit.
+    - board: the unread updates a student's knowledge board reads (the
+      oldest 12, knowledge_store.unread_post_updates).
+    - badge: the unread-update count behind the "Updates" badge
+      (knowledge_store.unread_post_update_count).
+
+Each edit used to insert one knowledge_notifications row per engaged student,
+so its cost followed the audience; none of these should.
+
+The benchmark runs against a throwaway SQLite file configured before the app
+is imported; the real database is never touched.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/benchmark_intervention_updates.py
+    py -3.11 scripts/benchmark_intervention_updates.py --students 500 5000 20000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import config
+
+WORK_DIR = tempfile.TemporaryDirectory(prefix="clarifai_updates_bench_")
+config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(WORK_DIR.name) / 'bench.db'}"
+config.Config.ADMIN_BOOTSTRAP_ENABLED = False
+config.Config.SENTIMENT_WARMUP_ENABLED = False
+config.Config.USER_DELETE_GUARD_ENABLED = False
+
+from sqlalchemy import insert
+
+from app import app
+from knowledge_store import engaged_student_count, record_post_revision, unread_post_update_count, unread_post_updates
+from models import KnowledgePost, KnowledgePostRevision, KnowledgePostTarget, KnowledgeView, User, db
+
+
+POSTS = 40
+EARLIER_REVISIONS = 5
+
+
+def _reset_tables() -> None:
+    KnowledgePostRevision.query.delete(synchronize_session=False)
+    KnowledgePostTarget.query.delete(synchronize_session=False)
+    KnowledgeView.query.delete(synchronize_session=False)
+    KnowledgePost.query.delete(synchronize_session=False)
+    User.query.delete(synchronize_session=False)
+    db.session.commit()
+    db.session.expunge_all()
+
+
+def _seed(students: int) -> tuple[int, int]:
+    _reset_tables()
+    faculty = User(
+        unique_user_code="BFAC1",
+        full_name="Bench Faculty",
+        email="bench.faculty@example.com",
+        role="faculty",
+        faculty_id="BFAC001",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    db.session.add(faculty)
+    now = datetime.utcnow()
+    db.session.execute(
+        insert(User),
+        [
+            {
+                "unique_user_code": f"BS{index:06d}",
+                "full_name": f"Bench Student {index}",
+                "email": f"bench.student{index}@example.com",
+                "role": "student",
+                "section": "A",
+                "course": "MCA",
+                "password_hash": "-",
+                "security_question": "-",
+                "security_answer_hash": "-",
+                "is_active": True,
+                "created_at": now,
+            }
+            for index in range(students)
+        ],
+    )
+    db.session.flush()
+    db.session.execute(
+        insert(KnowledgePost),
+        [
+            {
+                "title": f"Intervention {index}",
+                "content": "Worked example.",
+                "status": "published",
+                "target_courses": "MCA",
+                "target_semesters": "all",
+                "target_sections": "ALL",
+                "published_at": now - timedelta(days=1),
+                "created_at": now - timedelta(days=1),
+                "updated_at": now,
+                "revision_count": 0,
+                "author_id": faculty.id,
+            }
+            for index in range(POSTS)
+        ],
+    )
+    student_ids = [row[0] for row in db.session.query(User.id).filter(User.role == "student").all()]
+    post_ids = [row[0] for row in db.session.query(KnowledgePost.id).order_by(KnowledgePost.id).all()]
+    # The bulk insert skips sync_post_targets; these are the rows it would add.
+    db.session.execute(
+        insert(KnowledgePostTarget),
+        [{"post_id": post_id, "course": "MCA", "semester": "*", "section": "*"} for post_id in post_ids],
+    )
+    # Every student opened every post a day ago, and each post has been
+    # edited a few times since.
+    opened_at = now - timedelta(days=1)
+    for post_id in post_ids:
+        db.session.execute(
+            insert(KnowledgeView),
+            [
+                {"post_id": post_id, "user_id": student_id, "first_opened_at": opened_at, "last_opened_at": opened_at}
+                for student_id in student_ids
+            ],
+        )
+    db.session.execute(
+        insert(KnowledgePostRevision),
+        [
+            {"post_id": post_id, "revised_at": now - timedelta(hours=revision + 1)}
+            for post_id in post_ids
+            for revision in range(EARLIER_REVISIONS)
+        ],
+    )
+    db.session.commit()
+    return post_ids[0], student_ids[-1]
+
+
+def _median_ms(run, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        db.session.expire_all()
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark intervention update notices for several audience sizes.")
+    parser.add_argument("--students", type=int, nargs="+", default=[500, 2000, 5000], help="Engaged students per run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement.")
+    args = parser.parse_args()
+
+    print(f"{'students':>8} {'edit ms':>9} {'board ms':>9} {'badge ms':>9}")
+    with app.app_context():
+        for size in args.students:
+            post_id, student_id = _seed(size)
+            seen_at = datetime.utcnow() - timedelta(days=2)
+
+            def _edit():
+                post = db.session.get(KnowledgePost, post_id)
+                record_post_revision(post)
+                engaged_student_count(post)
+                db.session.commit()
+
+            edit_ms = _median_ms(_edit, args.repeat)
+            board_ms = _median_ms(lambda: unread_post_updates(student_id, seen_at), args.repeat)
+            badge_ms = _median_ms(lambda: unread_post_update_count(student_id, seen_at), args.repeat)
+            print(f"{size:>8} {edit_ms:>9.1f} {board_ms:>9.1f} {badge_ms:>9.1f}")
+        _reset_tables()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
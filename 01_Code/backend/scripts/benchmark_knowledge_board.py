@@ -0,0 +1,229 @@
+"""
+ClarifAI Knowledge Board Page Benchmark
+=======================================
+Times a full GET of the student knowledge board for archives of different
+sizes, for every sort order, on the first page and five pages in (following
+the "Next page" cursor).
+
+The board is paged with keyset cursors (knowledge_store.keyset_page), so the
+time per page should not follow the size of the archive. The "most upvoted"
+order reads the stored like and bookmark counters through
+ix_knowledge_posts_status_rank.
+
+The benchmark runs against a throwaway SQLite file configured before the app
+is imported; the real database is never touched.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/benchmark_knowledge_board.py
+    py -3.11 scripts/benchmark_knowledge_board.py --sizes 1000 10000 50000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import config
+
+WORK_DIR = tempfile.TemporaryDirectory(prefix="clarifai_board_bench_")
+config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(WORK_DIR.name) / 'bench.db'}"
+config.Config.ADMIN_BOOTSTRAP_ENABLED = False
+config.Config.SENTIMENT_WARMUP_ENABLED = False
+config.Config.USER_DELETE_GUARD_ENABLED = False
+
+from sqlalchemy import insert
+
+from app import app
+from intervention_targets import ANY_TARGET
+from knowledge_store import reconcile_post_counters
+from view_tracker import flush_knowledge_views
+from models import (
+    KnowledgePost,
+    KnowledgePostTag,
+    KnowledgePostTarget,
+    KnowledgeReaction,
+    KnowledgeView,
+    StudentAcademicProfile,
+    User,
+    db,
+)
+
+
+SORTS = ["recent", "oldest", "most_upvoted"]
+REACTING_STUDENTS = 50
+NEXT_PAGE = re.compile(r'href="([^"]*after=[^"]*)">Next page')
+
+
+def _reset_tables() -> None:
+    # Write out buffered board views first so the flusher does not race the deletes.
+    flush_knowledge_views()
+    KnowledgeView.query.delete(synchronize_session=False)
+    KnowledgeReaction.query.delete(synchronize_session=False)
+    KnowledgePostTag.query.delete(synchronize_session=False)
+    KnowledgePostTarget.query.delete(synchronize_session=False)
+    KnowledgePost.query.delete(synchronize_session=False)
+    StudentAcademicProfile.query.delete(synchronize_session=False)
+    User.query.delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _seed(posts: int) -> int:
+    _reset_tables()
+    faculty = User(
+        unique_user_code="BFAC1",
+        full_name="Bench Faculty",
+        email="bench.faculty@example.com",
+        role="faculty",
+        faculty_id="BFAC001",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    db.session.add(faculty)
+    db.session.execute(
+        insert(User),
+        [
+            {
+                "unique_user_code": f"BS{index:06d}",
+                "full_name": f"Bench Student {index}",
+                "email": f"bench.student{index}@example.com",
+                "role": "student",
+                "section": "A",
+                "course": "MCA",
+                "password_hash": "-",
+                "security_question": "-",
+                "security_answer_hash": "-",
+                "is_active": True,
+                "created_at": datetime.utcnow(),
+            }
+            for index in range(REACTING_STUDENTS)
+        ],
+    )
+    db.session.commit()
+    student_ids = [row[0] for row in db.session.query(User.id).filter(User.role == "student").order_by(User.id).all()]
+    db.session.execute(
+        insert(StudentAcademicProfile),
+        [
+            {
+                "user_id": student_id,
+                "course_code": "MCA",
+                "batch_start_year": 2025,
+                "batch_end_year": 2027,
+                "admission_month": 8,
+                "admission_year": 2025,
+                "current_semester": 2,
+                "max_semester": 4,
+            }
+            for student_id in student_ids
+        ],
+    )
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "title": f"Intervention {index}",
+            "content": "Worked example and revision notes. " * 10,
+            "status": "published",
+            "target_courses": "MCA",
+            "target_semesters": "all",
+            "target_sections": "ALL",
+            "published_at": now - timedelta(minutes=index),
+            "created_at": now - timedelta(minutes=index),
+            "updated_at": now,
+            "revision_count": 0,
+            "author_id": faculty.id,
+        }
+        for index in range(posts)
+    ]
+    for start in range(0, len(rows), 5000):
+        db.session.execute(insert(KnowledgePost), rows[start : start + 5000])
+    post_ids = [row[0] for row in db.session.query(KnowledgePost.id).all()]
+    db.session.execute(
+        insert(KnowledgePostTarget),
+        [{"post_id": post_id, "course": "MCA", "semester": ANY_TARGET, "section": ANY_TARGET} for post_id in post_ids],
+    )
+    db.session.execute(
+        insert(KnowledgePostTag),
+        [{"post_id": post_id, "tag": "study-notes", "position": 0} for post_id in post_ids],
+    )
+
+    rng = random.Random(posts)
+    reactions = set()
+    for post_id in post_ids:
+        for student_id in rng.sample(student_ids, rng.randint(0, 4)):
+            reactions.add((post_id, student_id, rng.choice(["like", "bookmark"])))
+    db.session.execute(
+        insert(KnowledgeReaction),
+        [
+            {"post_id": post_id, "user_id": user_id, "reaction_type": reaction_type, "created_at": now}
+            for post_id, user_id, reaction_type in sorted(reactions)
+        ],
+    )
+    db.session.commit()
+    # The bulk insert skips the reaction route; fill the stored counters in one pass.
+    reconcile_post_counters()
+    return student_ids[0]
+
+
+def _median_ms(client, url: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            raise RuntimeError(f"{url} returned {response.status_code}")
+    return statistics.median(timings)
+
+
+def _page_url(client, url: str, pages: int) -> str:
+    for _ in range(pages):
+        match = NEXT_PAGE.search(client.get(url).get_data(as_text=True))
+        if not match:
+            break
+        url = match.group(1).replace("&amp;", "&")
+    return url
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark knowledge board page loads for several archive sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="Published posts per run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per measurement.")
+    args = parser.parse_args()
+
+    app.config["TESTING"] = True
+    print(f"{'posts':>7} {'sort':<13} {'page 1 ms':>10} {'page 6 ms':>10}")
+    for size in args.sizes:
+        with app.app_context():
+            student_id = _seed(size)
+            db.session.remove()
+        client = app.test_client()
+        with client.session_transaction() as flask_session:
+            flask_session["user_id"] = student_id
+            flask_session["role"] = "student"
+        with app.app_context():
+            for sort_by in SORTS:
+                first_url = f"/student/knowledge-board?sort={sort_by}"
+                first_ms = _median_ms(client, first_url, args.repeat)
+                later_ms = _median_ms(client, _page_url(client, first_url, 5), args.repeat)
+                print(f"{size:>7} {sort_by:<13} {first_ms:>10.1f} {later_ms:>10.1f}")
+    with app.app_context():
+        _reset_tables()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
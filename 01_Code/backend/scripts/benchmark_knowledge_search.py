@@ -0,0 +1,188 @@
+"""
+ClarifAI Knowledge Search Benchmark
+===================================
+Times a knowledge board search for boards of different sizes and compares:
+
+    - scan: the previous path. It loads every published post with its author
+      and keeps the ones whose title or author name contains the text.
+    - fts: the current path. The search runs through the knowledge_posts_fts
+      index (knowledge_store.post_search) together with the target filter,
+      ranked by bm25 and limited like the student board.
+
+Each search term is run several times and the median is reported. Every term
+is a marker word in the content of about 100 posts whatever the board size,
+so only the size of the board changes between runs. The scan path only looks
+at titles and author names and finds none of them; it is timed for the cost
+of loading and filtering the whole board.
+
+The benchmark runs against a throwaway SQLite file configured before the app
+is imported; the real database is never touched.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/benchmark_knowledge_search.py
+    py -3.11 scripts/benchmark_knowledge_search.py --sizes 1000 10000 50000 --repeat 9
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import config
+
+WORK_DIR = tempfile.TemporaryDirectory(prefix="clarifai_search_bench_")
+config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(WORK_DIR.name) / 'bench.db'}"
+config.Config.ADMIN_BOOTSTRAP_ENABLED = False
+config.Config.SENTIMENT_WARMUP_ENABLED = False
+config.Config.USER_DELETE_GUARD_ENABLED = False
+
+from sqlalchemy import insert
+from sqlalchemy.orm import contains_eager
+
+from app import app
+from intervention_targets import ANY_TARGET, student_target_filter
+from knowledge_store import post_search
+from models import KnowledgePost, KnowledgePostTarget, User, db
+
+
+WORDS = [
+    "normalization", "transaction", "recursion", "pipeline", "container", "tensor", "sorting", "graph",
+    "revision", "database", "deployment", "testing", "agile", "kernel", "scheduler", "compiler",
+]
+BOARD_LIMIT = 100
+
+
+def _reset_tables() -> None:
+    KnowledgePostTarget.query.delete(synchronize_session=False)
+    KnowledgePost.query.delete(synchronize_session=False)
+    User.query.delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _seed(posts: int) -> list[str]:
+    _reset_tables()
+    faculty = User(
+        unique_user_code="BFAC1",
+        full_name="Bench Faculty",
+        email="bench.faculty@example.com",
+        role="faculty",
+        faculty_id="BFAC001",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    db.session.add(faculty)
+    db.session.commit()
+
+    rng = random.Random(posts)
+    now = datetime.utcnow()
+    # One marker word per 100 posts, so every term matches about 100 posts.
+    markers = [f"marker{index:04d}" for index in range(max(posts // 100, 1))]
+    rows = []
+    for index in range(posts):
+        words = rng.sample(WORDS, 6)
+        rows.append(
+            {
+                "title": f"{words[0].title()} notes {index}",
+                "content": " ".join(words * 8) + f" {markers[index % len(markers)]}",
+                "problem_context": " ".join(rng.sample(WORDS, 4)),
+                "solution_steps": " ".join(rng.sample(WORDS, 4)),
+                "outcome_result": "",
+                "status": "published",
+                "target_courses": "MCA",
+                "target_semesters": "all",
+                "target_sections": "ALL",
+                "published_at": now - timedelta(minutes=index),
+                "created_at": now - timedelta(minutes=index),
+                "updated_at": now,
+                "revision_count": 0,
+                "author_id": faculty.id,
+            }
+        )
+    for start in range(0, len(rows), 5000):
+        db.session.execute(insert(KnowledgePost), rows[start : start + 5000])
+    post_ids = [row[0] for row in db.session.query(KnowledgePost.id).all()]
+    db.session.execute(
+        insert(KnowledgePostTarget),
+        [{"post_id": post_id, "course": "MCA", "semester": ANY_TARGET, "section": ANY_TARGET} for post_id in post_ids],
+    )
+    db.session.commit()
+    return markers[:5]
+
+
+def _scan_search(term: str) -> int:
+    posts = (
+        KnowledgePost.query.join(User, KnowledgePost.author_id == User.id)
+        .options(contains_eager(KnowledgePost.author))
+        .filter(User.role == "faculty", KnowledgePost.status == "published")
+        .all()
+    )
+    needle = term.lower()
+    return sum(
+        1
+        for post in posts
+        if needle in post.title.lower() or needle in (post.author.full_name or "").lower()
+    )
+
+
+def _fts_search(term: str) -> int:
+    search_hits = post_search(term)
+    posts = (
+        KnowledgePost.query.join(User, KnowledgePost.author_id == User.id)
+        .join(search_hits, search_hits.c.post_id == KnowledgePost.id)
+        .options(contains_eager(KnowledgePost.author))
+        .filter(
+            User.role == "faculty",
+            KnowledgePost.status == "published",
+            student_target_filter("MCA", 2, "A"),
+        )
+        .order_by(search_hits.c.rank.asc().nulls_last(), KnowledgePost.created_at.desc())
+        .limit(BOARD_LIMIT)
+        .all()
+    )
+    return len(posts)
+
+
+def _median_ms(search, terms: list[str], repeat: int) -> tuple[float, int]:
+    timings = []
+    found = 0
+    for _ in range(repeat):
+        for term in terms:
+            db.session.expunge_all()
+            started = time.perf_counter()
+            found = search(term)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark knowledge board search for several board sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="Published posts per run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per search term.")
+    args = parser.parse_args()
+
+    print(f"{'posts':>7} {'path':<5} {'median ms':>10} {'results':>8}")
+    with app.app_context():
+        for size in args.sizes:
+            terms = _seed(size)
+            for label, search in (("scan", _scan_search), ("fts", _fts_search)):
+                median_ms, found = _median_ms(search, terms, args.repeat)
+                print(f"{size:>7} {label:<5} {median_ms:>10.1f} {found:>8}")
+        _reset_tables()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,364 @@
+"""
+ClarifAI Sentiment Benchmark
+============================
+Compares per-text scoring through analyze_sentiment_with_confidence against
+analyze_sentiment_batch for growing batch sizes.
+
+--suite runs the regression suite over the labeled corpus in
+data/sentiment_eval_corpus.csv and reports:
+
+    - p50 / p95 / p99 latency per text length bucket (short / medium / long)
+    - batch throughput in texts per second
+    - label agreement with the corpus (accuracy, per-label recall, confusion)
+    - confidence calibration (accuracy per confidence band and ECE)
+
+--output writes the suite results as JSON; --compare checks a run against a
+saved JSON file and exits non-zero when latency or quality regress past the
+tolerances.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/benchmark_sentiment.py
+    py -3.11 scripts/benchmark_sentiment.py --sizes 1 10 100 1000 --repeat 3
+    py -3.11 scripts/benchmark_sentiment.py --cold-start
+
+    # Save a baseline, change the engine or lexicon, then compare
+    py -3.11 scripts/benchmark_sentiment.py --suite --output sentiment_baseline.json
+    py -3.11 scripts/benchmark_sentiment.py --suite --compare sentiment_baseline.json
+    py -3.11 scripts/benchmark_sentiment.py --suite --engine lexicon --compare sentiment_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import sentiment
+from sentiment import analyze_sentiment_batch, analyze_sentiment_with_confidence
+
+
+DEFAULT_CORPUS_PATH = BACKEND_ROOT / "data" / "sentiment_eval_corpus.csv"
+LABELS = ("positive", "neutral", "negative")
+# Upper bounds in characters; anything longer is "long".
+LENGTH_BUCKETS = (("short", 60), ("medium", 280), ("long", None))
+CONFIDENCE_BANDS = ((50, 60), (60, 70), (70, 80), (80, 90), (90, 101))
+
+
+SAMPLE_SENTENCES = [
+    "The lectures were engaging and the notes were very helpful.",
+    "Explanations are confusing and the pace rushes past key ideas.",
+    "Lab sessions are basic and the material rarely goes deeper.",
+    "Faculty is supportive and welcomes doubts after class.",
+    "Assignments were fair but the feedback was limited.",
+    "Class was okay overall, nothing special to report.",
+    "Teaching is disorganized, unclear and hard to follow.",
+    "Excellent mentoring with actionable suggestions every week.",
+]
+
+
+def _build_corpus(size: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        picks = rng.sample(SAMPLE_SENTENCES, k=rng.randint(1, 3))
+        corpus.append(" ".join(picks))
+    return corpus
+
+
+def _time_call(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+COLD_START_PROBE = """
+import time
+started = time.perf_counter()
+import sentiment
+imported = time.perf_counter()
+if WARMUP:
+    sentiment.start_sentiment_warmup()
+    sentiment.wait_for_sentiment_engine()
+warmed = time.perf_counter()
+sentiment.analyze_sentiment_with_confidence("The lectures were engaging and helpful.")
+scored = time.perf_counter()
+print(f"{(imported - started) * 1000:.1f} {(warmed - imported) * 1000:.1f} {(scored - warmed) * 1000:.1f}")
+"""
+
+
+def _run_cold_start(runs: int) -> int:
+    print(f"{'mode':>10} {'import ms':>10} {'warm-up ms':>11} {'first score ms':>15}")
+    for warmup in (False, True):
+        samples = []
+        for _ in range(runs):
+            probe = f"WARMUP = {warmup}\n{COLD_START_PROBE}"
+            completed = subprocess.run(
+                [sys.executable, "-c", probe],
+                cwd=BACKEND_ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            samples.append([float(value) for value in completed.stdout.split()])
+        medians = [sorted(column)[len(column) // 2] for column in zip(*samples)]
+        label = "warm-up" if warmup else "lazy"
+        print(f"{label:>10} {medians[0]:>10.1f} {medians[1]:>11.1f} {medians[2]:>15.1f}")
+    return 0
+
+
+def _load_corpus(path: Path) -> list[tuple[str, str]]:
+    with path.open(encoding="utf-8", newline="") as handle:
+        return [(row["label"].strip().lower(), row["text"]) for row in csv.DictReader(handle)]
+
+
+def _length_bucket(text: str) -> str:
+    for name, limit in LENGTH_BUCKETS:
+        if limit is None or len(text) < limit:
+            return name
+    return LENGTH_BUCKETS[-1][0]
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _latency_by_bucket(corpus: list[tuple[str, str]], repeat: int) -> dict:
+    samples = {name: [] for name, _ in LENGTH_BUCKETS}
+    for _ in range(repeat):
+        for _, text in corpus:
+            started = time.perf_counter()
+            analyze_sentiment_with_confidence(text)
+            samples[_length_bucket(text)].append((time.perf_counter() - started) * 1_000_000)
+
+    return {
+        name: {
+            "texts": len(values) // max(1, repeat),
+            "p50_us": round(_percentile(values, 0.50), 1),
+            "p95_us": round(_percentile(values, 0.95), 1),
+            "p99_us": round(_percentile(values, 0.99), 1),
+        }
+        for name, values in samples.items()
+    }
+
+
+def _batch_throughput(corpus: list[tuple[str, str]], batch_size: int, repeat: int) -> dict:
+    texts = [text for _, text in corpus]
+    # Suffix each copy so batch de-duplication does not flatter the number.
+    batch = [f"{texts[index % len(texts)]} #{index}" for index in range(batch_size)]
+    elapsed = _time_call(lambda: analyze_sentiment_batch(batch), repeat)
+    return {
+        "batch_size": batch_size,
+        "seconds": round(elapsed, 4),
+        "texts_per_second": round(batch_size / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def _quality(corpus: list[tuple[str, str]]) -> dict:
+    predictions = [analyze_sentiment_with_confidence(text) for _, text in corpus]
+    confusion = {gold: {label: 0 for label in LABELS} for gold in LABELS}
+    for (gold, _), (label, _) in zip(corpus, predictions):
+        confusion[gold][label] += 1
+
+    correct = sum(confusion[label][label] for label in LABELS)
+    recall = {
+        label: round(confusion[label][label] / sum(confusion[label].values()), 4) if sum(confusion[label].values()) else 0.0
+        for label in LABELS
+    }
+
+    bands = []
+    calibration_error = 0.0
+    for low, high in CONFIDENCE_BANDS:
+        members = [
+            (gold == label, confidence)
+            for (gold, _), (label, confidence) in zip(corpus, predictions)
+            if low <= confidence < high
+        ]
+        if not members:
+            bands.append({"band": f"{low}-{high - 1}", "texts": 0, "mean_confidence": None, "accuracy": None})
+            continue
+        accuracy = sum(1 for hit, _ in members if hit) / len(members)
+        mean_confidence = sum(confidence for _, confidence in members) / len(members) / 100
+        calibration_error += (len(members) / len(corpus)) * abs(accuracy - mean_confidence)
+        bands.append(
+            {
+                "band": f"{low}-{high - 1}",
+                "texts": len(members),
+                "mean_confidence": round(mean_confidence, 4),
+                "accuracy": round(accuracy, 4),
+            }
+        )
+
+    return {
+        "texts": len(corpus),
+        "accuracy": round(correct / len(corpus), 4) if corpus else 0.0,
+        "recall": recall,
+        "confusion": confusion,
+        "calibration": bands,
+        "expected_calibration_error": round(calibration_error, 4),
+    }
+
+
+def _run_suite(corpus_path: Path, repeat: int, batch_size: int) -> dict:
+    corpus = _load_corpus(corpus_path)
+    sentiment.start_sentiment_warmup()
+    sentiment.wait_for_sentiment_engine()
+    analyze_sentiment_with_confidence(corpus[0][1])
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "engine": sentiment.sentiment_engine_name(),
+        "sentiment_version": sentiment.SENTIMENT_VERSION,
+        "lexicon_fingerprint": sentiment._lexicon_fingerprint(),
+        "corpus": {"path": corpus_path.name, "texts": len(corpus)},
+        "latency": _latency_by_bucket(corpus, repeat),
+        "batch": _batch_throughput(corpus, batch_size, repeat),
+        "quality": _quality(corpus),
+    }
+
+
+def _print_suite(results: dict) -> None:
+    print(
+        f"Engine {results['engine']} (version {results['sentiment_version']}, "
+        f"lexicon {results['lexicon_fingerprint']}), corpus {results['corpus']['texts']} texts"
+    )
+    print()
+    print(f"{'bucket':>8} {'texts':>6} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}")
+    for name, row in results["latency"].items():
+        print(f"{name:>8} {row['texts']:>6} {row['p50_us']:>9.1f} {row['p95_us']:>9.1f} {row['p99_us']:>9.1f}")
+
+    batch = results["batch"]
+    print()
+    print(f"Batch of {batch['batch_size']}: {batch['seconds']:.3f}s, {batch['texts_per_second']:.1f} texts/s")
+
+    quality = results["quality"]
+    print()
+    print(f"Accuracy {quality['accuracy']:.1%}  " + "  ".join(f"{label} recall {value:.1%}" for label, value in quality["recall"].items()))
+    print(f"{'':>10} " + " ".join(f"{label:>9}" for label in LABELS))
+    for gold in LABELS:
+        print(f"{gold:>10} " + " ".join(f"{quality['confusion'][gold][label]:>9}" for label in LABELS))
+    print()
+    print(f"{'confidence':>10} {'texts':>6} {'mean conf':>10} {'accuracy':>9}")
+    for band in quality["calibration"]:
+        if not band["texts"]:
+            print(f"{band['band']:>10} {0:>6} {'-':>10} {'-':>9}")
+            continue
+        print(f"{band['band']:>10} {band['texts']:>6} {band['mean_confidence']:>10.1%} {band['accuracy']:>9.1%}")
+    print(f"Expected calibration error: {quality['expected_calibration_error']:.4f}")
+
+
+def _compare_results(baseline: dict, current: dict, latency_tolerance: float, accuracy_tolerance: float) -> list[str]:
+    regressions = []
+    for name, row in current["latency"].items():
+        base_row = baseline.get("latency", {}).get(name)
+        if not base_row:
+            continue
+        for key in ("p50_us", "p95_us", "p99_us"):
+            limit = base_row[key] * (1 + latency_tolerance)
+            status = "REGRESSED" if row[key] > limit else "ok"
+            print(f"  latency {name:<6} {key:<7} {base_row[key]:>9.1f} -> {row[key]:>9.1f}  {status}")
+            if row[key] > limit:
+                regressions.append(f"{name} {key} grew from {base_row[key]:.1f} to {row[key]:.1f} us")
+
+    base_rate = baseline.get("batch", {}).get("texts_per_second")
+    if base_rate:
+        rate = current["batch"]["texts_per_second"]
+        floor = base_rate * (1 - latency_tolerance)
+        print(f"  batch texts/s        {base_rate:>9.1f} -> {rate:>9.1f}  {'REGRESSED' if rate < floor else 'ok'}")
+        if rate < floor:
+            regressions.append(f"batch throughput fell from {base_rate:.1f} to {rate:.1f} texts/s")
+
+    base_quality = baseline.get("quality", {})
+    for key, higher_is_better in (("accuracy", True), ("expected_calibration_error", False)):
+        if key not in base_quality:
+            continue
+        before, after = base_quality[key], current["quality"][key]
+        worse = after < before - accuracy_tolerance if higher_is_better else after > before + accuracy_tolerance
+        print(f"  {key:<20} {before:>9.4f} -> {after:>9.4f}  {'REGRESSED' if worse else 'ok'}")
+        if worse:
+            regressions.append(f"{key} moved from {before:.4f} to {after:.4f}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark single vs batch sentiment scoring.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--cold-start", action="store_true", help="Measure import and first-score time in fresh interpreters.")
+    parser.add_argument("--suite", action="store_true", help="Run the latency and accuracy regression suite.")
+    parser.add_argument("--engine", choices=sorted(sentiment.SENTIMENT_ENGINES), help="Sentiment engine to benchmark.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS_PATH)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--output", type=Path, help="Write suite results to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="Compare suite results against a saved JSON file.")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25, help="Allowed relative latency/throughput loss.")
+    parser.add_argument("--accuracy-tolerance", type=float, default=0.0, help="Allowed absolute accuracy/ECE loss.")
+    args = parser.parse_args()
+
+    if args.engine:
+        sentiment.configure_sentiment_engine(args.engine)
+
+    if args.cold_start:
+        return _run_cold_start(max(1, args.repeat))
+
+    if args.suite or args.output or args.compare:
+        results = _run_suite(args.corpus, max(1, args.repeat), max(1, args.batch_size))
+        _print_suite(results)
+        if args.output:
+            args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+            print(f"\nWrote {args.output}")
+        if args.compare:
+            baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+            print(f"\nComparing against {args.compare} (engine {baseline.get('engine')}, {baseline.get('generated_at')}):")
+            regressions = _compare_results(baseline, results, args.latency_tolerance, args.accuracy_tolerance)
+            if regressions:
+                print("\nRegressions:")
+                for item in regressions:
+                    print(f"  - {item}")
+                return 1
+            print("\nNo regressions.")
+        return 0
+
+    # Warm up the TextBlob lexicon so the first size does not absorb load time.
+    analyze_sentiment_with_confidence(SAMPLE_SENTENCES[0])
+
+    print(f"{'batch':>8} {'single us/text':>16} {'batch us/text':>15} {'speedup':>8}")
+    for size in args.sizes:
+        corpus = _build_corpus(size, args.seed)
+        single_elapsed = _time_call(lambda: [analyze_sentiment_with_confidence(text) for text in corpus], args.repeat)
+        batch_elapsed = _time_call(lambda: analyze_sentiment_batch(corpus), args.repeat)
+
+        if analyze_sentiment_batch(corpus) != [analyze_sentiment_with_confidence(text) for text in corpus]:
+            print(f"Batch results diverged from single-text scoring at size {size}.")
+            return 1
+
+        single_per_text = (single_elapsed / size) * 1_000_000
+        batch_per_text = (batch_elapsed / size) * 1_000_000
+        speedup = single_per_text / batch_per_text if batch_per_text else 0.0
+        print(f"{size:>8} {single_per_text:>16.1f} {batch_per_text:>15.1f} {speedup:>7.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
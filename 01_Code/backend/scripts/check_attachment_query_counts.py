@@ -0,0 +1,220 @@
+"""
+ClarifAI Attachment Query Count Check
+=====================================
+Regression check for per-post attachment loading on the knowledge boards.
+
+Seeds a small and a large board (every post carries attachments), signs in as
+a student and as the faculty author, and counts the SQL statements each page
+issues. Attachments must be loaded in at most one statement per page no
+matter how many posts are shown, and the student board as a whole must issue
+the same number of statements for both sizes. Exits with status 1 otherwise.
+
+The check runs against a throwaway SQLite file configured before the app is
+imported; the real database is never touched.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/check_attachment_query_counts.py
+    py -3.11 scripts/check_attachment_query_counts.py --sizes 5 80 --attachments 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import config
+
+WORK_DIR = tempfile.TemporaryDirectory(prefix="clarifai_attachment_check_")
+config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(WORK_DIR.name) / 'check.db'}"
+config.Config.ADMIN_BOOTSTRAP_ENABLED = False
+config.Config.SENTIMENT_WARMUP_ENABLED = False
+config.Config.USER_DELETE_GUARD_ENABLED = False
+config.Config.KNOWLEDGE_VIEW_BUFFER_ENABLED = False
+
+from sqlalchemy import event
+
+from app import app
+from intervention_targets import sync_post_targets
+from knowledge_store import sync_post_tags
+from models import (
+    KnowledgeAttachment,
+    KnowledgePost,
+    KnowledgePostTag,
+    KnowledgePostTarget,
+    KnowledgeView,
+    StudentAcademicProfile,
+    User,
+    db,
+)
+
+
+def _reset_tables() -> None:
+    KnowledgeView.query.delete(synchronize_session=False)
+    KnowledgeAttachment.query.delete(synchronize_session=False)
+    KnowledgePostTarget.query.delete(synchronize_session=False)
+    KnowledgePostTag.query.delete(synchronize_session=False)
+    KnowledgePost.query.delete(synchronize_session=False)
+    StudentAcademicProfile.query.delete(synchronize_session=False)
+    User.query.delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _seed(posts: int, attachments: int) -> tuple[int, int, int]:
+    _reset_tables()
+    faculty = User(
+        unique_user_code="CFAC1",
+        full_name="Check Faculty",
+        email="check.faculty@example.com",
+        role="faculty",
+        faculty_id="CFAC001",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    student = User(
+        unique_user_code="CSTU1",
+        full_name="Check Student",
+        email="check.student@example.com",
+        role="student",
+        section="A",
+        course="MCA",
+        password_hash="-",
+        security_question="-",
+        security_answer_hash="-",
+    )
+    db.session.add_all([faculty, student])
+    db.session.flush()
+    db.session.add(
+        StudentAcademicProfile(
+            user_id=student.id,
+            course_code="MCA",
+            batch_start_year=2025,
+            batch_end_year=2027,
+            admission_month=8,
+            admission_year=2025,
+            current_semester=2,
+            max_semester=4,
+        )
+    )
+
+    now = datetime.utcnow()
+    for index in range(posts):
+        post = KnowledgePost(
+            title=f"Check post {index}",
+            content="Worked example and revision notes. " * 10,
+            status="published",
+            target_courses="MCA",
+            target_semesters="all",
+            target_sections="ALL",
+            published_at=now - timedelta(hours=index),
+            author_id=faculty.id,
+        )
+        db.session.add(post)
+        db.session.flush()
+        sync_post_targets(post)
+        sync_post_tags(post)
+        for position in range(attachments):
+            db.session.add(
+                KnowledgeAttachment(
+                    post_id=post.id,
+                    file_name=f"notes-{position}.pdf",
+                    storage_key=f"check_{post.id}_{position}.pdf",
+                    file_ext="pdf",
+                    file_size=1024,
+                )
+            )
+    db.session.commit()
+    first_post_id = db.session.query(KnowledgePost.id).order_by(KnowledgePost.id).limit(1).scalar()
+    return student.id, faculty.id, first_post_id
+
+
+def _count_queries(client, path: str) -> tuple[int, int, int]:
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()))
+
+    # The first request absorbs one-off work; the second one is counted.
+    client.get(path)
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+    attachment_statements = sum(1 for statement in statements if " FROM knowledge_attachments" in statement)
+    return response.status_code, len(statements), attachment_statements
+
+
+def _client(user_id: int, role: str):
+    client = app.test_client()
+    with client.session_transaction() as flask_session:
+        flask_session["user_id"] = user_id
+        flask_session["role"] = role
+    return client
+
+
+def _measure(posts: int, attachments: int) -> dict[str, tuple[int, int, int]]:
+    with app.app_context():
+        student_id, faculty_id, post_id = _seed(posts, attachments)
+        db.session.remove()
+    pages = {
+        ("student", "/student/knowledge-board"): student_id,
+        ("student", f"/student/resource-post/{post_id}/detail"): student_id,
+        ("faculty", "/faculty/resources/board"): faculty_id,
+        ("faculty", "/faculty/resources/my"): faculty_id,
+        ("faculty", f"/faculty/resource-post/{post_id}/detail"): faculty_id,
+    }
+    results = {}
+    with app.app_context():
+        for (role, path), user_id in pages.items():
+            label = path.replace(str(post_id), "<id>")
+            results[label] = _count_queries(_client(user_id, role), path)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that knowledge board pages load attachments in one query.")
+    parser.add_argument("--sizes", type=int, nargs=2, default=[5, 60], metavar=("SMALL", "LARGE"), help="Posts per run.")
+    parser.add_argument("--attachments", type=int, default=2, help="Attachments per post.")
+    args = parser.parse_args()
+
+    app.config["TESTING"] = True
+    small, large = args.sizes
+    runs = {size: _measure(size, args.attachments) for size in (small, large)}
+
+    failures = []
+    print(f"{'path':<36} {'posts':>6} {'status':>6} {'queries':>8} {'attachment queries':>19}")
+    for path in runs[small]:
+        for size in (small, large):
+            status, count, attachment_count = runs[size][path]
+            print(f"{path:<36} {size:>6} {status:>6} {count:>8} {attachment_count:>19}")
+            if status != 200:
+                failures.append(f"{path} returned {status} with {size} posts")
+            if attachment_count > 1:
+                failures.append(f"{path} loaded attachments in {attachment_count} queries with {size} posts")
+    if runs[small]["/student/knowledge-board"][1] != runs[large]["/student/knowledge-board"][1]:
+        failures.append("/student/knowledge-board query count grows with the number of posts")
+
+    with app.app_context():
+        _reset_tables()
+
+    print()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print("OK: attachment loading does not depend on the number of posts.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
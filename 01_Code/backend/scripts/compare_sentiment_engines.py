@@ -0,0 +1,170 @@
+"""
+ClarifAI Sentiment Engine Parity Report
+=======================================
+Scores the labeled corpus in data/sentiment_eval_corpus.csv with every engine
+in sentiment.SENTIMENT_ENGINES and reports:
+
+    - polarity and label parity of each engine against the TextBlob engine
+    - accuracy of each engine against the corpus labels
+    - warm per-text latency (mean / p50 / p95) and cold load time
+
+A fuzz pass recombines corpus sentences with punctuation, emoticons and
+negations to exercise tokenizer edge cases that the corpus does not cover.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/compare_sentiment_engines.py
+    py -3.11 scripts/compare_sentiment_engines.py --fuzz 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from sentiment import SENTIMENT_ENGINES, analyze_sentiment_with_confidence, configure_sentiment_engine
+
+
+DEFAULT_CORPUS_PATH = BACKEND_ROOT / "data" / "sentiment_eval_corpus.csv"
+REFERENCE_ENGINE = "textblob"
+FUZZ_DECORATIONS = ["", "", "!", "!!", "...", " :)", " :(", " (!)", "?", ","]
+FUZZ_PREFIXES = ["", "", "Not ", "Never ", "Really ", "Honestly, ", "I don't think ", "\""]
+
+COLD_LOAD_PROBE = """
+import sys, time
+started = time.perf_counter()
+import sentiment
+sentiment.configure_sentiment_engine(sys.argv[1])
+sentiment.analyze_sentiment_with_confidence("The lectures were engaging and helpful.")
+print(f"{(time.perf_counter() - started) * 1000:.1f}")
+"""
+
+
+def load_corpus(path: Path) -> list[tuple[str, str]]:
+    with path.open(encoding="utf-8", newline="") as handle:
+        return [(row["label"].strip().lower(), row["text"]) for row in csv.DictReader(handle)]
+
+
+def _fuzz_texts(corpus: list[tuple[str, str]], count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    sentences = [text for _, text in corpus]
+    texts = []
+    for _ in range(count):
+        parts = []
+        for sentence in rng.sample(sentences, k=rng.randint(1, 3)):
+            parts.append(rng.choice(FUZZ_PREFIXES) + sentence.rstrip(".") + rng.choice(FUZZ_DECORATIONS))
+        texts.append(" ".join(parts))
+    return texts
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _time_engine(engine, texts: list[str], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        for text in texts:
+            started = time.perf_counter()
+            engine.polarity(text)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def _cold_load_ms(engine_name: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", COLD_LOAD_PROBE, engine_name],
+            cwd=BACKEND_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(float(completed.stdout.strip()))
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare sentiment engines for parity, accuracy and latency.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS_PATH)
+    parser.add_argument("--fuzz", type=int, default=5000, help="Number of recombined texts for the parity fuzz pass.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--show", type=int, default=5, help="How many mismatching texts to print per engine.")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    texts = [text for _, text in corpus]
+    fuzz_texts = _fuzz_texts(corpus, max(0, args.fuzz), args.seed)
+    engines = {name: engine_cls() for name, engine_cls in SENTIMENT_ENGINES.items()}
+    reference = engines[REFERENCE_ENGINE]
+
+    print(f"Corpus: {args.corpus} ({len(corpus)} labeled texts), fuzz texts: {len(fuzz_texts)}")
+    print()
+    print(f"{'engine':<10} {'accuracy':>9} {'label parity':>13} {'polarity parity':>16} {'max |diff|':>11}")
+    labels_by_engine = {}
+    exit_code = 0
+    for name, engine in engines.items():
+        configure_sentiment_engine(name)
+        predicted = [analyze_sentiment_with_confidence(text) for text in texts]
+        labels_by_engine[name] = predicted
+        correct = sum(1 for (gold, _), (label, _) in zip(corpus, predicted) if gold == label)
+
+        parity_texts = texts + fuzz_texts
+        diffs = [abs(engine.polarity(text) - reference.polarity(text)) for text in parity_texts]
+        polarity_matches = sum(1 for diff in diffs if diff <= 1e-9)
+        label_matches = sum(
+            1 for own, ref in zip(predicted, labels_by_engine[REFERENCE_ENGINE]) if own == ref
+        )
+        print(
+            f"{name:<10} {correct / len(corpus):>8.1%} "
+            f"{label_matches:>6}/{len(corpus):<6} "
+            f"{polarity_matches:>7}/{len(parity_texts):<8} {max(diffs, default=0.0):>11.2e}"
+        )
+
+        mismatches = [text for text, diff in zip(parity_texts, diffs) if diff > 1e-9]
+        for text in mismatches[: args.show]:
+            print(f"    polarity differs: {text[:90]!r}")
+        if mismatches:
+            exit_code = 1
+    configure_sentiment_engine(REFERENCE_ENGINE)
+
+    print()
+    print("Confusion (rows = corpus label, columns = predicted) per engine:")
+    for name, predicted in labels_by_engine.items():
+        print(f"  {name}")
+        print(f"    {'':<9} {'positive':>9} {'neutral':>9} {'negative':>9}")
+        for gold in ("positive", "neutral", "negative"):
+            row = [
+                sum(1 for (label, _), (own, _) in zip(corpus, predicted) if label == gold and own == column)
+                for column in ("positive", "neutral", "negative")
+            ]
+            print(f"    {gold:<9} {row[0]:>9} {row[1]:>9} {row[2]:>9}")
+
+    print()
+    print(f"{'engine':<10} {'cold load ms':>13} {'mean us':>9} {'p50 us':>9} {'p95 us':>9}")
+    for name, engine in engines.items():
+        engine.polarity("warm up")
+        samples = _time_engine(engine, texts, max(1, args.repeat))
+        print(
+            f"{name:<10} {_cold_load_ms(name, max(1, args.repeat)):>13.1f} "
+            f"{statistics.fmean(samples):>9.1f} {_percentile(samples, 0.50):>9.1f} {_percentile(samples, 0.95):>9.1f}"
+        )
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
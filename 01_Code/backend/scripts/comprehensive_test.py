@@ -23,10 +23,14 @@ if str(BACKEND_ROOT) not in sys.path:
 from app import app
 from models import (
     Checklist,
+    ChecklistGroup,
+    ChecklistTask,
     ExperienceReport,
     ExperienceUpvote,
     Feedback,
     KnowledgePost,
+    KnowledgePostTag,
+    KnowledgePostTarget,
     ModerationLog,
     StudentExperience,
     User,
@@ -76,11 +80,17 @@ def cleanup_test_data(emails: list[str]) -> None:
 
     Feedback.query.filter(Feedback.student_id.in_(ids)).delete(synchronize_session=False)
     Feedback.query.filter(Feedback.faculty_id.in_(ids)).delete(synchronize_session=False)
+    post_ids = db.session.query(KnowledgePost.id).filter(KnowledgePost.author_id.in_(ids))
+    KnowledgePostTarget.query.filter(KnowledgePostTarget.post_id.in_(post_ids)).delete(synchronize_session=False)
+    KnowledgePostTag.query.filter(KnowledgePostTag.post_id.in_(post_ids)).delete(synchronize_session=False)
     KnowledgePost.query.filter(KnowledgePost.author_id.in_(ids)).delete(synchronize_session=False)
     ExperienceUpvote.query.filter(ExperienceUpvote.user_id.in_(ids)).delete(synchronize_session=False)
     StudentExperience.query.filter(StudentExperience.author_id.in_(ids)).delete(synchronize_session=False)
     Checklist.query.filter(Checklist.student_id.in_(ids)).delete(synchronize_session=False)
     Checklist.query.filter(Checklist.faculty_id.in_(ids)).delete(synchronize_session=False)
+    group_ids = db.session.query(ChecklistGroup.id).filter(ChecklistGroup.faculty_id.in_(ids))
+    ChecklistTask.query.filter(ChecklistTask.group_id.in_(group_ids)).delete(synchronize_session=False)
+    ChecklistGroup.query.filter(ChecklistGroup.faculty_id.in_(ids)).delete(synchronize_session=False)
     User.query.filter(User.id.in_(ids)).delete(synchronize_session=False)
     
     db.session.commit()
@@ -0,0 +1,77 @@
+"""
+ClarifAI Attachment Storage Copy
+================================
+Copies every attachment the database still references (blobs, plus
+intervention and checklist files that predate the blob store) from a local
+storage directory into the configured attachment storage, e.g. an
+S3-compatible bucket when moving a single-node install to several nodes.
+
+Keys are kept as they are, so no row changes. Objects already present in the
+target are skipped, which makes an interrupted run safe to start again.
+The local files are left in place; remove them once the new storage serves
+the downloads.
+
+USAGE:
+    cd 01_Code\\backend
+
+    # Count what would be copied into the configured storage
+    set CLARIFAI_ATTACHMENT_STORAGE=s3
+    py -3.11 scripts/copy_attachment_storage.py --dry-run
+
+    # Copy from the default local root (static/uploads)
+    py -3.11 scripts/copy_attachment_storage.py
+
+    # Copy from another directory
+    py -3.11 scripts/copy_attachment_storage.py --source-root D:\\clarifai\\uploads
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app import app
+from attachment_store import copy_stored_object, referenced_storage_keys
+from storage_backends import LocalStorage, attachment_storage
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Copy referenced attachments from a local directory into the configured storage.")
+    parser.add_argument(
+        "--source-root",
+        default=app.config["ATTACHMENT_STORAGE_LOCAL_ROOT"],
+        help="Local storage directory to copy from (default: CLARIFAI_ATTACHMENT_STORAGE_LOCAL_ROOT).",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count the objects that would be copied.")
+    args = parser.parse_args()
+
+    source = LocalStorage(args.source_root)
+    with app.app_context():
+        target = attachment_storage()
+        if isinstance(target, LocalStorage) and target.root.resolve() == source.root.resolve():
+            print("The configured storage is the source directory; set CLARIFAI_ATTACHMENT_STORAGE first.")
+            return 1
+
+        keys = referenced_storage_keys()
+        missing = [key for key in keys if source.stat(key) is None]
+        pending = [key for key in keys if key not in missing and target.stat(key) is None]
+        print(
+            f"{len(keys)} referenced objects: {len(pending)} to copy into {target.name} storage, "
+            f"{len(keys) - len(pending) - len(missing)} already there, {len(missing)} missing from {source.root}."
+        )
+        if args.dry_run:
+            return 0
+
+        for position, key in enumerate(pending, start=1):
+            copy_stored_object(source, key)
+            print(f"[{position}/{len(pending)}] {key}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+"""
+ClarifAI Attachment Blob Migration
+==================================
+Moves intervention and checklist attachments saved before the blob store
+(the interventions/* and checklists/* storage keys) under blobs/, stored once
+per SHA-256 with a reference count, and points
+knowledge_attachments.storage_key / checklist_groups.attachment at them.
+
+Files that turn out to be identical are kept once. Each file is committed on
+its own, so an interrupted run can simply be started again. Rows whose file is
+missing from the attachment storage are left untouched.
+
+Until this has run, old attachments keep working from their old paths.
+
+USAGE:
+    cd 01_Code\\backend
+
+    # Count the attachments that still live outside the blob store
+    py -3.11 scripts/migrate_attachment_blobs.py --dry-run
+
+    # Move them
+    py -3.11 scripts/migrate_attachment_blobs.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app import app
+from attachment_store import legacy_attachment_counts, migrate_legacy_attachments
+from models import StoredBlob
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Move pre-blob attachments into the content-addressed blob store.")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the attachments still to migrate.")
+    args = parser.parse_args()
+
+    with app.app_context():
+        knowledge, checklists = legacy_attachment_counts()
+        print(f"{knowledge} intervention attachments and {checklists} checklist attachments predate the blob store.")
+        if args.dry_run:
+            return 0
+
+        moved_knowledge, moved_checklists = migrate_legacy_attachments()
+        print(f"Moved {moved_knowledge} intervention attachments and {moved_checklists} checklist attachments.")
+        skipped = knowledge + checklists - moved_knowledge - moved_checklists
+        if skipped:
+            print(f"{skipped} attachments were skipped because their file is missing.")
+        print(f"The blob store now holds {StoredBlob.query.count()} files.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+"""
+ClarifAI Request Query Profiler
+===============================
+Counts the SQL statements each page issues for one signed-in user, so changes
+to per-request loading can be compared before and after.
+
+The user is signed in by writing the session directly; no password is needed.
+Pages are requested twice and the second (warm) count is reported, so one-off
+startup work such as sentiment warm-up or schema checks is not included.
+
+USAGE:
+    cd 01_Code\\backend
+    py -3.11 scripts/profile_request_queries.py
+    py -3.11 scripts/profile_request_queries.py --email student@example.com --verbose
+    py -3.11 scripts/profile_request_queries.py --role faculty --paths /faculty/dashboard
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+from sqlalchemy import event
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app import app
+from models import User, db
+
+
+DEFAULT_PATHS = {
+    "student": ["/student/dashboard", "/student/knowledge-board", "/student/reviews"],
+    "faculty": ["/faculty/dashboard"],
+    "admin": ["/admin/dashboard"],
+}
+
+
+def _pick_user(role: str, email: str | None):
+    query = User.query.filter_by(role=role, is_active=True)
+    if email:
+        query = query.filter_by(email=email.strip().lower())
+    return query.order_by(User.id.asc()).first()
+
+
+def _count_queries(client, path: str) -> tuple[int, int, Counter]:
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    tables = Counter()
+    for statement in statements:
+        head = " ".join(statement.split())
+        if " FROM " in head:
+            tables[head.split(" FROM ", 1)[1].split(" ", 1)[0]] += 1
+        else:
+            tables[head.split(" ", 1)[0]] += 1
+    return response.status_code, len(statements), tables
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Count SQL statements per page for one signed-in user.")
+    parser.add_argument("--role", choices=sorted(DEFAULT_PATHS), default="student")
+    parser.add_argument("--email", help="Profile this user instead of the first active user with the role.")
+    parser.add_argument("--paths", nargs="+", help="Pages to request (defaults depend on --role).")
+    parser.add_argument("--verbose", action="store_true", help="Break each count down by table.")
+    args = parser.parse_args()
+
+    app.config["TESTING"] = True
+    with app.app_context():
+        user = _pick_user(args.role, args.email)
+        if not user:
+            print(f"No active {args.role} user found.")
+            return 1
+        user_id = user.id
+        print(f"Profiling as {user.email} ({args.role}, id {user_id})")
+
+    client = app.test_client()
+    with client.session_transaction() as flask_session:
+        flask_session["user_id"] = user_id
+        flask_session["role"] = args.role
+
+    print(f"{'path':<32} {'status':>6} {'queries':>8}")
+    with app.app_context():
+        for path in args.paths or DEFAULT_PATHS[args.role]:
+            _count_queries(client, path)
+            status, count, tables = _count_queries(client, path)
+            print(f"{path:<32} {status:>6} {count:>8}")
+            if args.verbose:
+                for table, table_count in tables.most_common():
+                    print(f"{'':<34}{table:<36} {table_count:>4}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
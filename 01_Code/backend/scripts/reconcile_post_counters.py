@@ -0,0 +1,61 @@
+"""
+ClarifAI Knowledge Post Counter Reconciliation
+==============================================
+Recounts the like, bookmark and open counters stored on every knowledge post
+(knowledge_posts.like_count / bookmark_count / open_count) from the
+knowledge_reactions and knowledge_views rows and repairs any that drifted.
+
+The counters move in the same transaction as each reaction and each flushed
+view, so drift only comes from writes that bypass the app: rows deleted or
+inserted by hand, restored backups, or maintenance scripts.
+
+USAGE:
+    cd 01_Code\\backend
+
+    # List the counters that disagree with the rows, without writing anything
+    py -3.11 scripts/reconcile_post_counters.py --dry-run
+
+    # Repair them
+    py -3.11 scripts/reconcile_post_counters.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app import app
+from knowledge_store import post_counter_drift, reconcile_post_counters
+from models import KnowledgePost
+from view_tracker import flush_knowledge_views
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Repair stored knowledge post reaction and view counters.")
+    parser.add_argument("--dry-run", action="store_true", help="Only list counters that have drifted.")
+    args = parser.parse_args()
+
+    with app.app_context():
+        # Buffered views are not in knowledge_views yet; write them first so
+        # they are not reported as drift.
+        flush_knowledge_views()
+        total = KnowledgePost.query.count()
+        drift = post_counter_drift() if args.dry_run else reconcile_post_counters()
+        for post_id, column, stored, counted in drift:
+            print(f"post {post_id}: {column} {stored} -> {counted}")
+
+        posts = len({post_id for post_id, *_ in drift})
+        if args.dry_run:
+            print(f"{len(drift)} counters on {posts} of {total} posts would be repaired.")
+        else:
+            print(f"Repaired {len(drift)} counters on {posts} of {total} posts.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
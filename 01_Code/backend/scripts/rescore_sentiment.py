@@ -0,0 +1,323 @@
+"""
+ClarifAI Sentiment Rescoring
+============================
+Recomputes stored sentiment after the rules or lexicon in sentiment.py change.
+
+Only rows whose sentiment_version is older than sentiment.SENTIMENT_VERSION
+are visited, so a rule change costs time proportional to the stale rows. Pass
+--all to rescore every row regardless of version.
+
+Rows are streamed in id order, one chunk at a time, scored across a process
+pool with analyze_sentiment_batch, and written back with bulk UPDATEs. Each
+chunk is its own transaction, so the SQLite write lock is held only briefly.
+
+TABLES:
+    feedback          Feedback.sentiment / sentiment_confidence
+    pending_feedback  PendingFacultyFeedback.sentiment / sentiment_confidence
+    experiences       StudentExperience.sentiment / sentiment_confidence
+
+Moderation status is NOT recomputed; only the stored sentiment fields change.
+
+USAGE:
+    cd 01_Code\\backend
+
+    # Preview what would change and write every changed row to a CSV
+    py -3.11 scripts/rescore_sentiment.py --dry-run --report rescore_diff.csv
+
+    # Rescore rows scored by an older SENTIMENT_VERSION with 4 worker processes
+    py -3.11 scripts/rescore_sentiment.py --workers 4
+
+    # Rescore every row, including ones already at the current version
+    py -3.11 scripts/rescore_sentiment.py --all
+
+    # Continue an interrupted run from the last committed chunk
+    py -3.11 scripts/rescore_sentiment.py --resume
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from sentiment import SENTIMENT_VERSION, analyze_sentiment_batch, start_sentiment_warmup, wait_for_sentiment_engine
+
+
+DEFAULT_CHECKPOINT_PATH = BACKEND_DIR / ".rescore_sentiment_checkpoint.json"
+TABLE_ORDER = ["feedback", "pending_feedback", "experiences"]
+
+
+def _table_specs() -> dict:
+    from models import Feedback, PendingFacultyFeedback, StudentExperience
+
+    return {
+        "feedback": {"model": Feedback, "text_column": "feedback_text"},
+        "pending_feedback": {"model": PendingFacultyFeedback, "text_column": "feedback_text"},
+        "experiences": {"model": StudentExperience, "text_column": "body"},
+    }
+
+
+def _load_checkpoint(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _save_checkpoint(path: Path, checkpoint: dict) -> None:
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(checkpoint, indent=2, sort_keys=True), encoding="utf-8")
+    temp_path.replace(path)
+
+
+def _stale_filters(spec: dict, rescore_all: bool) -> list:
+    if rescore_all:
+        return []
+    return [spec["model"].sentiment_version < SENTIMENT_VERSION]
+
+
+def _count_rows(db, spec: dict, filters: list) -> int:
+    from sqlalchemy import func, select
+
+    model = spec["model"]
+    total = db.session.execute(select(func.count(model.id)).where(*filters)).scalar() or 0
+    db.session.rollback()
+    return int(total)
+
+
+def _iter_chunks(db, spec: dict, start_after_id: int, chunk_size: int, filters: list):
+    from sqlalchemy import select
+
+    model = spec["model"]
+    columns = [
+        model.id,
+        getattr(model, spec["text_column"]),
+        model.sentiment,
+        model.sentiment_confidence,
+        model.sentiment_version,
+    ]
+
+    last_id = start_after_id
+    while True:
+        statement = (
+            select(*columns)
+            .where(model.id > last_id, *filters)
+            .order_by(model.id.asc())
+            .limit(chunk_size)
+        )
+        rows = db.session.execute(statement).all()
+        # Release the read transaction so writers are not blocked between chunks.
+        db.session.rollback()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield rows
+
+
+def _scored_rows(rows, scores) -> tuple[list[dict], list[dict]]:
+    # Rows whose result is unchanged still need the current version stamped on them.
+    changes = []
+    restamps = []
+    for row, (label, confidence) in zip(rows, scores):
+        old_label, old_confidence, old_version = row[2], row[3], row[4]
+        if old_label == label and old_confidence == confidence:
+            if old_version != SENTIMENT_VERSION:
+                restamps.append({"id": row[0]})
+            continue
+        changes.append(
+            {
+                "id": row[0],
+                "old_sentiment": old_label,
+                "sentiment": label,
+                "old_sentiment_confidence": old_confidence,
+                "sentiment_confidence": confidence,
+            }
+        )
+    return changes, restamps
+
+
+def _apply_changes(db, spec: dict, changes: list[dict], restamps: list[dict]) -> None:
+    from sqlalchemy import update
+
+    params = [
+        {
+            "id": change["id"],
+            "sentiment": change["sentiment"],
+            "sentiment_confidence": change["sentiment_confidence"],
+            "sentiment_version": SENTIMENT_VERSION,
+        }
+        for change in changes
+    ]
+    if params:
+        db.session.execute(update(spec["model"]), params)
+    if restamps:
+        # Unchanged rows only need the version bump; keep that UPDATE narrow.
+        db.session.execute(
+            update(spec["model"]),
+            [{"id": item["id"], "sentiment_version": SENTIMENT_VERSION} for item in restamps],
+        )
+
+
+def rescore_table(
+    db,
+    table_name: str,
+    spec: dict,
+    *,
+    executor,
+    chunk_size: int,
+    dry_run: bool,
+    checkpoint: dict,
+    checkpoint_path: Path | None,
+    report_writer=None,
+    rescore_all: bool = False,
+    max_in_flight: int = 4,
+) -> dict:
+    start_after_id = int(checkpoint.get(table_name, 0) or 0)
+    filters = _stale_filters(spec, rescore_all)
+    stats = {
+        "table": table_name,
+        "pending": _count_rows(db, spec, filters),
+        "scanned": 0,
+        "changed": 0,
+        "transitions": Counter(),
+        "started_after_id": start_after_id,
+    }
+    started = time.perf_counter()
+    pending = deque()
+
+    def _drain_one():
+        rows, future = pending.popleft()
+        scores = future.result() if future is not None else analyze_sentiment_batch([row[1] for row in rows])
+        changes, restamps = _scored_rows(rows, scores)
+        stats["scanned"] += len(rows)
+        stats["changed"] += len(changes)
+        for change in changes:
+            stats["transitions"][(change["old_sentiment"], change["sentiment"])] += 1
+            if report_writer is not None:
+                report_writer.writerow(
+                    [
+                        table_name,
+                        change["id"],
+                        change["old_sentiment"],
+                        change["sentiment"],
+                        change["old_sentiment_confidence"],
+                        change["sentiment_confidence"],
+                    ]
+                )
+        if dry_run:
+            return
+        _apply_changes(db, spec, changes, restamps)
+        db.session.commit()
+        checkpoint[table_name] = rows[-1][0]
+        if checkpoint_path is not None:
+            _save_checkpoint(checkpoint_path, checkpoint)
+
+    for rows in _iter_chunks(db, spec, start_after_id, chunk_size, filters):
+        texts = [row[1] for row in rows]
+        future = executor.submit(analyze_sentiment_batch, texts) if executor is not None else None
+        pending.append((rows, future))
+        if len(pending) >= max_in_flight:
+            _drain_one()
+
+    while pending:
+        _drain_one()
+
+    stats["elapsed"] = time.perf_counter() - started
+    return stats
+
+
+def _print_summary(results: list[dict], dry_run: bool) -> None:
+    print()
+    print(f"{'table':<18} {'selected':>9} {'scanned':>9} {'changed':>9} {'seconds':>9} {'rows/s':>10}")
+    for item in results:
+        rate = item["scanned"] / item["elapsed"] if item["elapsed"] else 0.0
+        print(f"{item['table']:<18} {item['pending']:>9} {item['scanned']:>9} {item['changed']:>9} {item['elapsed']:>9.2f} {rate:>10.1f}")
+        for (old_label, new_label), count in sorted(item["transitions"].items()):
+            print(f"{'':<18}   {old_label or '-'} -> {new_label}: {count}")
+    if dry_run:
+        print("\nDry run: no rows were written and the checkpoint was not advanced.")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Recompute stored sentiment for feedback and experiences.")
+    parser.add_argument("--tables", nargs="+", choices=TABLE_ORDER, default=TABLE_ORDER)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1))
+    parser.add_argument("--dry-run", action="store_true", help="Score and report differences without writing.")
+    parser.add_argument("--report", type=Path, help="CSV file that receives every changed row.")
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT_PATH)
+    parser.add_argument("--resume", action="store_true", help="Skip rows at or below the last committed id per table.")
+    parser.add_argument("--all", dest="rescore_all", action="store_true", help="Rescore rows already at the current version too.")
+    args = parser.parse_args()
+
+    from app import app
+    from models import db
+
+    chunk_size = max(1, args.chunk_size)
+    checkpoint = _load_checkpoint(args.checkpoint) if args.resume else {}
+    if checkpoint:
+        print(f"Resuming from checkpoint {args.checkpoint}: {checkpoint}")
+
+    report_handle = None
+    report_writer = None
+    if args.report:
+        report_handle = args.report.open("w", encoding="utf-8", newline="")
+        report_writer = csv.writer(report_handle)
+        report_writer.writerow(["table", "id", "old_sentiment", "new_sentiment", "old_confidence", "new_confidence"])
+
+    # Load the engine before forking so every worker inherits a warm analyzer.
+    start_sentiment_warmup()
+    wait_for_sentiment_engine()
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    results = []
+    try:
+        with app.app_context():
+            specs = _table_specs()
+            for table_name in TABLE_ORDER:
+                if table_name not in args.tables:
+                    continue
+                scope = "all rows" if args.rescore_all else f"rows below version {SENTIMENT_VERSION}"
+                print(f"Rescoring {table_name} ({scope}) ...")
+                results.append(
+                    rescore_table(
+                        db,
+                        table_name,
+                        specs[table_name],
+                        executor=executor,
+                        chunk_size=chunk_size,
+                        dry_run=args.dry_run,
+                        checkpoint=checkpoint,
+                        checkpoint_path=None if args.dry_run else args.checkpoint,
+                        report_writer=report_writer,
+                        rescore_all=args.rescore_all,
+                        max_in_flight=max(2, args.workers * 2),
+                    )
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if report_handle is not None:
+            report_handle.close()
+
+    _print_summary(results, args.dry_run)
+    if not args.dry_run and args.checkpoint.exists():
+        args.checkpoint.unlink()
+        print(f"All tables finished; removed checkpoint {args.checkpoint}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
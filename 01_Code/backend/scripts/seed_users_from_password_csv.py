@@ -12,11 +12,15 @@ from app import create_app
 from assignment_sync_service import sync_preset_assignments_to_db
 from models import (
     Checklist,
+    ChecklistGroup,
+    ChecklistTask,
     ExperienceReport,
     ExperienceUpvote,
     FacultyAssignment,
     Feedback,
     KnowledgePost,
+    KnowledgePostTag,
+    KnowledgePostTarget,
     LifecycleEvent,
     ModerationLog,
     PendingFacultyFeedback,
@@ -98,9 +102,13 @@ def _clear_non_admin_data():
     Feedback.query.delete(synchronize_session=False)
     PendingFacultyFeedback.query.delete(synchronize_session=False)
     Checklist.query.delete(synchronize_session=False)
+    ChecklistTask.query.delete(synchronize_session=False)
+    ChecklistGroup.query.delete(synchronize_session=False)
     ExperienceReport.query.delete(synchronize_session=False)
     ExperienceUpvote.query.delete(synchronize_session=False)
     StudentExperience.query.delete(synchronize_session=False)
+    KnowledgePostTarget.query.delete(synchronize_session=False)
+    KnowledgePostTag.query.delete(synchronize_session=False)
     KnowledgePost.query.delete(synchronize_session=False)
     SemesterMismatchRequest.query.delete(synchronize_session=False)
     FacultyAssignment.query.delete(synchronize_session=False)
@@ -1,7 +1,19 @@
+import hashlib
+import importlib.util
+import os
 import re
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict
+from pathlib import Path
 
-from textblob import TextBlob
 
+# Bump whenever the term sets or the rules in _classify change. Stored rows
+# carry the version that scored them, and scripts/rescore_sentiment.py only
+# revisits rows with an older one. Version 0 marks rows scored before this
+# column existed.
+SENTIMENT_VERSION = 1
 
 POSITIVE_TERMS = {
 	"excellent",
@@ -43,24 +55,345 @@ NEGATIVE_MILD_TERMS = {
 }
 
 
-def _token_hits(text: str, terms: set[str]) -> int:
-	lower = text.lower()
-	hits = 0
-	for term in terms:
-		if re.search(rf"\b{re.escape(term)}\b", lower):
-			hits += 1
-	return hits
+def _compile_lexicon_matcher():
+	lexicon = {}
+	for term in POSITIVE_TERMS:
+		lexicon[term] = "positive"
+	for term in NEGATIVE_STRONG_TERMS:
+		lexicon[term] = "negative_strong"
+	for term in NEGATIVE_MILD_TERMS:
+		lexicon[term] = "negative_mild"
 
+	# Longest terms first so "perfectly" wins over "perfect" at the same offset;
+	# the lookahead keeps matches zero-width so overlapping terms are all seen.
+	alternation = "|".join(re.escape(term) for term in sorted(lexicon, key=len, reverse=True))
+	return re.compile(rf"\b(?=({alternation})\b)"), lexicon
+
+
+_LEXICON_PATTERN, _LEXICON_BUCKETS = _compile_lexicon_matcher()
+
+
+class _PolarityEngine:
+	# TextBlob pulls in NLTK at import and loads its pattern lexicon on first use,
+	# so both are deferred until a score is actually needed.
+	name = "textblob"
+
+	def __init__(self):
+		self._scorer = None
+		self._lock = threading.Lock()
+		self._ready = threading.Event()
+		self._warmup_thread = None
+
+	def _build_scorer(self):
+		from textblob.sentiments import PatternAnalyzer
+
+		analyzer = PatternAnalyzer()
+		return lambda text: analyzer.analyze(text).polarity
+
+	def _load(self):
+		with self._lock:
+			if self._scorer is None:
+				scorer = self._build_scorer()
+				scorer("warm up")
+				self._scorer = scorer
+				self._ready.set()
+		return self._scorer
+
+	def polarity(self, text: str) -> float:
+		scorer = self._scorer or self._load()
+		return scorer(text)
+
+	def is_ready(self) -> bool:
+		return self._ready.is_set()
+
+	def start_warmup(self) -> None:
+		with self._lock:
+			if self._ready.is_set() or self._warmup_thread is not None:
+				return
+			self._warmup_thread = threading.Thread(target=self._load, name="sentiment-warmup", daemon=True)
+			self._warmup_thread.start()
+
+	def wait_until_ready(self, timeout: float | None = None) -> bool:
+		return self._ready.wait(timeout)
+
+	def reset_after_fork(self) -> None:
+		# A forked worker can inherit the lock mid-load from the warm-up thread.
+		self._lock = threading.Lock()
+		self._warmup_thread = None
+		if self._scorer is None:
+			self._ready = threading.Event()
+
+
+# --- Compiled lexicon engine -------------------------------------------------
+# A port of TextBlob's PatternAnalyzer that reads the same en-sentiment.xml
+# lexicon into a flat dict once and scores text in one tokenize-and-assess
+# pass, without importing TextBlob or NLTK. The tokenizer deliberately keeps
+# TextBlob's quirks (for example "don't" splits into "do n ' t", so contracted
+# negations are not seen) because parity with stored scores matters more here
+# than linguistic accuracy.
+
+_NEGATIONS = frozenset({"no", "not", "n't", "never"})
+_PUNCTUATION = ".,;:!?()[]{}`''\"@#$^&*+-|=~_"
+_LEADING_PUNCTUATION = tuple(_PUNCTUATION.replace(".", ""))
+_TRAILING_PUNCTUATION = _LEADING_PUNCTUATION + (".",)
+_ABBREVIATIONS = frozenset(
+	{
+		"a.", "adj.", "adv.", "al.", "a.m.", "c.", "cf.", "comp.", "conf.", "def.",
+		"ed.", "e.g.", "esp.", "etc.", "ex.", "f.", "fig.", "gen.", "id.", "i.e.",
+		"int.", "l.", "m.", "Med.", "Mil.", "Mr.", "n.", "n.q.", "orig.", "pl.",
+		"pred.", "pres.", "p.m.", "ref.", "v.", "vs.", "w/",
+	}
+)
+_RE_ABBR_LETTER = re.compile(r"^[A-Za-z]\.$")
+_RE_ABBR_INITIALS = re.compile(r"^([A-Za-z]\.)+$")
+_RE_ABBR_CONSONANTS = re.compile("^[A-Z][" + "|".join("bcdfghjklmnpqrstvwxz") + "]+.$")
+_RE_SARCASM = re.compile(r"\( ?\! ?\)")
+_EMOTICONS = (
+	(1.00, ("<3", "\u2665")),
+	(1.00, (">:D", ":-D", ":D", "=-D", "=D", "X-D", "x-D", "XD", "xD", "8-D")),
+	(0.75, (">:P", ":-P", ":P", ":-p", ":p", ":-b", ":b", ":c)", ":o)", ":^)")),
+	(0.50, (">:)", ":-)", ":)", "=)", "=]", ":]", ":}", ":>", ":3", "8)", "8-)")),
+	(0.25, (">;]", ";-)", ";)", ";-]", ";]", ";D", ";^)", "*-)", "*)")),
+	(0.05, (">:o", ":-O", ":O", ":o", ":-o", "o_O", "o.O", "\u00b0O\u00b0", "\u00b0o\u00b0")),
+	(-0.25, (">:/", ":-/", ":/", ":\\", ">:\\", ":-.", ":-s", ":s", ":S", ":-S", ">.>")),
+	(-0.75, (">:[", ":-(", ":(", "=(", ":-[", ":[", ":{", ":-<", ":c", ":-c", "=/")),
+	(-1.00, (":'(", ":'''(", ";'(")),
+)
+_EMOTICON_POLARITY = {}
+for _polarity, _faces in _EMOTICONS:
+	for _face in _faces:
+		_EMOTICON_POLARITY.setdefault(_face.lower(), _polarity)
+_RE_EMOTICONS = re.compile(
+	r"(%s)($|\s)" % "|".join(r" ?".join(re.escape(char) for char in face) for _, faces in _EMOTICONS for face in faces)
+)
+
+
+def _pattern_lexicon_path() -> Path:
+	# find_spec locates the installed package without executing its __init__,
+	# which is what would import NLTK.
+	spec = importlib.util.find_spec("textblob")
+	if spec is None or not spec.submodule_search_locations:
+		raise RuntimeError("The lexicon sentiment engine needs the textblob package for its en-sentiment.xml data.")
+	return Path(list(spec.submodule_search_locations)[0]) / "en" / "en-sentiment.xml"
+
+
+def _load_polarity_lexicon(path: Path | None = None) -> dict[str, tuple[float, float, bool]]:
+	# {word: (polarity, intensity, is_modifier)}, averaged over senses and then
+	# over part-of-speech tags exactly as pattern's Sentiment.load does.
+	senses: dict[str, dict[str, list[tuple[float, float]]]] = {}
+	for node in ElementTree.parse(path or _pattern_lexicon_path()).getroot().iter("word"):
+		form = node.attrib.get("form")
+		if not form:
+			continue
+		polarity = float(node.attrib.get("polarity", 0.0))
+		intensity = float(node.attrib.get("intensity", 1.0))
+		senses.setdefault(form, {}).setdefault(node.attrib.get("pos"), []).append((polarity, intensity))
+
+	by_pos: dict[str, dict[str, tuple[float, float]]] = {}
+	for form, tags in senses.items():
+		by_pos[form] = {
+			tag: (
+				sum(item[0] for item in values) / len(values),
+				sum(item[1] for item in values) / len(values),
+			)
+			for tag, values in tags.items()
+		}
+
+	table = {}
+	for form, tags in by_pos.items():
+		averaged = list(tags.values())
+		table[form] = (
+			sum(item[0] for item in averaged) / len(averaged),
+			sum(item[1] for item in averaged) / len(averaged),
+			"RB" in tags,
+		)
+
+	# Adjectives also score as their -ly adverbs ("terrible" -> "terribly").
+	for form, tags in by_pos.items():
+		if "JJ" not in tags:
+			continue
+		stem = form
+		if stem.endswith("y"):
+			stem = stem[:-1] + "i"
+		if stem.endswith("le"):
+			stem = stem[:-2]
+		polarity, intensity = tags["JJ"]
+		table[stem + "ly"] = (polarity, intensity, True)
+	return table
+
+
+def _is_abbreviation(token: str) -> bool:
+	return (
+		token in _ABBREVIATIONS
+		or _RE_ABBR_LETTER.match(token) is not None
+		or _RE_ABBR_INITIALS.match(token) is not None
+		or _RE_ABBR_CONSONANTS.match(token) is not None
+	)
+
+
+def _pattern_tokens(text: str) -> list[str]:
+	text = text.replace("n't", " n't")
+	for quote in ("\u201c", "\u201d", "\u2018", "\u2019", "'", '"'):
+		if quote in text:
+			text = text.replace(quote, f" {quote} ")
+
+	tokens = []
+	for chunk in text.split():
+		if not chunk.startswith(_TRAILING_PUNCTUATION) and not chunk.endswith(_TRAILING_PUNCTUATION):
+			tokens.append(chunk)
+			continue
+		while chunk.startswith(_LEADING_PUNCTUATION):
+			tokens.append(chunk[0])
+			chunk = chunk[1:]
+		tail = []
+		while chunk.endswith(_TRAILING_PUNCTUATION):
+			if chunk.endswith(_LEADING_PUNCTUATION):
+				tail.append(chunk[-1])
+				chunk = chunk[:-1]
+			if chunk.endswith("..."):
+				tail.append("...")
+				chunk = chunk[:-3].rstrip(".")
+			if chunk.endswith("."):
+				if _is_abbreviation(chunk):
+					break
+				tail.append(".")
+				chunk = chunk[:-1]
+		if chunk:
+			tokens.append(chunk)
+		tokens.extend(reversed(tail))
+
+	joined = " ".join(tokens)
+	if "!" in joined:
+		joined = _RE_SARCASM.sub("(!)", joined)
+	joined = _RE_EMOTICONS.sub(lambda match: match.group(1).replace(" ", "") + match.group(2), joined)
+	return joined.lower().split()
+
+
+def _lexicon_polarity(text: str, table: dict[str, tuple[float, float, bool]]) -> float:
+	# Each assessment is [polarity, intensity, negated]; see Sentiment.assessments in pattern.
+	assessments = []
+	modifier = None
+	negation = None
+	for word in _pattern_tokens(text):
+		entry = table.get(word)
+		if entry is not None:
+			polarity, intensity, is_modifier = entry
+			if modifier is None:
+				assessments.append([polarity, intensity, False])
+			else:
+				# "really good": the preceding adverb scales this word.
+				last = assessments[-1]
+				last[0] = max(-1.0, min(polarity * last[1], 1.0))
+				last[1] = intensity
+			if negation is not None:
+				last = assessments[-1]
+				last[1] = 1.0 / last[1]
+				last[2] = True
+			modifier = word if is_modifier else None
+			negation = word if word in _NEGATIONS else None
+			continue
+
+		if word in _NEGATIONS:
+			negation = word
+		elif negation and len(word.strip("'")) > 1:
+			negation = None
+		if negation is not None and modifier is not None and modifier.endswith("ly"):
+			# "really not good" folds the negation into the adverb's assessment.
+			assessments[-1][2] = True
+			negation = None
+		elif modifier and len(word) > 2:
+			modifier = None
+		if word == "!" and assessments:
+			assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+		if word == "(!)":
+			assessments.append([0.0, 1.0, False])
+		if not word.isalpha() and len(word) <= 5 and word not in _PUNCTUATION:
+			emoticon = _EMOTICON_POLARITY.get(word)
+			if emoticon is not None:
+				assessments.append([emoticon, 1.0, False])
+
+	if not assessments:
+		return 0.0
+	total = 0.0
+	for polarity, _, negated in assessments:
+		# "not good" is slightly bad and "not bad" slightly good.
+		total += polarity * -0.5 if negated else polarity
+	return total / len(assessments)
+
+
+class _LexiconPolarityEngine(_PolarityEngine):
+	name = "lexicon"
+
+	def _build_scorer(self):
+		table = _load_polarity_lexicon()
+		return lambda text: _lexicon_polarity(text, table)
+
+
+SENTIMENT_ENGINES = {
+	_PolarityEngine.name: _PolarityEngine,
+	_LexiconPolarityEngine.name: _LexiconPolarityEngine,
+}
+
+_engine = _PolarityEngine()
+
+
+def configure_sentiment_engine(name: str) -> None:
+	global _engine
+	engine_cls = SENTIMENT_ENGINES.get((name or "").strip().lower())
+	if engine_cls is None:
+		raise ValueError(f"Unknown sentiment engine {name!r}; expected one of: {', '.join(sorted(SENTIMENT_ENGINES))}.")
+	if type(_engine) is engine_cls:
+		return
+	_engine = engine_cls()
+	# Cached results are keyed by engine, so entries from the previous one are unreachable.
+	_sentiment_cache.clear()
+
+
+def sentiment_engine_name() -> str:
+	return _engine.name
 
-def analyze_sentiment_with_confidence(text: str) -> tuple[str, int]:
-	clean_text = (text or "").strip()
-	if not clean_text:
-		return "neutral", 55
 
-	blob_polarity = TextBlob(clean_text).sentiment.polarity
-	positive_hits = _token_hits(clean_text, POSITIVE_TERMS)
-	negative_strong_hits = _token_hits(clean_text, NEGATIVE_STRONG_TERMS)
-	negative_mild_hits = _token_hits(clean_text, NEGATIVE_MILD_TERMS)
+def start_sentiment_warmup() -> None:
+	_engine.start_warmup()
+
+
+def sentiment_engine_ready() -> bool:
+	return _engine.is_ready()
+
+
+def wait_for_sentiment_engine(timeout: float | None = None) -> bool:
+	return _engine.wait_until_ready(timeout)
+
+
+def _lexicon_fingerprint() -> str:
+	digest = hashlib.sha256()
+	for label, terms in (
+		("positive", POSITIVE_TERMS),
+		("negative_strong", NEGATIVE_STRONG_TERMS),
+		("negative_mild", NEGATIVE_MILD_TERMS),
+	):
+		digest.update(f"{label}:{','.join(sorted(terms))};".encode("utf-8"))
+	return digest.hexdigest()[:16]
+
+
+def _scoring_fingerprint() -> str:
+	return f"{_engine.name}:{_lexicon_fingerprint()}"
+
+
+def _lexicon_hits(text: str) -> tuple[int, int, int]:
+	matched = {match.group(1) for match in _LEXICON_PATTERN.finditer(text.lower())}
+	counts = {"positive": 0, "negative_strong": 0, "negative_mild": 0}
+	for term in matched:
+		counts[_LEXICON_BUCKETS[term]] += 1
+	return counts["positive"], counts["negative_strong"], counts["negative_mild"]
+
+
+def _classify(
+	blob_polarity: float,
+	positive_hits: int,
+	negative_strong_hits: int,
+	negative_mild_hits: int,
+) -> tuple[str, int]:
 	negative_hits = negative_strong_hits + negative_mild_hits
 	keyword_delta = positive_hits - negative_hits
 	blended_score = (blob_polarity * 0.7) + (keyword_delta * 0.1)
@@ -93,6 +426,129 @@ def analyze_sentiment_with_confidence(text: str) -> tuple[str, int]:
 	return "neutral", min(max(confidence, 60), 88)
 
 
+def analyze_sentiment_with_confidence(text: str) -> tuple[str, int]:
+	clean_text = (text or "").strip()
+	if not clean_text:
+		return "neutral", 55
+
+	blob_polarity = _engine.polarity(clean_text)
+	return _classify(blob_polarity, *_lexicon_hits(clean_text))
+
+
+def analyze_sentiment_batch(texts) -> list[tuple[str, int]]:
+	scored: dict[str, tuple[str, int]] = {}
+	results = []
+	for text in texts:
+		clean_text = (text or "").strip()
+		if not clean_text:
+			results.append(("neutral", 55))
+			continue
+		cached = scored.get(clean_text)
+		if cached is None:
+			blob_polarity = _engine.polarity(clean_text)
+			cached = _classify(blob_polarity, *_lexicon_hits(clean_text))
+			scored[clean_text] = cached
+		results.append(cached)
+	return results
+
+
+class _SentimentCache:
+	def __init__(self, max_entries: int = 2048, ttl_seconds: float = 900.0):
+		self.max_entries = max_entries
+		self.ttl_seconds = ttl_seconds
+		self.hits = 0
+		self.misses = 0
+		self._entries: OrderedDict[str, tuple[float, tuple[str, int]]] = OrderedDict()
+		self._lock = threading.Lock()
+		self._fingerprint = _scoring_fingerprint()
+
+	def key_for(self, clean_text: str) -> str:
+		return hashlib.sha256(f"{self._fingerprint}\n{clean_text}".encode("utf-8")).hexdigest()
+
+	def get(self, key: str):
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is not None:
+				stored_at, result = entry
+				if time.monotonic() - stored_at <= self.ttl_seconds:
+					self._entries.move_to_end(key)
+					self.hits += 1
+					return result
+				del self._entries[key]
+			self.misses += 1
+			return None
+
+	def put(self, key: str, result: tuple[str, int]) -> None:
+		if self.max_entries <= 0:
+			return
+		with self._lock:
+			self._entries[key] = (time.monotonic(), result)
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.max_entries:
+				self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self.hits = 0
+			self.misses = 0
+			self._fingerprint = _scoring_fingerprint()
+
+	def stats(self) -> dict:
+		with self._lock:
+			return {
+				"entries": len(self._entries),
+				"max_entries": self.max_entries,
+				"ttl_seconds": self.ttl_seconds,
+				"hits": self.hits,
+				"misses": self.misses,
+			}
+
+
+_sentiment_cache = _SentimentCache()
+
+
+def _reset_after_fork() -> None:
+	_engine.reset_after_fork()
+	_sentiment_cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+	os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def configure_sentiment_cache(max_entries: int, ttl_seconds: float) -> None:
+	_sentiment_cache.max_entries = max(0, int(max_entries))
+	_sentiment_cache.ttl_seconds = max(0.0, float(ttl_seconds))
+	_sentiment_cache.clear()
+
+
+def clear_sentiment_cache() -> None:
+	# Call after editing the term sets at runtime so the matcher and cache keys follow them.
+	global _LEXICON_PATTERN, _LEXICON_BUCKETS
+	_LEXICON_PATTERN, _LEXICON_BUCKETS = _compile_lexicon_matcher()
+	_sentiment_cache.clear()
+
+
+def sentiment_cache_stats() -> dict:
+	return _sentiment_cache.stats()
+
+
+def analyze_sentiment_cached(text: str) -> tuple[str, int]:
+	clean_text = (text or "").strip()
+	if not clean_text:
+		return "neutral", 55
+
+	key = _sentiment_cache.key_for(clean_text)
+	cached = _sentiment_cache.get(key)
+	if cached is not None:
+		return cached
+
+	result = analyze_sentiment_with_confidence(clean_text)
+	_sentiment_cache.put(key, result)
+	return result
+
+
 def analyze_sentiment(text: str) -> str:
 	label, _ = analyze_sentiment_with_confidence(text)
 	return label
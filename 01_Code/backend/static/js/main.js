@@ -388,148 +388,73 @@ document.addEventListener('DOMContentLoaded', () => {
 
     const boardFilterForm = document.querySelector('[data-board-filter-form]');
     if (boardFilterForm) {
-        const boardGrid = document.querySelector('[data-board-grid]');
-        const boardCards = boardGrid ? Array.from(boardGrid.querySelectorAll('.board-entry-card')) : [];
         const searchInput = boardFilterForm.querySelector('input[name="q"]');
         const sortSelect = boardFilterForm.querySelector('select[name="sort"]');
         const dateFromInput = boardFilterForm.querySelector('input[name="date_from"]');
         const dateToInput = boardFilterForm.querySelector('input[name="date_to"]');
-        const emptyState = document.getElementById('boardFilterEmptyState');
-
-        if (boardGrid && boardCards.length) {
-            const normalizeNumber = (value) => {
-                const parsed = Number.parseInt(String(value || ''), 10);
-                return Number.isFinite(parsed) ? parsed : 0;
-            };
-
-            const cardMeta = boardCards.map((card) => ({
-                card,
-                title: (card.getAttribute('data-board-title') || '').toLowerCase(),
-                author: (card.getAttribute('data-board-author') || '').toLowerCase(),
-                createdDate: card.getAttribute('data-board-created-date') || '',
-                timestamp: normalizeNumber(card.getAttribute('data-board-timestamp')),
-                upvotes: normalizeNumber(card.getAttribute('data-board-upvotes')),
-            }));
-
-            const syncBoardQuery = () => {
-                const params = new URLSearchParams(window.location.search);
-                const qValue = (searchInput?.value || '').trim();
-                const sortValue = (sortSelect?.value || 'most_upvoted').trim().toLowerCase();
-                const fromValue = (dateFromInput?.value || '').trim();
-                const toValue = (dateToInput?.value || '').trim();
-
-                if (qValue) {
-                    params.set('q', qValue);
-                } else {
-                    params.delete('q');
-                }
-
-                if (sortValue && sortValue !== 'most_upvoted') {
-                    params.set('sort', sortValue);
-                } else {
-                    params.delete('sort');
-                }
-
-                if (fromValue) {
-                    params.set('date_from', fromValue);
-                } else {
-                    params.delete('date_from');
-                }
-
-                if (toValue) {
-                    params.set('date_to', toValue);
-                } else {
-                    params.delete('date_to');
-                }
-
-                params.delete('tag');
-
-                const nextQuery = params.toString();
-                const nextUrl = `${window.location.pathname}${nextQuery ? `?${nextQuery}` : ''}`;
-                window.history.replaceState(null, '', nextUrl);
-            };
-
-            const applyBoardFilters = () => {
-                const searchTokens = (searchInput?.value || '')
-                    .toLowerCase()
-                    .trim()
-                    .split(/\s+/)
-                    .filter(Boolean);
-
-                const fromValue = (dateFromInput?.value || '').trim();
-                let toValue = (dateToInput?.value || '').trim();
-                if (fromValue && toValue && fromValue > toValue) {
-                    toValue = fromValue;
-                    if (dateToInput) {
-                        dateToInput.value = toValue;
-                    }
-                }
-
-                const selectedSort = (sortSelect?.value || 'most_upvoted').toLowerCase();
-                const visibleCards = [];
-
-                cardMeta.forEach((meta) => {
-                    const haystack = `${meta.title} ${meta.author}`;
-                    const matchesSearch = !searchTokens.length || searchTokens.every((token) => haystack.includes(token));
-                    const matchesFrom = !fromValue || (meta.createdDate && meta.createdDate >= fromValue);
-                    const matchesTo = !toValue || (meta.createdDate && meta.createdDate <= toValue);
-                    const visible = matchesSearch && matchesFrom && matchesTo;
-                    meta.card.hidden = !visible;
-                    if (visible) {
-                        visibleCards.push(meta);
-                    }
-                });
-
-                visibleCards.sort((left, right) => {
-                    if (selectedSort === 'oldest') {
-                        return (left.timestamp - right.timestamp) || (right.upvotes - left.upvotes);
-                    }
-                    if (selectedSort === 'recent') {
-                        return (right.timestamp - left.timestamp) || (right.upvotes - left.upvotes);
-                    }
-                    return (right.upvotes - left.upvotes) || (right.timestamp - left.timestamp);
-                });
+        // Search, sort and dates run on the server and the board is paged, so
+        // every change reloads the first page with the new filters.
+        const appliedSearch = (boardFilterForm.getAttribute('data-board-search') || '').trim();
+        const defaultSort = boardFilterForm.getAttribute('data-board-default-sort') || 'most_upvoted';
+
+        if (searchInput && appliedSearch) {
+            const end = searchInput.value.length;
+            searchInput.setSelectionRange(end, end);
+        }
 
-                visibleCards.forEach((item) => {
-                    boardGrid.appendChild(item.card);
-                });
+        const applyBoardFilters = () => {
+            const fromValue = (dateFromInput?.value || '').trim();
+            const toValue = (dateToInput?.value || '').trim();
+            if (fromValue && toValue && fromValue > toValue && dateToInput) {
+                dateToInput.value = fromValue;
+            }
 
-                if (emptyState) {
-                    emptyState.hidden = visibleCards.length > 0;
+            const params = new URLSearchParams();
+            new FormData(boardFilterForm).forEach((value, key) => {
+                const clean = String(value || '').trim();
+                if (clean) {
+                    params.set(key, clean);
                 }
+            });
+            const qValue = params.get('q') || '';
+            if (qValue !== appliedSearch) {
+                // A new search starts on its own default order.
+                params.delete('sort');
+            } else if (params.get('sort') === defaultSort) {
+                params.delete('sort');
+            }
 
-                syncBoardQuery();
-            };
+            const nextQuery = params.toString();
+            window.location.assign(`${boardFilterForm.getAttribute('action') || window.location.pathname}${nextQuery ? `?${nextQuery}` : ''}`);
+        };
 
-            let searchDebounce = null;
-            const onSearchInput = () => {
+        let searchDebounce = null;
+        if (searchInput) {
+            searchInput.addEventListener('input', () => {
                 if (searchDebounce) {
                     window.clearTimeout(searchDebounce);
                 }
                 searchDebounce = window.setTimeout(() => {
-                    applyBoardFilters();
-                }, 120);
-            };
-
-            boardFilterForm.addEventListener('submit', (event) => {
-                event.preventDefault();
-                applyBoardFilters();
+                    if ((searchInput.value || '').trim() !== appliedSearch) {
+                        applyBoardFilters();
+                    }
+                }, 400);
             });
+        }
 
-            if (searchInput) {
-                searchInput.addEventListener('input', onSearchInput);
-            }
-            if (sortSelect) {
-                sortSelect.addEventListener('change', applyBoardFilters);
-            }
-            if (dateFromInput) {
-                dateFromInput.addEventListener('change', applyBoardFilters);
-            }
-            if (dateToInput) {
-                dateToInput.addEventListener('change', applyBoardFilters);
-            }
-
+        boardFilterForm.addEventListener('submit', (event) => {
+            event.preventDefault();
             applyBoardFilters();
+        });
+
+        if (sortSelect) {
+            sortSelect.addEventListener('change', applyBoardFilters);
+        }
+        if (dateFromInput) {
+            dateFromInput.addEventListener('change', applyBoardFilters);
+        }
+        if (dateToInput) {
+            dateToInput.addEventListener('change', applyBoardFilters);
         }
     }
 
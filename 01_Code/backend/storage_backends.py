@@ -0,0 +1,259 @@
+import hashlib
+import hmac
+import http.client
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path, PurePosixPath
+from typing import NamedTuple
+from urllib.parse import quote, urlsplit
+
+
+STORAGE_CHUNK_BYTES = 64 * 1024
+EMPTY_PAYLOAD_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+class StorageError(RuntimeError):
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        # The HTTP status the storage service answered with, if any.
+        self.status = status
+
+
+class StoredObject(NamedTuple):
+    size: int
+    etag: str
+    last_modified: datetime
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(STORAGE_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _key_parts(key: str) -> tuple[str, ...]:
+    parts = PurePosixPath(key or "").parts
+    if not parts or parts[0] == "/" or ".." in parts:
+        raise ValueError(f"Invalid storage key {key!r}.")
+    return parts
+
+
+class LocalStorage:
+    # Keys are paths under one directory. Several app nodes can share it
+    # over a network mount.
+    name = "local"
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root.joinpath(*_key_parts(key))
+
+    def incoming_dir(self) -> Path:
+        # Inside the root, so put_file is a rename on the same filesystem.
+        return self.root / "incoming"
+
+    def put_file(self, key: str, source: Path, sha256: str | None = None) -> None:
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(source), target)
+
+    def stat(self, key: str) -> StoredObject | None:
+        try:
+            info = self._path(key).stat()
+        except FileNotFoundError:
+            return None
+        return StoredObject(
+            size=info.st_size,
+            etag=f"{info.st_mtime_ns:x}-{info.st_size:x}",
+            last_modified=datetime.fromtimestamp(int(info.st_mtime), timezone.utc),
+        )
+
+    def read(self, key: str, start: int = 0, end: int | None = None):
+        # Yields the bytes in [start, end) in chunks.
+        with open(self._path(key), "rb") as handle:
+            handle.seek(start)
+            remaining = None if end is None else end - start
+            while remaining is None or remaining > 0:
+                chunk = handle.read(STORAGE_CHUNK_BYTES if remaining is None else min(STORAGE_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class S3Storage:
+    # Path-style requests signed with AWS Signature V4, so it works against
+    # AWS S3 and self-hosted S3-compatible servers (MinIO and the like)
+    # without an SDK.
+    name = "s3"
+
+    def __init__(self, endpoint_url: str, bucket: str, access_key: str, secret_key: str, region: str = "us-east-1", prefix: str = "", timeout: float = 30.0):
+        if not (endpoint_url and bucket and access_key and secret_key):
+            raise ValueError(
+                "The s3 attachment storage needs CLARIFAI_S3_ENDPOINT_URL, CLARIFAI_S3_BUCKET, "
+                "CLARIFAI_S3_ACCESS_KEY and CLARIFAI_S3_SECRET_KEY."
+            )
+        endpoint = urlsplit(endpoint_url)
+        if endpoint.scheme not in {"http", "https"} or not endpoint.netloc:
+            raise ValueError(f"Invalid S3 endpoint URL {endpoint_url!r}.")
+        self.secure = endpoint.scheme == "https"
+        self.host = endpoint.netloc
+        self.base_path = endpoint.path.rstrip("/")
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region or "us-east-1"
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.timeout = timeout
+
+    def incoming_dir(self) -> Path:
+        return Path(tempfile.gettempdir()) / "clarifai_incoming"
+
+    def _object_path(self, key: str) -> str:
+        object_key = self.prefix + "/".join(_key_parts(key))
+        return quote(f"{self.base_path}/{self.bucket}/{object_key}", safe="/-_.~")
+
+    def _sign(self, method: str, path: str, headers: dict, payload_hash: str) -> dict:
+        now = datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = now.strftime("%Y%m%d")
+        signed = {name.lower(): str(value).strip() for name, value in headers.items()}
+        signed.update({"host": self.host, "x-amz-date": amz_date, "x-amz-content-sha256": payload_hash})
+        names = sorted(signed)
+        canonical_request = "\n".join(
+            [
+                method,
+                path,
+                "",
+                "".join(f"{name}:{signed[name]}\n" for name in names),
+                ";".join(names),
+                payload_hash,
+            ]
+        )
+        scope = f"{date_stamp}/{self.region}/s3/aws4_request"
+        string_to_sign = "\n".join(
+            ["AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()]
+        )
+        signing_key = f"AWS4{self.secret_key}".encode()
+        for part in (date_stamp, self.region, "s3", "aws4_request"):
+            signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+        signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+        signed["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+            f"SignedHeaders={';'.join(names)}, Signature={signature}"
+        )
+        return signed
+
+    def _request(self, method: str, key: str, headers: dict | None = None, body=None, payload_hash: str = EMPTY_PAYLOAD_SHA256):
+        path = self._object_path(key)
+        connection_cls = http.client.HTTPSConnection if self.secure else http.client.HTTPConnection
+        connection = connection_cls(self.host, timeout=self.timeout)
+        try:
+            connection.request(method, path, body=body, headers=self._sign(method, path, headers or {}, payload_hash))
+            return connection, connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+
+    def _expect(self, connection, response, method: str, key: str, *statuses: int) -> None:
+        if response.status in statuses:
+            return
+        detail = response.read(500).decode("utf-8", "replace")
+        connection.close()
+        raise StorageError(f"S3 {method} {key!r} failed with HTTP {response.status}: {detail}", response.status)
+
+    def put_file(self, key: str, source: Path, sha256: str | None = None) -> None:
+        source = Path(source)
+        size = source.stat().st_size
+        with open(source, "rb") as handle:
+            connection, response = self._request(
+                "PUT",
+                key,
+                {"Content-Length": str(size), "Content-Type": "application/octet-stream"},
+                body=handle,
+                payload_hash=sha256 or _file_sha256(source),
+            )
+        self._expect(connection, response, "PUT", key, 200)
+        connection.close()
+        source.unlink(missing_ok=True)
+
+    def stat(self, key: str) -> StoredObject | None:
+        connection, response = self._request("HEAD", key)
+        try:
+            if response.status == 404:
+                return None
+            self._expect(connection, response, "HEAD", key, 200)
+            last_modified = response.getheader("Last-Modified")
+            return StoredObject(
+                size=int(response.getheader("Content-Length") or 0),
+                etag=(response.getheader("ETag") or "").strip('"'),
+                last_modified=parsedate_to_datetime(last_modified) if last_modified else datetime.now(timezone.utc),
+            )
+        finally:
+            connection.close()
+
+    def read(self, key: str, start: int = 0, end: int | None = None):
+        # A ranged GET, so a resumed download only fetches what it needs.
+        headers = {}
+        if start or end is not None:
+            headers["Range"] = f"bytes={start}-{'' if end is None else end - 1}"
+        connection, response = self._request("GET", key, headers)
+        try:
+            self._expect(connection, response, "GET", key, 200, 206)
+            while True:
+                chunk = response.read(STORAGE_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            connection.close()
+
+    def delete(self, key: str) -> None:
+        connection, response = self._request("DELETE", key)
+        try:
+            self._expect(connection, response, "DELETE", key, 200, 204, 404)
+        finally:
+            connection.close()
+
+
+ATTACHMENT_STORAGES = {
+    LocalStorage.name: LocalStorage,
+    S3Storage.name: S3Storage,
+}
+
+
+_storage: LocalStorage | S3Storage | None = None
+
+
+def configure_attachment_storage(config) -> None:
+    global _storage
+    name = str(config.get("ATTACHMENT_STORAGE") or LocalStorage.name).strip().lower()
+    storage_cls = ATTACHMENT_STORAGES.get(name)
+    if storage_cls is None:
+        raise ValueError(f"Unknown attachment storage {name!r}; expected one of: {', '.join(sorted(ATTACHMENT_STORAGES))}.")
+    if storage_cls is S3Storage:
+        _storage = S3Storage(
+            config.get("S3_ENDPOINT_URL", ""),
+            config.get("S3_BUCKET", ""),
+            config.get("S3_ACCESS_KEY", ""),
+            config.get("S3_SECRET_KEY", ""),
+            region=config.get("S3_REGION", "us-east-1"),
+            prefix=config.get("S3_PREFIX", ""),
+        )
+    else:
+        _storage = LocalStorage(config.get("ATTACHMENT_STORAGE_LOCAL_ROOT"))
+
+
+def attachment_storage() -> LocalStorage | S3Storage:
+    if _storage is None:
+        raise RuntimeError("Attachment storage is not configured; create_app() configures it.")
+    return _storage
@@ -0,0 +1,172 @@
+import atexit
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from knowledge_store import bump_post_counter
+from models import KnowledgePost, KnowledgeView, User, db
+
+
+class _KnowledgeViewBuffer:
+    # Board reads only touch this dict; a background thread turns it into
+    # batched upserts, so a GET never waits on SQLite's write lock.
+    def __init__(self):
+        self.enabled = False
+        self.flush_seconds = 2.0
+        self.max_pending = 10000
+        self.batch_size = 500
+        self.dropped = 0
+        self.flushed = 0
+        self._app = None
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def configure(self, app, *, enabled: bool, flush_seconds: float, max_pending: int, batch_size: int) -> None:
+        self._app = app
+        self.enabled = enabled
+        self.flush_seconds = max(float(flush_seconds), 0.1)
+        self.max_pending = max(int(max_pending), 1)
+        self.batch_size = max(int(batch_size), 1)
+
+    def record(self, user_id: int, post_ids, opened_at: datetime | None = None) -> None:
+        opened_at = opened_at or datetime.utcnow()
+        if not self.enabled:
+            self._write({(post_id, user_id): [opened_at, opened_at] for post_id in post_ids})
+            return
+
+        with self._lock:
+            for post_id in post_ids:
+                key = (post_id, user_id)
+                entry = self._pending.get(key)
+                if entry is not None:
+                    entry[1] = max(entry[1], opened_at)
+                elif len(self._pending) < self.max_pending:
+                    self._pending[key] = [opened_at, opened_at]
+                else:
+                    self.dropped += 1
+            backlog = len(self._pending)
+            self._ensure_thread()
+        if backlog >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            with self._app.app_context():
+                written = self._write(pending)
+            self.flushed += written
+            return written
+
+    def _write(self, pending: dict) -> int:
+        post_ids = {post_id for post_id, _ in pending}
+        user_ids = {user_id for _, user_id in pending}
+        # Posts or users deleted since the view was buffered would fail the FK check.
+        live_posts = {row[0] for row in db.session.query(KnowledgePost.id).filter(KnowledgePost.id.in_(post_ids))}
+        live_users = {row[0] for row in db.session.query(User.id).filter(User.id.in_(user_ids))}
+        rows = [
+            {"post_id": post_id, "user_id": user_id, "first_opened_at": first, "last_opened_at": last}
+            for (post_id, user_id), (first, last) in sorted(pending.items())
+            if post_id in live_posts and user_id in live_users
+        ]
+        table = KnowledgeView.__table__
+        # First opens come back from RETURNING and bump the post's open_count
+        # in the same transaction; repeat opens only move last_opened_at.
+        first_opens = sqlite_insert(table).on_conflict_do_nothing().returning(table.c.post_id, table.c.user_id)
+        repeat_opens = sqlite_insert(table)
+        repeat_opens = repeat_opens.on_conflict_do_update(
+            index_elements=[table.c.post_id, table.c.user_id],
+            set_={"last_opened_at": func.max(table.c.last_opened_at, repeat_opens.excluded.last_opened_at)},
+        )
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start : start + self.batch_size]
+            inserted = {tuple(row) for row in db.session.execute(first_opens, batch)}
+            repeats = [row for row in batch if (row["post_id"], row["user_id"]) not in inserted]
+            if repeats:
+                db.session.execute(repeat_opens, repeats)
+            bump_post_counter("open_count", Counter(post_id for post_id, _ in inserted))
+            db.session.commit()
+        return len(rows)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None and not self._stopping:
+            self._thread = threading.Thread(target=self._run, name="knowledge-view-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                self._app.logger.exception("Knowledge view flush failed; dropping the batch.")
+                time.sleep(self.flush_seconds)
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=max(self.flush_seconds * 2, 5.0))
+        if self._app is not None:
+            self.flush()
+
+    def reset_after_fork(self) -> None:
+        # The parent still owns whatever it had buffered; the child starts
+        # empty and spawns its own flusher on first use.
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending = {}
+        self._thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "pending": len(self._pending),
+                "max_pending": self.max_pending,
+                "flushed": self.flushed,
+                "dropped": self.dropped,
+            }
+
+
+_view_buffer = _KnowledgeViewBuffer()
+atexit.register(_view_buffer.stop)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_view_buffer.reset_after_fork)
+
+
+def configure_view_tracker(app, *, enabled: bool, flush_seconds: float, max_pending: int, batch_size: int = 500) -> None:
+    _view_buffer.configure(
+        app,
+        enabled=enabled,
+        flush_seconds=flush_seconds,
+        max_pending=max_pending,
+        batch_size=batch_size,
+    )
+
+
+def record_knowledge_views(user_id: int, post_ids, opened_at: datetime | None = None) -> None:
+    _view_buffer.record(user_id, post_ids, opened_at)
+
+
+def flush_knowledge_views() -> int:
+    return _view_buffer.flush()
+
+
+def view_tracker_stats() -> dict:
+    return _view_buffer.stats()